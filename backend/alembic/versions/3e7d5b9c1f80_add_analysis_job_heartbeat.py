@@ -0,0 +1,27 @@
+"""Add analysis job heartbeat
+
+Revision ID: 3e7d5b9c1f80
+Revises: 9a4c1e7b3d52
+Create Date: 2025-10-16 10:12:44.503127
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e7d5b9c1f80'
+down_revision = '9a4c1e7b3d52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing unfinished jobs keep a NULL heartbeat, so the first worker to start up resumes them
+    op.add_column('analysis_jobs', sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('ix_analysis_jobs_heartbeat_at', 'analysis_jobs', ['heartbeat_at'], unique=False, postgresql_where=sa.text("status IN ('PENDING', 'RUNNING')"))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_analysis_jobs_heartbeat_at', table_name='analysis_jobs')
+    op.drop_column('analysis_jobs', 'heartbeat_at')
@@ -0,0 +1,37 @@
+"""Add AI rate limit buckets
+
+Revision ID: 5d2e8b7f1a94
+Revises: c6f0a3d85e17
+Create Date: 2025-10-13 10:12:41.508317
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2e8b7f1a94'
+down_revision = 'c6f0a3d85e17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('ai_rate_limit_buckets',
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('subject', sa.String(length=255), nullable=False),
+    sa.Column('requests', sa.Float(), nullable=False),
+    sa.Column('tokens', sa.Float(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('tenant_id', 'subject', name='uq_ai_rate_limit_buckets_subject')
+    )
+    op.create_index(op.f('ix_ai_rate_limit_buckets_id'), 'ai_rate_limit_buckets', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_ai_rate_limit_buckets_id'), table_name='ai_rate_limit_buckets')
+    op.drop_table('ai_rate_limit_buckets')
@@ -0,0 +1,24 @@
+"""Add proposal file sha256
+
+Revision ID: 9a4c1e7b3d52
+Revises: 5d2e8b7f1a94
+Create Date: 2025-10-14 09:31:07.214896
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a4c1e7b3d52'
+down_revision = '5d2e8b7f1a94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('proposal_files', sa.Column('sha256', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('proposal_files', 'sha256')
@@ -0,0 +1,44 @@
+"""Add AI analysis cache
+
+Revision ID: 9b2e41c7d5a3
+Revises: 4cc7f9fbffea
+Create Date: 2025-10-02 10:14:08.331907
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b2e41c7d5a3'
+down_revision = '4cc7f9fbffea'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('ai_analysis_cache',
+    sa.Column('cache_key', sa.String(length=64), nullable=False),
+    sa.Column('prompt_version', sa.String(length=50), nullable=False),
+    sa.Column('model', sa.String(length=100), nullable=False),
+    sa.Column('result', sa.JSON(), nullable=False),
+    sa.Column('hit_count', sa.Integer(), nullable=False),
+    sa.Column('last_accessed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_ai_analysis_cache_cache_key'), 'ai_analysis_cache', ['cache_key'], unique=True)
+    op.create_index(op.f('ix_ai_analysis_cache_expires_at'), 'ai_analysis_cache', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_ai_analysis_cache_id'), 'ai_analysis_cache', ['id'], unique=False)
+    op.create_index(op.f('ix_ai_analysis_cache_last_accessed_at'), 'ai_analysis_cache', ['last_accessed_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_ai_analysis_cache_last_accessed_at'), table_name='ai_analysis_cache')
+    op.drop_index(op.f('ix_ai_analysis_cache_id'), table_name='ai_analysis_cache')
+    op.drop_index(op.f('ix_ai_analysis_cache_expires_at'), table_name='ai_analysis_cache')
+    op.drop_index(op.f('ix_ai_analysis_cache_cache_key'), table_name='ai_analysis_cache')
+    op.drop_table('ai_analysis_cache')
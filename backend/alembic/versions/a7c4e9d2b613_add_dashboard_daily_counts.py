@@ -0,0 +1,130 @@
+"""Add trigger-maintained dashboard daily counts
+
+Revision ID: a7c4e9d2b613
+Revises: f3b9d2a71c58
+Create Date: 2025-10-08 14:05:37.412905
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c4e9d2b613'
+down_revision = 'f3b9d2a71c58'
+branch_labels = None
+depends_on = None
+
+
+# table -> (entity name, status column or None); entity names match queries/dashboard_queries.py
+COUNTED_TABLES = {
+    'opportunities': ('opportunity', 'status'),
+    'proposals': ('proposal', 'status'),
+    'campaigns': ('campaign', None),
+    'linkedin_posts': ('linkedin_post', None),
+}
+
+UPSERT = """
+    INSERT INTO dashboard_daily_counts (tenant_id, entity, day, status, count)
+    {select}
+    ON CONFLICT (tenant_id, entity, day, status)
+    DO UPDATE SET count = dashboard_daily_counts.count + EXCLUDED.count, updated_at = now()
+"""
+
+
+def _status(status, row=''):
+    return f'{row}{status}::text' if status else "''"
+
+
+def _day(row=''):
+    return f"({row}created_at AT TIME ZONE 'UTC')::date"
+
+
+def _aggregate(entity, status, source, sign, where='TRUE'):
+    """Select one signed count per tenant, day and status from a set of rows."""
+    return UPSERT.format(select=f"""
+        SELECT tenant_id, '{entity}', {_day()}, {_status(status)}, {sign}count(*)
+        FROM {source}
+        WHERE {where}
+        GROUP BY 1, 3, 4
+    """)
+
+
+def upgrade() -> None:
+    op.create_table('dashboard_daily_counts',
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('entity', sa.String(length=32), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=32), server_default='', nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('tenant_id', 'entity', 'day', 'status', name='uq_dashboard_daily_counts_key')
+    )
+    op.create_index(op.f('ix_dashboard_daily_counts_id'), 'dashboard_daily_counts', ['id'], unique=False)
+
+    for table, (entity, status) in COUNTED_TABLES.items():
+        # Statement-level triggers see every row of a bulk insert or delete at once,
+        # so an import adds one upsert per day and status rather than one per row
+        op.execute(f"""
+            CREATE FUNCTION {table}_daily_counts_insert() RETURNS trigger AS $$
+            BEGIN
+                {_aggregate(entity, status, 'new_rows', '')};
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_daily_counts_insert_trigger
+            AFTER INSERT ON {table} REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {table}_daily_counts_insert()
+        """)
+        # Rows removed by a tenant delete cascade have no tenant left to count against
+        op.execute(f"""
+            CREATE FUNCTION {table}_daily_counts_delete() RETURNS trigger AS $$
+            BEGIN
+                {_aggregate(entity, status, 'old_rows', '-', 'tenant_id IN (SELECT id FROM tenants)')};
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_daily_counts_delete_trigger
+            AFTER DELETE ON {table} REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {table}_daily_counts_delete()
+        """)
+
+        if status:
+            # Transition tables cannot be combined with a column list, so status moves are
+            # counted per row and only when the status actually changed
+            op.execute(f"""
+                CREATE FUNCTION {table}_daily_counts_update() RETURNS trigger AS $$
+                BEGIN
+                    {UPSERT.format(select=f"VALUES (OLD.tenant_id, '{entity}', {_day('OLD.')}, {_status(status, 'OLD.')}, -1)")};
+                    {UPSERT.format(select=f"VALUES (NEW.tenant_id, '{entity}', {_day('NEW.')}, {_status(status, 'NEW.')}, 1)")};
+                    RETURN NULL;
+                END
+                $$ LANGUAGE plpgsql
+            """)
+            op.execute(f"""
+                CREATE TRIGGER {table}_daily_counts_update_trigger
+                AFTER UPDATE OF {status} ON {table}
+                FOR EACH ROW WHEN (OLD.{status} IS DISTINCT FROM NEW.{status})
+                EXECUTE FUNCTION {table}_daily_counts_update()
+            """)
+
+        op.execute(_aggregate(entity, status, table, ''))
+
+
+def downgrade() -> None:
+    for table, (_, status) in COUNTED_TABLES.items():
+        operations = ['insert', 'delete', 'update'] if status else ['insert', 'delete']
+        for operation in operations:
+            op.execute(f'DROP TRIGGER {table}_daily_counts_{operation}_trigger ON {table}')
+            op.execute(f'DROP FUNCTION {table}_daily_counts_{operation}()')
+
+    op.drop_index(op.f('ix_dashboard_daily_counts_id'), table_name='dashboard_daily_counts')
+    op.drop_table('dashboard_daily_counts')
@@ -0,0 +1,29 @@
+"""Add campaign notes index for the activity feed
+
+Revision ID: b2d8f61e4a90
+Revises: a7c4e9d2b613
+Create Date: 2025-10-09 11:22:48.903517
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2d8f61e4a90'
+down_revision = 'a7c4e9d2b613'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_campaign_notes_tenant_id_created_at', 'campaign_notes', ['tenant_id', sa.text('created_at DESC')],
+            unique=False, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_campaign_notes_tenant_id_created_at', table_name='campaign_notes', postgresql_concurrently=True)
@@ -0,0 +1,52 @@
+"""Add automatic analysis queue
+
+Revision ID: c6f0a3d85e17
+Revises: b2d8f61e4a90
+Create Date: 2025-10-10 15:47:02.336184
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6f0a3d85e17'
+down_revision = 'b2d8f61e4a90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('analysis_queue',
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'SUCCEEDED', 'DEAD', name='analysisqueuestatus'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('available_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('result', sa.JSON(), nullable=True),
+    sa.Column('opportunity_id', sa.Integer(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['opportunity_id'], ['opportunities.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['post_id'], ['linkedin_posts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('post_id')
+    )
+    op.create_index(op.f('ix_analysis_queue_id'), 'analysis_queue', ['id'], unique=False)
+    op.create_index('ix_analysis_queue_tenant_id_status', 'analysis_queue', ['tenant_id', 'status'], unique=False)
+    op.create_index('ix_analysis_queue_available_at', 'analysis_queue', ['available_at'], unique=False, postgresql_where=sa.text("status = 'PENDING'"))
+    op.create_index('ix_analysis_queue_locked_at', 'analysis_queue', ['locked_at'], unique=False, postgresql_where=sa.text("status = 'RUNNING'"))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_analysis_queue_locked_at', table_name='analysis_queue')
+    op.drop_index('ix_analysis_queue_available_at', table_name='analysis_queue')
+    op.drop_index('ix_analysis_queue_tenant_id_status', table_name='analysis_queue')
+    op.drop_index(op.f('ix_analysis_queue_id'), table_name='analysis_queue')
+    op.drop_table('analysis_queue')
+    sa.Enum(name='analysisqueuestatus').drop(op.get_bind(), checkfirst=True)
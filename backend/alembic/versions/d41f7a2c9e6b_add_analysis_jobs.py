@@ -0,0 +1,70 @@
+"""Add bulk analysis jobs
+
+Revision ID: d41f7a2c9e6b
+Revises: 9b2e41c7d5a3
+Create Date: 2025-10-03 16:42:51.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41f7a2c9e6b'
+down_revision = '9b2e41c7d5a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('analysis_jobs',
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'COMPLETED', 'FAILED', name='analysisjobstatus'), nullable=False),
+    sa.Column('total_items', sa.Integer(), nullable=False),
+    sa.Column('completed_items', sa.Integer(), nullable=False),
+    sa.Column('failed_items', sa.Integer(), nullable=False),
+    sa.Column('concurrency', sa.Integer(), nullable=False),
+    sa.Column('enable_cache', sa.Boolean(), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_analysis_jobs_id'), 'analysis_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_analysis_jobs_tenant_id'), 'analysis_jobs', ['tenant_id'], unique=False)
+    op.create_table('analysis_job_items',
+    sa.Column('tenant_id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'SUCCEEDED', 'FAILED', name='analysisjobitemstatus'), nullable=False),
+    sa.Column('result', sa.JSON(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['analysis_jobs.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['post_id'], ['linkedin_posts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_analysis_job_items_job_id_status', 'analysis_job_items', ['job_id', 'status'], unique=False)
+    op.create_index(op.f('ix_analysis_job_items_id'), 'analysis_job_items', ['id'], unique=False)
+    op.create_index(op.f('ix_analysis_job_items_post_id'), 'analysis_job_items', ['post_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_analysis_job_items_post_id'), table_name='analysis_job_items')
+    op.drop_index(op.f('ix_analysis_job_items_id'), table_name='analysis_job_items')
+    op.drop_index('ix_analysis_job_items_job_id_status', table_name='analysis_job_items')
+    op.drop_table('analysis_job_items')
+    sa.Enum(name='analysisjobitemstatus').drop(op.get_bind(), checkfirst=True)
+    op.drop_index(op.f('ix_analysis_jobs_tenant_id'), table_name='analysis_jobs')
+    op.drop_index(op.f('ix_analysis_jobs_id'), table_name='analysis_jobs')
+    op.drop_table('analysis_jobs')
+    sa.Enum(name='analysisjobstatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,62 @@
+"""Add tenant-scoped composite indexes
+
+Revision ID: e8a3c5b1f204
+Revises: d41f7a2c9e6b
+Create Date: 2025-10-06 10:14:37.502816
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8a3c5b1f204'
+down_revision = 'd41f7a2c9e6b'
+branch_labels = None
+depends_on = None
+
+
+# (name, table, columns, extra create_index kwargs)
+INDEXES = [
+    ('ix_opportunities_tenant_id_status', 'opportunities', ['tenant_id', 'status'], {}),
+    ('ix_opportunities_tenant_id_created_at', 'opportunities', ['tenant_id', sa.text('created_at DESC')], {}),
+    ('ix_opportunities_source_post_id', 'opportunities', ['source_post_id'], {}),
+    ('ix_proposals_tenant_id_status', 'proposals', ['tenant_id', 'status'], {}),
+    ('ix_proposals_tenant_id_created_at', 'proposals', ['tenant_id', sa.text('created_at DESC')], {}),
+    ('ix_linkedin_posts_tenant_id_created_at', 'linkedin_posts', ['tenant_id', sa.text('created_at DESC')], {}),
+    ('ix_contacts_tenant_id_email', 'contacts', ['tenant_id', 'email'], {}),
+    ('ix_contacts_tenant_id_linkedin_profile_url', 'contacts', ['tenant_id', 'linkedin_profile_url'], {}),
+    ('ix_contacts_tenant_id_company_id', 'contacts', ['tenant_id', 'company_id'], {}),
+    ('ix_companies_tenant_id_domain', 'companies', ['tenant_id', 'domain'], {}),
+    ('ix_campaigns_tenant_id_created_at', 'campaigns', ['tenant_id', sa.text('created_at DESC')], {}),
+    ('ix_campaign_notes_tenant_id_campaign_id_created_at', 'campaign_notes', ['tenant_id', 'campaign_id', sa.text('created_at DESC')], {}),
+    ('ix_campaign_notes_tenant_id_opportunity_id_created_at', 'campaign_notes', ['tenant_id', 'opportunity_id', sa.text('created_at DESC')], {}),
+    ('ix_campaign_notes_tenant_id_follow_up_at', 'campaign_notes', ['tenant_id', 'follow_up_at'], {'postgresql_where': sa.text('NOT completed')}),
+    ('ix_proposal_files_tenant_id_proposal_id', 'proposal_files', ['tenant_id', 'proposal_id'], {}),
+    ('ix_proposal_files_tenant_id_filename', 'proposal_files', ['tenant_id', 'filename'], {}),
+]
+
+# Single-column indexes made redundant by the tenant-prefixed ones above
+# (post_url lookups are served by the uq_tenant_post_url constraint)
+REPLACED_INDEXES = [
+    ('ix_contacts_email', 'contacts', ['email']),
+    ('ix_contacts_linkedin_profile_url', 'contacts', ['linkedin_profile_url']),
+    ('ix_linkedin_posts_post_url', 'linkedin_posts', ['post_url']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction, but keeps large tables writable while building
+    with op.get_context().autocommit_block():
+        for name, table, columns, kwargs in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, **kwargs)
+        for name, table, _ in REPLACED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,103 @@
+"""Add full-text search vectors and trigram indexes
+
+Revision ID: f3b9d2a71c58
+Revises: e8a3c5b1f204
+Create Date: 2025-10-07 09:31:12.864150
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b9d2a71c58'
+down_revision = 'e8a3c5b1f204'
+branch_labels = None
+depends_on = None
+
+
+# Must match SEARCH_CONFIG in queries/search_queries.py
+SEARCH_CONFIG = 'english'
+
+# table -> (columns that feed the document, weighted document expression with {row} as the column prefix)
+SEARCH_DOCUMENTS = {
+    'opportunities': (
+        ['title', 'summary'],
+        "setweight(to_tsvector('{config}', coalesce({row}title, '')), 'A') || "
+        "setweight(to_tsvector('{config}', coalesce({row}summary, '')), 'B')"
+    ),
+    'proposals': (
+        ['content'],
+        "setweight(to_tsvector('{config}', coalesce({row}content, '')), 'A')"
+    ),
+    'contacts': (
+        ['name', 'email'],
+        "setweight(to_tsvector('{config}', coalesce({row}name, '')), 'A') || "
+        "setweight(to_tsvector('{config}', coalesce({row}email, '')), 'B')"
+    ),
+    'companies': (
+        ['name', 'domain'],
+        "setweight(to_tsvector('{config}', coalesce({row}name, '')), 'A') || "
+        "setweight(to_tsvector('{config}', coalesce({row}domain, '')), 'B')"
+    ),
+    'linkedin_posts': (
+        ['content'],
+        "setweight(to_tsvector('{config}', coalesce({row}content, '')), 'A')"
+    ),
+}
+
+# Short name columns searched with ILIKE '%term%'
+TRIGRAM_INDEXES = [
+    ('ix_contacts_name_trgm', 'contacts', 'name'),
+    ('ix_companies_name_trgm', 'companies', 'name'),
+    ('ix_campaigns_name_trgm', 'campaigns', 'name'),
+]
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    for table, (columns, document) in SEARCH_DOCUMENTS.items():
+        op.add_column(table, sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+        op.execute(f"""
+            CREATE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector := {document.format(config=SEARCH_CONFIG, row='NEW.')};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        # Only recompute when a searchable column changes; status updates leave the vector alone
+        op.execute(f"""
+            CREATE TRIGGER {table}_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF {', '.join(columns)} ON {table}
+            FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update()
+        """)
+        op.execute(f"UPDATE {table} SET search_vector = {document.format(config=SEARCH_CONFIG, row='')}")
+
+    with op.get_context().autocommit_block():
+        for table in SEARCH_DOCUMENTS:
+            op.create_index(
+                f'ix_{table}_search_vector', table, ['search_vector'],
+                unique=False, postgresql_using='gin', postgresql_concurrently=True
+            )
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name, table, [column], unique=False, postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'}, postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in TRIGRAM_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+        for table in SEARCH_DOCUMENTS:
+            op.drop_index(f'ix_{table}_search_vector', table_name=table, postgresql_concurrently=True)
+
+    for table in SEARCH_DOCUMENTS:
+        op.execute(f'DROP TRIGGER {table}_search_vector_trigger ON {table}')
+        op.execute(f'DROP FUNCTION {table}_search_vector_update()')
+        op.drop_column(table, 'search_vector')
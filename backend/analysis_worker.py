@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Automatic analysis worker
+Drains the analysis_queue filled when opted-in tenants ingest LinkedIn posts.
+Run as many copies as needed; items are claimed with SELECT ... FOR UPDATE SKIP LOCKED.
+Run with: python analysis_worker.py [--concurrency N] [--once]
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from database import settings
+from services.analysis_queue_service import AnalysisQueueWorker
+from utils.openai_client import close_openai_client
+
+logging.basicConfig(level=getattr(logging, settings.log_level))
+logger = logging.getLogger(__name__)
+
+async def main(concurrency: int, once: bool) -> None:
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    # Finish in-flight items on shutdown; anything left running is reclaimed after the visibility timeout
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    logger.info(f"Analysis worker started (concurrency {concurrency})")
+    await AnalysisQueueWorker(concurrency).run(stop_event, until_empty=once)
+    await close_openai_client()
+    logger.info("Analysis worker stopped")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze queued LinkedIn posts")
+    parser.add_argument("--concurrency", type=int, default=settings.auto_analysis_worker_concurrency)
+    parser.add_argument("--once", action="store_true", help="exit when no items are due")
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.once))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of per-request token verification
+Replays dashboard-style traffic (each user's token presented on several API calls in a
+row) through Auth0JWTBearer.verify_token with the verified-token cache off and on, and
+reports the auth overhead per request. Keys come from a local JWKS stub, so no Auth0
+tenant is needed:
+  python bench_token_verification.py --users 200 --calls-per-user 6 --rounds 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+KID = "bench-key"
+AUDIENCE = "https://api.example.com"
+DOMAIN = "tenant.example.com"
+
+private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+# Constructed once; handing jose the PEM would re-parse it for every token signed
+SIGNING_KEY = jwk.construct(private_key.private_bytes(
+    serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+), "RS256")
+PUBLIC_JWK = jwk.construct(private_key.public_key().public_bytes(
+    serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+), "RS256").to_dict()
+PUBLIC_JWK.update({"kid": KID, "use": "sig", "alg": "RS256"})
+
+class JWKSStub(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({"keys": [PUBLIC_JWK]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), JWKSStub)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+os.environ.update({
+    "AUTH0_DOMAIN": DOMAIN,
+    "AUTH0_API_AUDIENCE": AUDIENCE,
+    "AUTH0_JWKS_URL": f"http://127.0.0.1:{server.server_port}/.well-known/jwks.json",
+})
+
+from middleware.auth import Auth0JWTBearer
+from utils.token_cache import VerifiedTokenCache
+
+def sign(sub: str) -> str:
+    claims = {
+        "sub": sub,
+        "aud": AUDIENCE,
+        "iss": f"https://{DOMAIN}/",
+        "exp": int(time.time()) + 3600,
+        "https://mapmyclient.com/tenant_id": 1
+    }
+    return jwt.encode(claims, SIGNING_KEY, algorithm="RS256", headers={"kid": KID})
+
+async def measure(cache_entries: int, traffic: list) -> tuple:
+    """Seconds per verify_token call over `traffic`, and the cache stats afterwards."""
+    bearer = Auth0JWTBearer()
+    bearer.token_cache = VerifiedTokenCache(cache_entries)
+    # Warm the JWKS so its one fetch is not part of the measurement
+    await bearer.verify_token(traffic[0])
+    bearer.token_cache = VerifiedTokenCache(cache_entries)
+
+    started = time.perf_counter()
+    for token in traffic:
+        await bearer.verify_token(token)
+    elapsed = time.perf_counter() - started
+    await bearer.jwks.stop()
+    return elapsed / len(traffic), bearer.token_cache.stats()
+
+async def main(args) -> bool:
+    tokens = [sign(f"auth0|bench-{i}") for i in range(args.users)]
+    # Each round every user loads the dashboard, which issues calls_per_user API calls
+    traffic = [token for _ in range(args.rounds) for token in tokens for _ in range(args.calls_per_user)]
+    print(f"🔐 {len(traffic)} requests: {args.users} users x {args.calls_per_user} calls x {args.rounds} rounds")
+
+    uncached, _ = await measure(0, traffic)
+    cached, stats = await measure(args.cache_entries, traffic)
+
+    print(f"   cache off: {uncached * 1e6:8.1f} µs/request")
+    print(f"   cache on:  {cached * 1e6:8.1f} µs/request  ({uncached / cached:.0f}x faster)")
+    print(f"   cache stats: {stats}")
+    return cached < uncached
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark per-request token verification")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--calls-per-user", type=int, default=6, help="API calls per dashboard load")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--cache-entries", type=int, default=10000)
+    args = parser.parse_args()
+
+    ok = asyncio.run(main(args))
+    server.shutdown()
+    sys.exit(0 if ok else 1)
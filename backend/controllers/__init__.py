@@ -7,6 +7,7 @@ from .campaign_controller import CampaignController
 from .contact_controller import ContactController
 from .file_controller import FileController
 from .proposal_controller import ProposalController
+from .search_controller import SearchController
 
 __all__ = [
     "LinkedInController",
@@ -17,5 +18,6 @@ __all__ = [
     "CampaignController",
     "ContactController",
     "FileController",
-    "ProposalController"
+    "ProposalController",
+    "SearchController"
 ]
\ No newline at end of file
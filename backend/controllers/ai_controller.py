@@ -1,17 +1,24 @@
 from fastapi import HTTPException, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from services.ai_service import AIService
-from schemas.ai import AnalyzeExtractRequest, ProposalGenerationRequest, AnalyzeOpportunityRequest, AnalyzeOpportunityResponse
+from services.analysis_job_service import AnalysisJobService
+from services.analysis_queue_service import AnalysisQueueService
+from schemas.ai import AnalyzeExtractRequest, ProposalGenerationRequest, AnalyzeOpportunityRequest, AnalyzeOpportunityResponse, AnalyzeBatchRequest, AnalysisJobResponse, AnalysisJobItemResponse, AutoAnalysisSettingsUpdate, AutoAnalysisSettingsResponse, AutoAnalysisRetryResponse, AnalysisQueueItemResponse, RoutingPolicyUpdate, RoutingOverviewResponse, RateLimitPolicyUpdate, RateLimitOverviewResponse, PromptOverviewResponse
 from queries.linkedin_queries import LinkedInQueries
+from queries.analysis_job_queries import AnalysisJobQueries
 from utils.response_helpers import not_found_error
+from typing import List, Optional
 import json
 
 class AIController:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, user_id: Optional[str] = None):
         self.db = db
-        self.ai_service = AIService(db)
+        self.ai_service = AIService(db, user_id)
         self.linkedin_queries = LinkedInQueries(db)
+        self.job_service = AnalysisJobService(db)
+        self.job_queries = AnalysisJobQueries(db)
+        self.queue_service = AnalysisQueueService(db)
 
     async def analyze_extract_post(self, request: AnalyzeExtractRequest, tenant_id: int):
         """Analyze LinkedIn post using AI service."""
@@ -23,6 +30,8 @@ class AIController:
 
             return StreamingResponse(generate(), media_type="application/json")
 
+        except HTTPException:
+            raise
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -46,6 +55,8 @@ class AIController:
 
             return result
 
+        except HTTPException:
+            raise
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -57,18 +68,34 @@ class AIController:
                 detail=f"Proposal generation failed: {str(e)}"
             )
 
+    async def generate_proposal_streaming(self, request: ProposalGenerationRequest, tenant_id: int):
+        """Stream proposal generation tokens and sections as NDJSON."""
+        events = await self.ai_service.generate_proposal_streaming(
+            request.opportunity_id,
+            tenant_id,
+            request.template_id,
+            request.additional_context
+        )
+
+        async def generate():
+            async for event in events:
+                yield json.dumps(event) + "\n"
+
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
     async def analyze_opportunity(self, request: AnalyzeOpportunityRequest, tenant_id: int) -> AnalyzeOpportunityResponse:
         """Unified AI analysis endpoint that loads post context server-side."""
         try:
             # Load post from database
-            post = self.linkedin_queries.get_post_by_id(request.post_id, tenant_id)
+            post = await self.linkedin_queries.get_post_by_id(request.post_id, tenant_id)
             if not post:
                 raise not_found_error("Post", request.post_id)
 
             # Perform comprehensive AI analysis
             result = await self.ai_service.analyze_opportunity_comprehensive(
                 post,
-                enable_cache=request.enable_cache
+                enable_cache=request.enable_cache,
+                enable_prefilter=request.enable_prefilter
             )
 
             return AnalyzeOpportunityResponse.model_validate(result)
@@ -86,7 +113,7 @@ class AIController:
         """Streaming version of AI analysis with progressive updates."""
         try:
             # Load post from database
-            post = self.linkedin_queries.get_post_by_id(request.post_id, tenant_id)
+            post = await self.linkedin_queries.get_post_by_id(request.post_id, tenant_id)
             if not post:
                 raise not_found_error("Post", request.post_id)
 
@@ -94,7 +121,8 @@ class AIController:
             async def generate():
                 async for chunk in self.ai_service.analyze_opportunity_comprehensive_streaming(
                     post,
-                    enable_cache=request.enable_cache
+                    enable_cache=request.enable_cache,
+                    enable_prefilter=request.enable_prefilter
                 ):
                     yield chunk
 
@@ -107,4 +135,90 @@ class AIController:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"AI analysis failed: {str(e)}"
-            )
\ No newline at end of file
+            )
+
+    async def get_routing_overview(self, tenant_id: int) -> RoutingOverviewResponse:
+        """Get the model routing policy and per-route metrics."""
+        return RoutingOverviewResponse(**await self.ai_service.get_routing_overview(tenant_id))
+
+    async def update_routing_policy(self, request: RoutingPolicyUpdate, tenant_id: int) -> RoutingOverviewResponse:
+        """Update the tenant's model routing policy."""
+        result = await self.ai_service.update_routing_policy(tenant_id, request.model_dump(exclude_unset=True))
+        return RoutingOverviewResponse(**result)
+
+    async def get_prompt_overview(self) -> PromptOverviewResponse:
+        """Get the analysis prompt versions and their usage metrics."""
+        return PromptOverviewResponse(**self.ai_service.get_prompt_overview())
+
+    async def get_rate_limits(self, tenant_id: int) -> RateLimitOverviewResponse:
+        """Get the AI budgets and current bucket levels."""
+        return RateLimitOverviewResponse(**await self.ai_service.get_rate_limits(tenant_id))
+
+    async def update_rate_limits(self, request: RateLimitPolicyUpdate, tenant_id: int) -> RateLimitOverviewResponse:
+        """Update the tenant's AI budgets."""
+        result = await self.ai_service.update_rate_limits(tenant_id, request.model_dump(exclude_unset=True))
+        return RateLimitOverviewResponse(**result)
+
+    async def get_cache_statistics(self) -> dict:
+        """Get analysis cache hit/miss counters."""
+        return await self.ai_service.get_cache_statistics()
+
+    async def create_analysis_job(self, request: AnalyzeBatchRequest, tenant_id: int) -> AnalysisJobResponse:
+        """Create a bulk analysis job and start it in the background."""
+        job = await self.job_service.create_job(
+            tenant_id,
+            post_ids=request.post_ids,
+            all_unanalyzed=request.all_unanalyzed,
+            enable_cache=request.enable_cache,
+            concurrency=request.concurrency
+        )
+        self.job_service.start_job(job)
+        return AnalysisJobResponse.model_validate(job)
+
+    async def get_analysis_jobs(self, tenant_id: int, skip: int = 0, limit: int = 20) -> List[AnalysisJobResponse]:
+        """Get recent bulk analysis jobs."""
+        jobs = await self.job_queries.get_jobs_by_tenant(tenant_id, skip, limit)
+        return [AnalysisJobResponse.model_validate(job) for job in jobs]
+
+    async def get_analysis_job(self, job_id: int, tenant_id: int) -> AnalysisJobResponse:
+        """Get progress for a bulk analysis job."""
+        job = await self.job_service.get_job(job_id, tenant_id)
+        return AnalysisJobResponse.model_validate(job)
+
+    async def get_analysis_job_items(
+        self,
+        job_id: int,
+        tenant_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None
+    ) -> List[AnalysisJobItemResponse]:
+        """Get per-post results for a bulk analysis job."""
+        items = await self.job_service.get_job_items(job_id, tenant_id, skip, limit, status)
+        return [AnalysisJobItemResponse.model_validate(item) for item in items]
+
+    async def stream_analysis_job(self, job_id: int, tenant_id: int):
+        """Stream per-post results and progress for a bulk analysis job."""
+        await self.job_service.get_job(job_id, tenant_id)
+        return StreamingResponse(
+            self.job_service.stream_job_progress(job_id, tenant_id),
+            media_type="application/x-ndjson"
+        )
+
+    async def get_auto_analysis_settings(self, tenant_id: int) -> AutoAnalysisSettingsResponse:
+        """Get automatic analysis settings and queue counts."""
+        return AutoAnalysisSettingsResponse(**await self.queue_service.get_settings(tenant_id))
+
+    async def update_auto_analysis_settings(self, request: AutoAnalysisSettingsUpdate, tenant_id: int) -> AutoAnalysisSettingsResponse:
+        """Update automatic analysis settings."""
+        result = await self.queue_service.update_settings(tenant_id, request.enabled, request.min_confidence)
+        return AutoAnalysisSettingsResponse(**result)
+
+    async def get_dead_analysis_items(self, tenant_id: int, skip: int = 0, limit: int = 50) -> List[AnalysisQueueItemResponse]:
+        """Get posts whose automatic analysis gave up."""
+        items = await self.queue_service.get_dead_items(tenant_id, skip, limit)
+        return [AnalysisQueueItemResponse.model_validate(item) for item in items]
+
+    async def retry_dead_analysis_items(self, tenant_id: int) -> AutoAnalysisRetryResponse:
+        """Requeue posts whose automatic analysis gave up."""
+        return AutoAnalysisRetryResponse(requeued=await self.queue_service.retry_dead_items(tenant_id))
@@ -1,22 +1,23 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from services.auth_service import AuthService
+from services.principal_resolver import Principal
 from utils.response_helpers import success_message
 from typing import Dict, Any
 
 class AuthController:
     """Controller for authentication operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.auth_service = AuthService(db)
 
-    def get_me(self, current_user: Dict[str, Any]) -> Dict[str, Any]:
+    async def get_me(self, current_user: Dict[str, Any], principal: Principal) -> Dict[str, Any]:
         """Get current user profile with auto-creation if needed."""
-        return self.auth_service.get_user_profile(current_user)
+        return await self.auth_service.get_user_profile(current_user, principal)
 
-    def authenticate_user(self, current_user: Dict[str, Any]) -> Dict[str, Any]:
+    async def authenticate_user(self, current_user: Dict[str, Any]) -> Dict[str, Any]:
         """Authenticate user and create if first time login."""
-        user_data, is_new_user = self.auth_service.authenticate_or_create_user(current_user)
+        user_data, is_new_user = await self.auth_service.authenticate_or_create_user(current_user)
 
         response = {
             "user": user_data,
@@ -36,9 +37,9 @@ class AuthController:
         # This endpoint is mainly for consistency and potential future use
         return success_message("completed", "Logout")
 
-    def validate_access(self, current_user: Dict[str, Any], tenant_id: int) -> Dict[str, Any]:
+    async def validate_access(self, current_user: Dict[str, Any], tenant_id: int) -> Dict[str, Any]:
         """Validate user access to specific tenant."""
-        has_access = self.auth_service.validate_tenant_access(current_user, tenant_id)
+        has_access = await self.auth_service.validate_tenant_access(current_user, tenant_id)
 
         return {
             "has_access": has_access,
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from schemas.campaign import CampaignCreate, CampaignUpdate, CampaignResponse, CampaignNoteCreate, CampaignNoteUpdate, CampaignNoteResponse
 from services.campaign_service import CampaignService
 from queries.campaign_queries import CampaignQueries
@@ -6,12 +6,12 @@ from utils.response_helpers import not_found_error, deletion_success
 from typing import List, Optional
 
 class CampaignController:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.campaign_service = CampaignService(db)
         self.queries = CampaignQueries(db)
 
-    def create_campaign(
+    async def create_campaign(
         self,
         campaign: CampaignCreate,
         tenant_id: int
@@ -21,10 +21,10 @@ class CampaignController:
         campaign_data["tenant_id"] = tenant_id
 
         # Use service for business logic and validation
-        new_campaign = self.campaign_service.create_campaign_with_validation(campaign_data)
+        new_campaign = await self.campaign_service.create_campaign_with_validation(campaign_data)
         return CampaignResponse.model_validate(new_campaign)
 
-    def get_campaigns(
+    async def get_campaigns(
         self,
         tenant_id: int,
         skip: int = 0,
@@ -34,35 +34,35 @@ class CampaignController:
         """Get campaigns with optional search."""
         if search:
             # Use service for business logic
-            campaigns = self.campaign_service.search_campaigns_by_name(tenant_id, search)
+            campaigns = await self.campaign_service.search_campaigns_by_name(tenant_id, search)
         else:
             # Use queries directly for simple reads
-            campaigns = self.queries.get_campaigns_by_tenant(tenant_id, skip, limit)
+            campaigns = await self.queries.get_campaigns_by_tenant(tenant_id, skip, limit)
 
         return [CampaignResponse.model_validate(campaign) for campaign in campaigns]
 
-    def get_campaign(
+    async def get_campaign(
         self,
         campaign_id: int,
         tenant_id: int
     ) -> CampaignResponse:
         """Get a specific campaign."""
         # Use queries directly for simple reads
-        campaign = self.queries.get_campaign_by_id(campaign_id, tenant_id)
+        campaign = await self.queries.get_campaign_by_id(campaign_id, tenant_id)
 
         if not campaign:
             raise not_found_error("Campaign", campaign_id)
 
         return CampaignResponse.model_validate(campaign)
 
-    def update_campaign(
+    async def update_campaign(
         self,
         campaign_id: int,
         campaign_update: CampaignUpdate,
         tenant_id: int
     ) -> CampaignResponse:
         """Update an existing campaign."""
-        campaign = self.queries.get_campaign_by_id(campaign_id, tenant_id)
+        campaign = await self.queries.get_campaign_by_id(campaign_id, tenant_id)
 
         if not campaign:
             raise not_found_error("Campaign", campaign_id)
@@ -70,49 +70,49 @@ class CampaignController:
         update_data = campaign_update.model_dump(exclude_unset=True)
 
         # Use service for business validation
-        updated_campaign = self.campaign_service.update_campaign_with_validation(campaign, update_data)
+        updated_campaign = await self.campaign_service.update_campaign_with_validation(campaign, update_data)
 
         return CampaignResponse.model_validate(updated_campaign)
 
-    def delete_campaign(
+    async def delete_campaign(
         self,
         campaign_id: int,
         tenant_id: int
     ) -> dict:
         """Delete a campaign."""
-        campaign = self.queries.get_campaign_by_id(campaign_id, tenant_id)
+        campaign = await self.queries.get_campaign_by_id(campaign_id, tenant_id)
 
         if not campaign:
             raise not_found_error("Campaign", campaign_id)
 
-        self.queries.delete_campaign(campaign)
+        await self.queries.delete_campaign(campaign)
         return deletion_success("Campaign")
 
-    def archive_campaign(
+    async def archive_campaign(
         self,
         campaign_id: int,
         tenant_id: int
     ) -> CampaignResponse:
         """Archive a campaign (soft delete)."""
-        campaign = self.queries.get_campaign_by_id(campaign_id, tenant_id)
+        campaign = await self.queries.get_campaign_by_id(campaign_id, tenant_id)
 
         if not campaign:
             raise not_found_error("Campaign", campaign_id)
 
         # Use service for business logic
-        archived_campaign = self.campaign_service.archive_campaign(campaign)
+        archived_campaign = await self.campaign_service.archive_campaign(campaign)
         return CampaignResponse.model_validate(archived_campaign)
 
-    def get_campaign_statistics(
+    async def get_campaign_statistics(
         self,
         tenant_id: int
     ) -> dict:
         """Get campaign statistics for tenant."""
         # Use service for business logic
-        return self.campaign_service.get_campaign_statistics(tenant_id)
+        return await self.campaign_service.get_campaign_statistics(tenant_id)
 
     # Campaign Notes methods
-    def create_campaign_note(
+    async def create_campaign_note(
         self,
         note: CampaignNoteCreate,
         tenant_id: int
@@ -122,84 +122,84 @@ class CampaignController:
         note_data["tenant_id"] = tenant_id
 
         # Validate campaign and opportunity exist and belong to tenant
-        campaign = self.queries.get_campaign_by_id(note.campaign_id, tenant_id)
+        campaign = await self.queries.get_campaign_by_id(note.campaign_id, tenant_id)
         if not campaign:
             raise not_found_error("Campaign", note.campaign_id)
 
-        new_note = self.queries.create_campaign_note(note_data)
+        new_note = await self.queries.create_campaign_note(note_data)
         return CampaignNoteResponse.model_validate(new_note)
 
-    def get_campaign_notes(
+    async def get_campaign_notes(
         self,
         campaign_id: int,
         tenant_id: int
     ) -> List[CampaignNoteResponse]:
         """Get all notes for a specific campaign."""
         # Validate campaign exists and belongs to tenant
-        campaign = self.queries.get_campaign_by_id(campaign_id, tenant_id)
+        campaign = await self.queries.get_campaign_by_id(campaign_id, tenant_id)
         if not campaign:
             raise not_found_error("Campaign", campaign_id)
 
-        notes = self.queries.get_campaign_notes(campaign_id, tenant_id)
+        notes = await self.queries.get_campaign_notes(campaign_id, tenant_id)
         return [CampaignNoteResponse.model_validate(note) for note in notes]
 
-    def get_campaign_note(
+    async def get_campaign_note(
         self,
         note_id: int,
         tenant_id: int
     ) -> CampaignNoteResponse:
         """Get a specific campaign note."""
-        note = self.queries.get_campaign_note_by_id(note_id, tenant_id)
+        note = await self.queries.get_campaign_note_by_id(note_id, tenant_id)
 
         if not note:
             raise not_found_error("Campaign Note", note_id)
 
         return CampaignNoteResponse.model_validate(note)
 
-    def update_campaign_note(
+    async def update_campaign_note(
         self,
         note_id: int,
         note_update: CampaignNoteUpdate,
         tenant_id: int
     ) -> CampaignNoteResponse:
         """Update an existing campaign note."""
-        note = self.queries.get_campaign_note_by_id(note_id, tenant_id)
+        note = await self.queries.get_campaign_note_by_id(note_id, tenant_id)
 
         if not note:
             raise not_found_error("Campaign Note", note_id)
 
         update_data = note_update.model_dump(exclude_unset=True)
-        updated_note = self.queries.update_campaign_note(note, update_data)
+        updated_note = await self.queries.update_campaign_note(note, update_data)
 
         return CampaignNoteResponse.model_validate(updated_note)
 
-    def delete_campaign_note(
+    async def delete_campaign_note(
         self,
         note_id: int,
         tenant_id: int
     ) -> dict:
         """Delete a campaign note."""
-        note = self.queries.get_campaign_note_by_id(note_id, tenant_id)
+        note = await self.queries.get_campaign_note_by_id(note_id, tenant_id)
 
         if not note:
             raise not_found_error("Campaign Note", note_id)
 
-        self.queries.delete_campaign_note(note)
+        await self.queries.delete_campaign_note(note)
         return deletion_success("Campaign Note")
 
-    def get_overdue_follow_ups(
+    async def get_overdue_follow_ups(
         self,
         tenant_id: int
     ) -> List[CampaignNoteResponse]:
         """Get overdue follow-up notes for a tenant."""
-        notes = self.queries.get_overdue_follow_ups(tenant_id)
+        notes = await self.queries.get_overdue_follow_ups(tenant_id)
         return [CampaignNoteResponse.model_validate(note) for note in notes]
 
-    def get_notes_by_opportunity(
+    async def get_notes_by_opportunity(
         self,
         opportunity_id: int,
         tenant_id: int
     ) -> List[CampaignNoteResponse]:
         """Get all notes for a specific opportunity."""
-        notes = self.queries.get_notes_by_opportunity(opportunity_id, tenant_id)
+        notes = await self.queries.get_notes_by_opportunity(opportunity_id, tenant_id)
         return [CampaignNoteResponse.model_validate(note) for note in notes]
\ No newline at end of file
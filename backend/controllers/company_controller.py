@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from schemas.company import CompanyCreate, CompanyUpdate, CompanyResponse
 from services.company_service import CompanyService
 from queries.company_queries import CompanyQueries
@@ -6,12 +6,12 @@ from utils.response_helpers import not_found_error, deletion_success
 from typing import List
 
 class CompanyController:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.company_service = CompanyService(db)
         self.queries = CompanyQueries(db)
 
-    def create_company(
+    async def create_company(
         self,
         company: CompanyCreate,
         tenant_id: int
@@ -24,39 +24,39 @@ class CompanyController:
         }
 
         # Use service for business logic and validation
-        new_company = self.company_service.create_company_with_validation(company_data)
+        new_company = await self.company_service.create_company_with_validation(company_data)
         return CompanyResponse.model_validate(new_company)
 
-    def get_companies(
+    async def get_companies(
         self,
         tenant_id: int,
         skip: int = 0,
         limit: int = 100
     ) -> List[CompanyResponse]:
         # Use queries directly for simple reads
-        companies = self.queries.get_companies_by_tenant(tenant_id, skip, limit)
+        companies = await self.queries.get_companies_by_tenant(tenant_id, skip, limit)
         return [CompanyResponse.model_validate(company) for company in companies]
 
-    def get_company(
+    async def get_company(
         self,
         company_id: int,
         tenant_id: int
     ) -> CompanyResponse:
         # Use queries directly for simple reads
-        company = self.queries.get_company_by_id(company_id, tenant_id)
+        company = await self.queries.get_company_by_id(company_id, tenant_id)
 
         if not company:
             raise not_found_error("Company", company_id)
 
         return CompanyResponse.model_validate(company)
 
-    def update_company(
+    async def update_company(
         self,
         company_id: int,
         company_update: CompanyUpdate,
         tenant_id: int
     ) -> CompanyResponse:
-        company = self.queries.get_company_by_id(company_id, tenant_id)
+        company = await self.queries.get_company_by_id(company_id, tenant_id)
 
         if not company:
             raise not_found_error("Company", company_id)
@@ -64,19 +64,19 @@ class CompanyController:
         update_data = company_update.model_dump(exclude_unset=True)
 
         # Use service for business validation
-        updated_company = self.company_service.update_company_with_validation(company, update_data)
+        updated_company = await self.company_service.update_company_with_validation(company, update_data)
 
         return CompanyResponse.model_validate(updated_company)
 
-    def delete_company(
+    async def delete_company(
         self,
         company_id: int,
         tenant_id: int
     ) -> dict:
-        company = self.queries.get_company_by_id(company_id, tenant_id)
+        company = await self.queries.get_company_by_id(company_id, tenant_id)
 
         if not company:
             raise not_found_error("Company", company_id)
 
-        self.queries.delete_company(company)
+        await self.queries.delete_company(company)
         return deletion_success("Company")
\ No newline at end of file
@@ -1,13 +1,17 @@
-from sqlalchemy.orm import Session
-from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Request, Response, UploadFile
 from services.file_service import FileService
 from queries.file_queries import FileQueries
 from schemas.file import FileUploadResponse, ProposalFileResponse, FileStatisticsResponse, FileCleanupResponse
+from database import settings
+from utils.file_responses import RangeFileResponse, etag_matches
 from utils.response_helpers import not_found_error
 from typing import List, Optional
+from urllib.parse import quote
+import mimetypes
 
 class FileController:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.file_service = FileService(db)
         self.queries = FileQueries(db)
@@ -23,7 +27,52 @@ class FileController:
         file_data = await self.file_service.upload_proposal_file(file, proposal_id, tenant_id)
         return FileUploadResponse(**file_data)
 
-    def get_proposal_files(
+    async def upload_proposal_file_stream(
+        self,
+        request: Request,
+        filename: str,
+        proposal_id: int,
+        tenant_id: int
+    ) -> FileUploadResponse:
+        """Upload a file for a proposal from the raw request body, written as it arrives."""
+        content_length = request.headers.get("content-length")
+        file_data = await self.file_service.upload_proposal_file_stream(
+            request.stream(),
+            filename,
+            int(content_length) if content_length and content_length.isdigit() else None,
+            proposal_id,
+            tenant_id
+        )
+        return FileUploadResponse(**file_data)
+
+    async def download_file(
+        self,
+        filename: str,
+        tenant_id: int,
+        request: Request
+    ) -> Response:
+        """Send a file's content, honouring Range, If-Range and If-None-Match."""
+        proposal_file, file_path, size = await self.file_service.get_file_download(filename, tenant_id)
+        # Strong validator: the content hash changes exactly when the bytes do
+        etag = f'"{proposal_file.sha256}"'
+        media_type = mimetypes.guess_type(proposal_file.filename)[0] or "application/octet-stream"
+
+        prefix = settings.file_download_accel_redirect_prefix
+        if prefix and not etag_matches(request.headers.get("if-none-match"), etag, weak=True):
+            # nginx serves the internal location with sendfile and handles Range itself
+            return Response(
+                media_type=media_type,
+                headers={
+                    "X-Accel-Redirect": f"{prefix.rstrip('/')}/{tenant_id}/{quote(proposal_file.filename)}",
+                    "ETag": etag,
+                    "Cache-Control": "private, no-cache",
+                    "Content-Disposition": f"attachment; filename*=utf-8''{quote(proposal_file.filename)}"
+                }
+            )
+
+        return RangeFileResponse(str(file_path), size, etag, request.headers, media_type, proposal_file.filename)
+
+    async def get_proposal_files(
         self,
         tenant_id: int,
         proposal_id: Optional[int] = None,
@@ -33,62 +82,62 @@ class FileController:
         """Get proposal files with optional proposal filter."""
         if proposal_id:
             # Get files for specific proposal
-            files = self.queries.get_proposal_files_by_proposal(proposal_id, tenant_id)
+            files = await self.queries.get_proposal_files_by_proposal(proposal_id, tenant_id)
         else:
             # Get all files for tenant
-            files = self.queries.get_proposal_files_by_tenant(tenant_id, skip, limit)
+            files = await self.queries.get_proposal_files_by_tenant(tenant_id, skip, limit)
 
         return [ProposalFileResponse.model_validate(file) for file in files]
 
-    def get_proposal_file(
+    async def get_proposal_file(
         self,
         file_id: int,
         tenant_id: int
     ) -> ProposalFileResponse:
         """Get a specific proposal file."""
         # Use queries directly for simple reads
-        file = self.queries.get_proposal_file_by_id(file_id, tenant_id)
+        file = await self.queries.get_proposal_file_by_id(file_id, tenant_id)
 
         if not file:
             raise not_found_error("File", file_id)
 
         return ProposalFileResponse.model_validate(file)
 
-    def delete_file(
+    async def delete_file(
         self,
         filename: str,
         tenant_id: int
     ) -> dict:
         """Delete a file."""
         # Use service for business logic (handles both disk and DB)
-        return self.file_service.delete_proposal_file(filename, tenant_id)
+        return await self.file_service.delete_proposal_file(filename, tenant_id)
 
-    def get_file_statistics(
+    async def get_file_statistics(
         self,
         tenant_id: int
     ) -> FileStatisticsResponse:
         """Get file statistics for tenant."""
         # Use service for business logic
-        stats = self.file_service.get_file_statistics(tenant_id)
+        stats = await self.file_service.get_file_statistics(tenant_id)
         return FileStatisticsResponse(**stats)
 
-    def cleanup_orphaned_files(
+    async def cleanup_orphaned_files(
         self,
         tenant_id: int
     ) -> FileCleanupResponse:
         """Clean up orphaned files."""
         # Use service for business logic
-        result = self.file_service.cleanup_orphaned_files(tenant_id)
+        result = await self.file_service.cleanup_orphaned_files(tenant_id)
         return FileCleanupResponse(**result)
 
-    def get_file_by_filename(
+    async def get_file_by_filename(
         self,
         filename: str,
         tenant_id: int
     ) -> ProposalFileResponse:
         """Get file by filename."""
         # Use queries directly for simple reads
-        file = self.queries.get_proposal_file_by_filename(filename, tenant_id)
+        file = await self.queries.get_proposal_file_by_filename(filename, tenant_id)
 
         if not file:
             raise not_found_error("File")
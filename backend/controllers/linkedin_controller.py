@@ -1,30 +1,49 @@
-from sqlalchemy.orm import Session
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
+from starlette.requests import ClientDisconnect
 from schemas.linkedin import LinkedInPostCreate, LinkedInPostResponse, LinkedInPostBatchCreate, BatchIngestionResponse
 from services.linkedin_service import LinkedInService
 from services.user_service import UserService
+from services.principal_resolver import Principal
 from queries.linkedin_queries import LinkedInQueries
-from typing import List, Dict, Any
+from database import settings
+from utils.stream_parsers import NDJSONLineSplitter
+from utils.response_helpers import validation_error
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
+import json
+import logging
+import tempfile
+import zlib
+
+logger = logging.getLogger(__name__)
+
+# Per-line results stay in memory up to this size, then spill to a temporary file
+RESULTS_SPOOL_BYTES = 1024 * 1024
+RESULTS_READ_BYTES = 64 * 1024
 
 class LinkedInController:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.linkedin_service = LinkedInService(db)
         self.user_service = UserService(db)
         self.queries = LinkedInQueries(db)
 
-    def ingest_linkedin_post(
+    async def ingest_linkedin_post(
         self,
         post_data: LinkedInPostCreate,
-        current_user: Dict[str, Any],
+        principal: Principal,
         tenant_id: int
     ) -> LinkedInPostResponse:
         # Validate user access using service
-        user = self.user_service.validate_user_access(current_user, tenant_id)
+        user_id = self.user_service.validate_user_access(principal, tenant_id)
 
         # Prepare post data
         post_dict = {
             "tenant_id": tenant_id,
-            "user_id": user.id,
+            "user_id": user_id,
             "post_url": str(post_data.post_url),
             "author_profile_url": str(post_data.author_profile_url) if post_data.author_profile_url else None,
             "content": post_data.content,
@@ -32,26 +51,26 @@ class LinkedInController:
         }
 
         # Create post using service (includes validation)
-        new_post = self.linkedin_service.create_post(post_dict)
+        new_post = await self.linkedin_service.create_post(post_dict)
         return LinkedInPostResponse.model_validate(new_post)
 
-    def get_linkedin_posts(
+    async def get_linkedin_posts(
         self,
         tenant_id: int,
         skip: int = 0,
         limit: int = 100
     ) -> List[LinkedInPostResponse]:
         # Use queries layer directly for simple reads
-        posts = self.queries.get_posts_by_tenant(tenant_id, skip, limit)
+        posts = await self.queries.get_posts_by_tenant(tenant_id, skip, limit)
         return [LinkedInPostResponse.model_validate(post) for post in posts]
 
-    def get_linkedin_post(
+    async def get_linkedin_post(
         self,
         post_id: int,
         tenant_id: int
     ) -> LinkedInPostResponse:
         # Use queries layer directly for simple reads
-        post = self.queries.get_post_by_id(post_id, tenant_id)
+        post = await self.queries.get_post_by_id(post_id, tenant_id)
 
         if not post:
             from utils.response_helpers import not_found_error
@@ -59,20 +78,20 @@ class LinkedInController:
 
         return LinkedInPostResponse.model_validate(post)
 
-    def ingest_linkedin_posts_batch(
+    async def ingest_linkedin_posts_batch(
         self,
         batch_data: LinkedInPostBatchCreate,
-        current_user: Dict[str, Any],
+        principal: Principal,
         tenant_id: int
     ) -> BatchIngestionResponse:
         """Ingest multiple LinkedIn posts in batch."""
         # Validate user access
-        user = self.user_service.validate_user_access(current_user, tenant_id)
+        user_id = self.user_service.validate_user_access(principal, tenant_id)
 
-        # Validate batch size (limit to 50 posts per batch)
-        if len(batch_data.posts) > 50:
+        # Validate batch size
+        if len(batch_data.posts) > settings.linkedin_batch_max_posts:
             from utils.response_helpers import validation_error
-            raise validation_error("Batch size cannot exceed 50 posts")
+            raise validation_error(f"Batch size cannot exceed {settings.linkedin_batch_max_posts} posts")
 
         # Convert posts to dict format for service
         posts_data = []
@@ -85,6 +104,75 @@ class LinkedInController:
             })
 
         # Process batch using service
-        result = self.linkedin_service.create_posts_batch(posts_data, tenant_id, user.id)
+        result = await self.linkedin_service.create_posts_batch(posts_data, tenant_id, user_id)
+
+        return BatchIngestionResponse.model_validate(result)
+
+    async def ingest_linkedin_posts_stream(
+        self,
+        request: Request,
+        principal: Principal,
+        tenant_id: int
+    ) -> StreamingResponse:
+        """Ingest an NDJSON upload of posts chunk by chunk, then stream back one result per line."""
+        user_id = self.user_service.validate_user_access(principal, tenant_id)
+
+        encoding = request.headers.get("content-encoding", "identity").lower()
+        if encoding not in ("identity", "gzip"):
+            raise validation_error("Content-Encoding must be gzip or omitted")
+        splitter = NDJSONLineSplitter(gzip=encoding == "gzip", max_line_bytes=settings.linkedin_stream_max_line_bytes)
+
+        async def parsed_lines() -> AsyncIterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+            async for chunk in request.stream():
+                for line_number, line in splitter.feed(chunk):
+                    yield self._parse_post_line(line_number, line)
+            for line_number, line in splitter.finish():
+                yield self._parse_post_line(line_number, line)
+
+        # Results are spooled rather than sent while the upload is still arriving: most HTTP
+        # clients only read the response once the body is sent, so a large upload would
+        # otherwise deadlock with both sides blocked on full socket buffers
+        results_file = tempfile.SpooledTemporaryFile(max_size=RESULTS_SPOOL_BYTES)
+        results = self.linkedin_service.ingest_posts_stream(
+            parsed_lines(), tenant_id, user_id, settings.linkedin_stream_chunk_size
+        )
+        try:
+            async for chunk_results in results:
+                results_file.write("".join(json.dumps(result, default=str) + "\n" for result in chunk_results).encode())
+        except zlib.error as e:
+            results_file.write((json.dumps({"error": f"Invalid gzip stream: {e}"}) + "\n").encode())
+        except ClientDisconnect:
+            results_file.close()
+            logger.info(f"Client disconnected during post upload after line {splitter.line_number}")
+            raise
+
+        results_file.seek(0)
+
+        def read_results():
+            while block := results_file.read(RESULTS_READ_BYTES):
+                yield block
+
+        return StreamingResponse(
+            read_results(), media_type="application/x-ndjson", background=BackgroundTask(results_file.close)
+        )
+
+    def _parse_post_line(self, line_number: int, line: Optional[bytes]) -> Tuple[int, Optional[Dict[str, Any]], Optional[str]]:
+        """Parse one NDJSON line into post data, or an error message."""
+        if line is None:
+            return line_number, None, f"Line exceeds {settings.linkedin_stream_max_line_bytes} bytes"
+
+        try:
+            post = LinkedInPostCreate.model_validate_json(line)
+        except ValidationError as e:
+            errors = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" if error["loc"] else error["msg"]
+                for error in e.errors()
+            )
+            return line_number, None, errors
 
-        return BatchIngestionResponse.model_validate(result)
\ No newline at end of file
+        return line_number, {
+            "post_url": str(post.post_url),
+            "author_profile_url": str(post.author_profile_url) if post.author_profile_url else None,
+            "content": post.content,
+            "scraped_at": post.scraped_at
+        }, None
@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, status
 from schemas.opportunity import OpportunityCreate, OpportunityUpdate, OpportunityResponse
 from services.opportunity_service import OpportunityService
 from queries.opportunity_queries import OpportunityQueries
@@ -6,12 +7,12 @@ from utils.response_helpers import not_found_error, deletion_success
 from typing import List, Optional
 
 class OpportunityController:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.opportunity_service = OpportunityService(db)
         self.queries = OpportunityQueries(db)
 
-    def create_opportunity(
+    async def create_opportunity(
         self,
         opportunity: OpportunityCreate,
         tenant_id: int
@@ -20,27 +21,27 @@ class OpportunityController:
         opportunity_data["tenant_id"] = tenant_id
 
         # Use service for business logic and validation
-        new_opportunity = self.opportunity_service.create_opportunity_with_validation(opportunity_data)
+        new_opportunity = await self.opportunity_service.create_opportunity_with_validation(opportunity_data)
         return OpportunityResponse.model_validate(new_opportunity)
 
-    def get_opportunities(
+    async def get_opportunities(
         self,
         tenant_id: int,
         skip: int = 0,
         limit: int = 100,
         status: Optional[str] = None
     ) -> List[OpportunityResponse]:
-        opportunities = self.queries.get_opportunities_by_tenant(
+        opportunities = await self.queries.get_opportunities_by_tenant(
             tenant_id, skip, limit, status
         )
         return [OpportunityResponse.model_validate(opp) for opp in opportunities]
 
-    def get_opportunity(
+    async def get_opportunity(
         self,
         opportunity_id: int,
         tenant_id: int
     ) -> OpportunityResponse:
-        opportunity = self.queries.get_opportunity_by_id(opportunity_id, tenant_id)
+        opportunity = await self.queries.get_opportunity_by_id(opportunity_id, tenant_id)
 
         if not opportunity:
             raise HTTPException(
@@ -50,13 +51,13 @@ class OpportunityController:
 
         return OpportunityResponse.model_validate(opportunity)
 
-    def update_opportunity(
+    async def update_opportunity(
         self,
         opportunity_id: int,
         opportunity_update: OpportunityUpdate,
         tenant_id: int
     ) -> OpportunityResponse:
-        opportunity = self.queries.get_opportunity_by_id(opportunity_id, tenant_id)
+        opportunity = await self.queries.get_opportunity_by_id(opportunity_id, tenant_id)
 
         if not opportunity:
             raise HTTPException(
@@ -65,16 +66,16 @@ class OpportunityController:
             )
 
         update_data = opportunity_update.model_dump(exclude_unset=True)
-        updated_opportunity = self.queries.update_opportunity(opportunity, update_data)
+        updated_opportunity = await self.queries.update_opportunity(opportunity, update_data)
 
         return OpportunityResponse.model_validate(updated_opportunity)
 
-    def delete_opportunity(
+    async def delete_opportunity(
         self,
         opportunity_id: int,
         tenant_id: int
     ) -> dict:
-        opportunity = self.queries.get_opportunity_by_id(opportunity_id, tenant_id)
+        opportunity = await self.queries.get_opportunity_by_id(opportunity_id, tenant_id)
 
         if not opportunity:
             raise HTTPException(
@@ -82,5 +83,5 @@ class OpportunityController:
                 detail="Opportunity not found"
             )
 
-        self.queries.delete_opportunity(opportunity)
+        await self.queries.delete_opportunity(opportunity)
         return {"message": "Opportunity deleted successfully"}
\ No newline at end of file
@@ -1,17 +1,19 @@
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from schemas.proposal import ProposalCreate, ProposalUpdate, ProposalResponse
 from services.proposal_service import ProposalService
 from queries.proposal_queries import ProposalQueries
 from utils.response_helpers import not_found_error, deletion_success
 from typing import List, Optional
+import json
 
 class ProposalController:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, user_id: Optional[str] = None):
         self.db = db
-        self.proposal_service = ProposalService(db)
+        self.proposal_service = ProposalService(db, user_id)
         self.queries = ProposalQueries(db)
 
-    def create_proposal(
+    async def create_proposal(
         self,
         proposal: ProposalCreate,
         tenant_id: int
@@ -21,7 +23,7 @@ class ProposalController:
         proposal_data["tenant_id"] = tenant_id
 
         # Use service for business logic and validation
-        new_proposal = self.proposal_service.create_proposal_with_validation(proposal_data)
+        new_proposal = await self.proposal_service.create_proposal_with_validation(proposal_data)
         return ProposalResponse.model_validate(new_proposal)
 
     async def generate_proposal_with_ai(
@@ -41,7 +43,29 @@ class ProposalController:
             "ai_suggestions": result["ai_suggestions"]
         }
 
-    def get_proposals(
+    async def generate_proposal_with_ai_streaming(
+        self,
+        opportunity_id: int,
+        tenant_id: int,
+        additional_context: Optional[str] = None
+    ) -> StreamingResponse:
+        """Stream AI proposal generation as NDJSON while checkpointing the draft."""
+        events = await self.proposal_service.generate_proposal_with_ai_streaming(
+            opportunity_id, tenant_id, additional_context
+        )
+
+        async def generate():
+            async for event in events:
+                if event["status"] == "completed":
+                    event = {
+                        **event,
+                        "proposal": ProposalResponse.model_validate(event["proposal"]).model_dump(mode="json")
+                    }
+                yield json.dumps(event) + "\n"
+
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    async def get_proposals(
         self,
         tenant_id: int,
         skip: int = 0,
@@ -52,35 +76,35 @@ class ProposalController:
         """Get proposals with optional filters."""
         if search:
             # Use service for business logic
-            proposals = self.proposal_service.search_proposals(tenant_id, search)
+            proposals = await self.proposal_service.search_proposals(tenant_id, search)
         else:
             # Use queries directly for simple reads
-            proposals = self.queries.get_proposals_by_tenant(tenant_id, skip, limit, status)
+            proposals = await self.queries.get_proposals_by_tenant(tenant_id, skip, limit, status)
 
         return [ProposalResponse.model_validate(proposal) for proposal in proposals]
 
-    def get_proposal(
+    async def get_proposal(
         self,
         proposal_id: int,
         tenant_id: int
     ) -> ProposalResponse:
         """Get a specific proposal."""
         # Use queries directly for simple reads
-        proposal = self.queries.get_proposal_by_id(proposal_id, tenant_id)
+        proposal = await self.queries.get_proposal_by_id(proposal_id, tenant_id)
 
         if not proposal:
             raise not_found_error("Proposal", proposal_id)
 
         return ProposalResponse.model_validate(proposal)
 
-    def update_proposal(
+    async def update_proposal(
         self,
         proposal_id: int,
         proposal_update: ProposalUpdate,
         tenant_id: int
     ) -> ProposalResponse:
         """Update an existing proposal."""
-        proposal = self.queries.get_proposal_by_id(proposal_id, tenant_id)
+        proposal = await self.queries.get_proposal_by_id(proposal_id, tenant_id)
 
         if not proposal:
             raise not_found_error("Proposal", proposal_id)
@@ -88,33 +112,33 @@ class ProposalController:
         update_data = proposal_update.model_dump(exclude_unset=True)
 
         # Use service for business validation
-        updated_proposal = self.proposal_service.update_proposal_with_validation(proposal, update_data)
+        updated_proposal = await self.proposal_service.update_proposal_with_validation(proposal, update_data)
 
         return ProposalResponse.model_validate(updated_proposal)
 
-    def delete_proposal(
+    async def delete_proposal(
         self,
         proposal_id: int,
         tenant_id: int
     ) -> dict:
         """Delete a proposal."""
-        proposal = self.queries.get_proposal_by_id(proposal_id, tenant_id)
+        proposal = await self.queries.get_proposal_by_id(proposal_id, tenant_id)
 
         if not proposal:
             raise not_found_error("Proposal", proposal_id)
 
-        self.queries.delete_proposal(proposal)
+        await self.queries.delete_proposal(proposal)
         return deletion_success("Proposal")
 
-    def get_proposal_statistics(
+    async def get_proposal_statistics(
         self,
         tenant_id: int
     ) -> dict:
         """Get proposal statistics for tenant."""
         # Use service for business logic
-        return self.proposal_service.get_proposal_statistics(tenant_id)
+        return await self.proposal_service.get_proposal_statistics(tenant_id)
 
-    def duplicate_proposal(
+    async def duplicate_proposal(
         self,
         proposal_id: int,
         new_opportunity_id: int,
@@ -122,12 +146,12 @@ class ProposalController:
     ) -> ProposalResponse:
         """Duplicate an existing proposal for a new opportunity."""
         # Use service for business logic
-        duplicated_proposal = self.proposal_service.duplicate_proposal(
+        duplicated_proposal = await self.proposal_service.duplicate_proposal(
             proposal_id, tenant_id, new_opportunity_id
         )
         return ProposalResponse.model_validate(duplicated_proposal)
 
-    def export_proposal(
+    async def export_proposal(
         self,
         proposal_id: int,
         tenant_id: int,
@@ -135,16 +159,16 @@ class ProposalController:
     ) -> dict:
         """Export proposal in different formats."""
         # Use service for business logic
-        return self.proposal_service.export_proposal(proposal_id, tenant_id, format)
+        return await self.proposal_service.export_proposal(proposal_id, tenant_id, format)
 
-    def get_proposal_by_opportunity(
+    async def get_proposal_by_opportunity(
         self,
         opportunity_id: int,
         tenant_id: int
     ) -> Optional[ProposalResponse]:
         """Get proposal by opportunity ID."""
         # Use queries directly for simple reads
-        proposal = self.queries.get_proposal_by_opportunity_id(opportunity_id, tenant_id)
+        proposal = await self.queries.get_proposal_by_opportunity_id(opportunity_id, tenant_id)
 
         if not proposal:
             return None
@@ -0,0 +1,21 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from services.search_service import SearchService
+from schemas.search import SearchEntityType, SearchResponse
+from typing import List, Optional
+
+class SearchController:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.search_service = SearchService(db)
+
+    async def search(
+        self,
+        tenant_id: int,
+        q: str,
+        types: Optional[List[SearchEntityType]] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> SearchResponse:
+        """Search opportunities, proposals, contacts, companies and posts."""
+        result = await self.search_service.search(tenant_id, q, types, skip, limit)
+        return SearchResponse(**result)
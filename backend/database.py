@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from pydantic_settings import BaseSettings
@@ -12,16 +14,91 @@ class Settings(BaseSettings):
     auth0_domain: str = os.getenv("AUTH0_DOMAIN", "")
     auth0_api_audience: str = os.getenv("AUTH0_API_AUDIENCE", "")
     auth0_algorithms: str = os.getenv("AUTH0_ALGORITHMS", "RS256")
+    # Defaults to https://<AUTH0_DOMAIN>/.well-known/jwks.json; override to point at a local JWKS stub
+    auth0_jwks_url: str = os.getenv("AUTH0_JWKS_URL", "")
+    auth0_jwks_ttl_seconds: float = float(os.getenv("AUTH0_JWKS_TTL_SECONDS", "600"))
+    auth0_jwks_unknown_kid_ttl_seconds: float = float(os.getenv("AUTH0_JWKS_UNKNOWN_KID_TTL_SECONDS", "60"))
+    auth0_jwks_min_refetch_seconds: float = float(os.getenv("AUTH0_JWKS_MIN_REFETCH_SECONDS", "10"))
+    auth0_jwks_timeout_seconds: float = float(os.getenv("AUTH0_JWKS_TIMEOUT_SECONDS", "5"))
+    # Verified tokens kept until they expire so repeat requests skip RSA verification; 0 disables
+    auth0_token_cache_max_entries: int = int(os.getenv("AUTH0_TOKEN_CACHE_MAX_ENTRIES", "10000"))
+    # Resolved user/tenant/role/tenant settings are reused across requests for this long; 0 disables
+    principal_cache_ttl_seconds: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30"))
+    principal_cache_max_entries: int = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
+    openai_base_url: str = os.getenv("OPENAI_BASE_URL", "")
+    openai_timeout_seconds: float = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "60"))
+    openai_deadline_seconds: float = float(os.getenv("OPENAI_DEADLINE_SECONDS", "120"))
+    openai_max_retries: int = int(os.getenv("OPENAI_MAX_RETRIES", "3"))
+    openai_retry_base_seconds: float = float(os.getenv("OPENAI_RETRY_BASE_SECONDS", "0.5"))
+    openai_retry_max_seconds: float = float(os.getenv("OPENAI_RETRY_MAX_SECONDS", "8"))
+    openai_http2: bool = os.getenv("OPENAI_HTTP2", "true").lower() == "true"
+    openai_max_connections: int = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+    openai_max_keepalive_connections: int = int(os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    openai_circuit_failure_threshold: int = int(os.getenv("OPENAI_CIRCUIT_FAILURE_THRESHOLD", "5"))
+    openai_circuit_reset_seconds: float = float(os.getenv("OPENAI_CIRCUIT_RESET_SECONDS", "30"))
     environment: str = os.getenv("ENVIRONMENT", "development")
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    loop_lag_monitor_interval_seconds: float = float(os.getenv("LOOP_LAG_MONITOR_INTERVAL_SECONDS", "0.1"))
     demo_mode: str = os.getenv("DEMO_MODE", "false")
+    ai_cache_ttl_seconds: int = int(os.getenv("AI_CACHE_TTL_SECONDS", "604800"))
+    ai_cache_max_entries: int = int(os.getenv("AI_CACHE_MAX_ENTRIES", "50000"))
+    # Expired and overflow entries are swept once per this many stores in each worker
+    ai_cache_evict_every_stores: int = int(os.getenv("AI_CACHE_EVICT_EVERY_STORES", "100"))
+    ai_batch_default_concurrency: int = int(os.getenv("AI_BATCH_DEFAULT_CONCURRENCY", "8"))
+    ai_batch_max_concurrency: int = int(os.getenv("AI_BATCH_MAX_CONCURRENCY", "32"))
+    ai_batch_rate_per_second: float = float(os.getenv("AI_BATCH_RATE_PER_SECOND", "5"))
+    ai_batch_burst: int = int(os.getenv("AI_BATCH_BURST", "10"))
+    ai_batch_max_posts: int = int(os.getenv("AI_BATCH_MAX_POSTS", "5000"))
+    # Running jobs heartbeat this often; one silent for the stale timeout is resumed by another worker
+    ai_batch_job_heartbeat_seconds: float = float(os.getenv("AI_BATCH_JOB_HEARTBEAT_SECONDS", "15"))
+    ai_batch_job_stale_seconds: float = float(os.getenv("AI_BATCH_JOB_STALE_SECONDS", "60"))
+    ai_prefilter_enabled: bool = os.getenv("AI_PREFILTER_ENABLED", "true").lower() == "true"
+    ai_prefilter_min_score: float = float(os.getenv("AI_PREFILTER_MIN_SCORE", "1.5"))
+    ai_routing_enabled: bool = os.getenv("AI_ROUTING_ENABLED", "true").lower() == "true"
+    ai_routing_max_fast_chars: int = int(os.getenv("AI_ROUTING_MAX_FAST_CHARS", "800"))
+    ai_routing_min_confidence: float = float(os.getenv("AI_ROUTING_MIN_CONFIDENCE", "0.6"))
+    # Comma-separated models tenants may pick as their fast model; each must support JSON mode
+    ai_routing_allowed_fast_models: str = os.getenv("AI_ROUTING_ALLOWED_FAST_MODELS", "gpt-4o-mini,gpt-4o,gpt-3.5-turbo")
+    ai_analysis_prompt_version: str = os.getenv("AI_ANALYSIS_PROMPT_VERSION", "")
+    ai_singleflight_enabled: bool = os.getenv("AI_SINGLEFLIGHT_ENABLED", "true").lower() == "true"
+    ai_singleflight_cross_worker: bool = os.getenv("AI_SINGLEFLIGHT_CROSS_WORKER", "false").lower() == "true"
+    ai_singleflight_lock_wait_seconds: float = float(os.getenv("AI_SINGLEFLIGHT_LOCK_WAIT_SECONDS", "120"))
+    # Connections reserved for cross-worker locks, which are held for a whole AI call
+    ai_singleflight_lock_pool_size: int = int(os.getenv("AI_SINGLEFLIGHT_LOCK_POOL_SIZE", "5"))
+    ai_rate_limit_enabled: bool = os.getenv("AI_RATE_LIMIT_ENABLED", "true").lower() == "true"
+    ai_rate_limit_tenant_requests_per_minute: int = int(os.getenv("AI_RATE_LIMIT_TENANT_REQUESTS_PER_MINUTE", "120"))
+    ai_rate_limit_tenant_tokens_per_minute: int = int(os.getenv("AI_RATE_LIMIT_TENANT_TOKENS_PER_MINUTE", "200000"))
+    ai_rate_limit_user_requests_per_minute: int = int(os.getenv("AI_RATE_LIMIT_USER_REQUESTS_PER_MINUTE", "30"))
+    ai_rate_limit_user_tokens_per_minute: int = int(os.getenv("AI_RATE_LIMIT_USER_TOKENS_PER_MINUTE", "60000"))
+    ai_rate_limit_max_wait_seconds: float = float(os.getenv("AI_RATE_LIMIT_MAX_WAIT_SECONDS", "5"))
+    proposal_checkpoint_interval_seconds: float = float(os.getenv("PROPOSAL_CHECKPOINT_INTERVAL_SECONDS", "5"))
+    proposal_checkpoint_interval_chars: int = int(os.getenv("PROPOSAL_CHECKPOINT_INTERVAL_CHARS", "1000"))
+    search_max_ranked_candidates: int = int(os.getenv("SEARCH_MAX_RANKED_CANDIDATES", "500"))
+    linkedin_batch_max_posts: int = int(os.getenv("LINKEDIN_BATCH_MAX_POSTS", "5000"))
+    linkedin_stream_chunk_size: int = int(os.getenv("LINKEDIN_STREAM_CHUNK_SIZE", "1000"))
+    # When set, downloads are handed to nginx with X-Accel-Redirect to this internal location
+    # (e.g. /protected-uploads) so it sends the file itself; empty streams from the app
+    file_download_accel_redirect_prefix: str = os.getenv("FILE_DOWNLOAD_ACCEL_REDIRECT_PREFIX", "")
+    linkedin_stream_max_line_bytes: int = int(os.getenv("LINKEDIN_STREAM_MAX_LINE_BYTES", "1048576"))
+    auto_analysis_min_confidence: float = float(os.getenv("AUTO_ANALYSIS_MIN_CONFIDENCE", "0.7"))
+    auto_analysis_max_attempts: int = int(os.getenv("AUTO_ANALYSIS_MAX_ATTEMPTS", "5"))
+    auto_analysis_backoff_seconds: float = float(os.getenv("AUTO_ANALYSIS_BACKOFF_SECONDS", "30"))
+    auto_analysis_max_backoff_seconds: float = float(os.getenv("AUTO_ANALYSIS_MAX_BACKOFF_SECONDS", "3600"))
+    auto_analysis_visibility_timeout_seconds: int = int(os.getenv("AUTO_ANALYSIS_VISIBILITY_TIMEOUT_SECONDS", "300"))
+    auto_analysis_worker_concurrency: int = int(os.getenv("AUTO_ANALYSIS_WORKER_CONCURRENCY", "4"))
+    auto_analysis_poll_interval_seconds: float = float(os.getenv("AUTO_ANALYSIS_POLL_INTERVAL_SECONDS", "2"))
 
     class Config:
         env_file = ".env"
 
 settings = Settings()
 
+def get_async_database_url(database_url: str) -> str:
+    """Point a postgresql:// URL at the asyncpg driver."""
+    return make_url(database_url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+# Synchronous engine for Alembic migrations and scripts such as seed_data.py
 engine = create_engine(
     settings.database_url,
     pool_size=10,
@@ -32,11 +109,31 @@ engine = create_engine(
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine used by the API so database round trips do not block the event loop
+async_engine = create_async_engine(
+    get_async_database_url(settings.database_url),
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    echo=settings.environment == "development"
+)
+
+# Separate pool for session-level advisory locks: each holds its connection for as long as the
+# guarded call runs, which would otherwise starve request handlers of connections
+lock_engine = create_async_engine(
+    get_async_database_url(settings.database_url),
+    pool_size=settings.ai_singleflight_lock_pool_size,
+    max_overflow=0,
+    pool_timeout=1,
+    pool_pre_ping=True,
+    echo=settings.environment == "development"
+)
+
+# expire_on_commit=False: attribute access after commit would otherwise trigger implicit IO
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+async def get_db():
+    async with AsyncSessionLocal() as db:
+        yield db
\ No newline at end of file
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Load test for the AI endpoints
+Drives analyze-opportunity, its stream, and proposal generation at a fixed concurrency
+against a running API and reports throughput, latency percentiles, errors and the
+API's event-loop lag. Pair it with openai_stub.py so no real tokens are spent:
+  python openai_stub.py --port 8099 &
+  OPENAI_BASE_URL=http://localhost:8099/v1 OPENAI_API_KEY=stub DEMO_MODE=true uvicorn main:app --port 8000 &
+  python load_test_ai.py --scenario all --concurrency 32 --requests 500
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import httpx
+
+SCENARIOS = {
+    "analyze": ("/api/ai/analyze-opportunity", "post", False),
+    "analyze-stream": ("/api/ai/analyze-opportunity/stream", "post", True),
+    "proposal": ("/api/ai/generate-proposal", "opportunity", False),
+    "proposal-stream": ("/api/ai/generate-proposal/stream", "opportunity", True),
+}
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def format_ms(seconds: Optional[float]) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.0f}ms"
+
+async def fetch_ids(client: httpx.AsyncClient, path: str) -> List[int]:
+    response = await client.get(path, params={"limit": 100})
+    response.raise_for_status()
+    return [row["id"] for row in response.json()]
+
+async def run_scenario(client: httpx.AsyncClient, name: str, ids: List[int], concurrency: int, total: int) -> Dict:
+    """Send `total` requests with at most `concurrency` in flight; return timings and status counts."""
+    path, kind, streaming = SCENARIOS[name]
+    latencies: List[float] = []
+    first_event: List[float] = []
+    statuses: Counter = Counter()
+    counter = iter(range(total))
+
+    def body(index: int) -> dict:
+        target = ids[index % len(ids)]
+        if kind == "post":
+            # Skip the cache and pre-screen so every request reaches the model
+            return {"post_id": target, "enable_cache": False, "enable_prefilter": False}
+        return {"opportunity_id": target}
+
+    async def one(index: int) -> None:
+        started = time.perf_counter()
+        try:
+            if streaming:
+                async with client.stream("POST", path, json=body(index)) as response:
+                    seen_event = False
+                    async for chunk in response.aiter_bytes():
+                        if not seen_event and chunk.strip():
+                            seen_event = True
+                            first_event.append(time.perf_counter() - started)
+                    status = response.status_code
+            else:
+                response = await client.post(path, json=body(index))
+                status = response.status_code
+        except httpx.HTTPError as e:
+            status = e.__class__.__name__
+        statuses[status] += 1
+        if status == 200:
+            latencies.append(time.perf_counter() - started)
+
+    async def worker() -> None:
+        for index in counter:
+            await one(index)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {"elapsed": elapsed, "latencies": latencies, "first_event": first_event, "statuses": statuses}
+
+def report(name: str, result: Dict, total: int) -> None:
+    latencies = result["latencies"]
+    print(f"\n📊 {name}: {total} requests in {result['elapsed']:.1f}s "
+          f"({total / result['elapsed']:.1f} req/s, {len(latencies) / result['elapsed']:.1f} ok/s)")
+    print(f"   latency p50 {format_ms(percentile(latencies, 0.50))}  "
+          f"p95 {format_ms(percentile(latencies, 0.95))}  p99 {format_ms(percentile(latencies, 0.99))}")
+    if result["first_event"]:
+        print(f"   first event p50 {format_ms(percentile(result['first_event'], 0.50))}  "
+              f"p95 {format_ms(percentile(result['first_event'], 0.95))}")
+    print(f"   statuses: {dict(result['statuses'])}")
+
+async def main(args) -> bool:
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, headers=headers, limits=limits, timeout=args.timeout) as client:
+        post_ids = args.post_ids or await fetch_ids(client, "/api/linkedin/posts")
+        opportunity_ids = args.opportunity_ids or await fetch_ids(client, "/api/opportunities/")
+
+        names = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+        all_ok = True
+        for name in names:
+            ids = post_ids if SCENARIOS[name][1] == "post" else opportunity_ids
+            if not ids:
+                print(f"⚠️  {name}: no {SCENARIOS[name][1]}s to target, skipped")
+                continue
+            result = await run_scenario(client, name, ids, args.concurrency, args.requests)
+            report(name, result, args.requests)
+            all_ok = all_ok and result["statuses"].get(200, 0) > 0
+
+        health = (await client.get("/health")).json()
+        lag = health.get("event_loop_lag")
+        if lag:
+            print(f"\n⏱️  API event-loop lag over the last {lag.get('window_seconds')}s: "
+                  f"p50 {lag.get('p50_ms')}ms  p99 {lag.get('p99_ms')}ms  max {lag.get('max_ms')}ms")
+        else:
+            print("\n⏱️  API event-loop lag not reported (LOOP_LAG_MONITOR_INTERVAL_SECONDS=0?)")
+        return all_ok
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the AI endpoints")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--scenario", choices=[*SCENARIOS, "all"], default="all")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--token", default="", help="bearer token; not needed with DEMO_MODE=true")
+    parser.add_argument("--post-ids", type=int, nargs="*", default=[])
+    parser.add_argument("--opportunity-ids", type=int, nargs="*", default=[])
+    parser.add_argument("--timeout", type=float, default=180)
+    args = parser.parse_args()
+
+    sys.exit(0 if asyncio.run(main(args)) else 1)
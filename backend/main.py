@@ -1,7 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 import logging
 from database import settings
+from utils.openai_client import close_openai_client
+from utils.loop_monitor import LoopLagMonitor
+from middleware.auth import DEMO_MODE, auth0_bearer
+from services.principal_resolver import principal_resolver
+from services.analysis_job_service import AnalysisJobRecovery
 
 from routers import (
     auth,
@@ -13,16 +19,42 @@ from routers import (
     proposals,
     campaigns,
     files,
-    dashboard
+    dashboard,
+    search
 )
 
 logging.basicConfig(level=getattr(logging, settings.log_level))
 logger = logging.getLogger(__name__)
 
+# Samples event-loop lag so blocking work in request handlers shows up in /health
+loop_monitor = (
+    LoopLagMonitor(settings.loop_lag_monitor_interval_seconds)
+    if settings.loop_lag_monitor_interval_seconds > 0 else None
+)
+
+# Picks up bulk analysis jobs left unfinished by a worker that stopped
+job_recovery = AnalysisJobRecovery()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if loop_monitor:
+        loop_monitor.start()
+    # Fetch signing keys before the first request and refresh them ahead of Auth0 key rotations
+    if not DEMO_MODE and (settings.auth0_domain or settings.auth0_jwks_url):
+        auth0_bearer.jwks.start()
+    job_recovery.start()
+    yield
+    await job_recovery.stop()
+    if loop_monitor:
+        await loop_monitor.stop()
+    await auth0_bearer.jwks.stop()
+    await close_openai_client()
+
 app = FastAPI(
     title="MapMyClient API",
     description="API for MapMyClient - Turn LinkedIn posts into qualified opportunities",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -43,6 +75,7 @@ app.include_router(contacts.router, prefix="/api/contacts", tags=["Contacts"])
 app.include_router(proposals.router, prefix="/api/proposals", tags=["Proposals"])
 app.include_router(campaigns.router, prefix="/api/campaigns", tags=["Campaigns"])
 app.include_router(files.router, prefix="/api/files", tags=["Files"])
+app.include_router(search.router, prefix="/api/search", tags=["Search"])
 
 @app.get("/")
 async def root():
@@ -50,7 +83,14 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "environment": settings.environment}
+    health = {"status": "healthy", "environment": settings.environment}
+    if loop_monitor:
+        health["event_loop_lag"] = loop_monitor.snapshot()
+    health["principal_cache"] = principal_resolver.stats()
+    if not DEMO_MODE:
+        health["jwks"] = auth0_bearer.jwks.snapshot()
+        health["token_cache"] = auth0_bearer.token_cache.stats()
+    return health
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,9 +1,13 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
-import httpx
 from typing import Optional, Dict, Any
-from database import settings
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import settings, get_db
+from services.principal_resolver import Principal, principal_resolver
+from utils.jwks import JWKSManager
+from utils.token_cache import VerifiedTokenCache
+from utils.response_helpers import service_unavailable_error
 import logging
 import os
 
@@ -19,34 +23,31 @@ class Auth0JWTBearer:
         self.domain = settings.auth0_domain
         self.api_audience = settings.auth0_api_audience
         self.algorithms = [settings.auth0_algorithms]
-        self.jwks_client = None
-        self.jwks = None
-
-    async def get_jwks(self):
-        if not self.jwks:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"https://{self.domain}/.well-known/jwks.json")
-                self.jwks = response.json()
-        return self.jwks
+        self.jwks = JWKSManager(
+            settings.auth0_jwks_url or f"https://{self.domain}/.well-known/jwks.json",
+            settings.auth0_algorithms,
+            ttl_seconds=settings.auth0_jwks_ttl_seconds,
+            unknown_kid_ttl_seconds=settings.auth0_jwks_unknown_kid_ttl_seconds,
+            min_refetch_seconds=settings.auth0_jwks_min_refetch_seconds,
+            timeout_seconds=settings.auth0_jwks_timeout_seconds
+        )
+        self.token_cache = VerifiedTokenCache(settings.auth0_token_cache_max_entries)
 
     async def verify_token(self, token: str) -> Dict[str, Any]:
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            claims, kid = cached
+            # Tokens signed by a key that has since been retired go through full verification again
+            if self.jwks.has_key(kid):
+                return claims
+            self.token_cache.discard(token)
+
         try:
-            jwks = await self.get_jwks()
             unverified_header = jwt.get_unverified_header(token)
+            kid = unverified_header.get("kid")
+            key = await self.jwks.get_key(kid) if kid else None
 
-            rsa_key = {}
-            for key in jwks["keys"]:
-                if key["kid"] == unverified_header["kid"]:
-                    rsa_key = {
-                        "kty": key["kty"],
-                        "kid": key["kid"],
-                        "use": key["use"],
-                        "n": key["n"],
-                        "e": key["e"]
-                    }
-                    break
-
-            if not rsa_key:
+            if key is None:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Unable to find appropriate key"
@@ -54,14 +55,17 @@ class Auth0JWTBearer:
 
             payload = jwt.decode(
                 token,
-                rsa_key,
+                key,
                 algorithms=self.algorithms,
                 audience=self.api_audience,
                 issuer=f"https://{self.domain}/"
             )
 
+            self.token_cache.put(token, payload, kid)
             return payload
 
+        except HTTPException:
+            raise
         except JWTError as e:
             logger.error(f"JWT verification failed: {e}")
             raise HTTPException(
@@ -70,9 +74,9 @@ class Auth0JWTBearer:
             )
         except Exception as e:
             logger.error(f"Unexpected error during token verification: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Authentication service unavailable"
+            raise service_unavailable_error(
+                "Authentication service unavailable",
+                int(settings.auth0_jwks_min_refetch_seconds) or 1
             )
 
 auth0_bearer = Auth0JWTBearer()
@@ -108,6 +112,17 @@ async def get_current_tenant_id(current_user: Dict[str, Any] = Depends(get_curre
         )
     return tenant_id
 
+async def get_current_user_id(current_user: Dict[str, Any] = Depends(get_current_user)) -> str:
+    """Auth0 subject of the caller, used to key per-user limits."""
+    return current_user["sub"]
+
+async def get_current_principal(
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> Principal:
+    """The caller's user, tenant, role and tenant settings, from the principal cache when fresh."""
+    return await principal_resolver.resolve(db, current_user)
+
 class TenantFilter:
     def __init__(self, tenant_id: int = Depends(get_current_tenant_id)):
         self.tenant_id = tenant_id
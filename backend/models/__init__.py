@@ -9,6 +9,11 @@ from models.proposal import Proposal, ProposalStatus
 from models.campaign import Campaign
 from models.campaign_note import CampaignNote
 from models.proposal_file import ProposalFile
+from models.ai_analysis_cache import AIAnalysisCache
+from models.dashboard_daily_count import DashboardDailyCount
+from models.analysis_queue import AnalysisQueueItem, AnalysisQueueStatus
+from models.ai_rate_limit_bucket import AIRateLimitBucket
+from models.analysis_job import AnalysisJob, AnalysisJobItem, AnalysisJobStatus, AnalysisJobItemStatus
 
 __all__ = [
     "BaseModel",
@@ -23,5 +28,14 @@ __all__ = [
     "ProposalStatus",
     "Campaign",
     "CampaignNote",
-    "ProposalFile"
+    "ProposalFile",
+    "AIAnalysisCache",
+    "AnalysisJob",
+    "AnalysisJobItem",
+    "AnalysisJobStatus",
+    "AnalysisJobItemStatus",
+    "DashboardDailyCount",
+    "AnalysisQueueItem",
+    "AnalysisQueueStatus",
+    "AIRateLimitBucket"
 ]
\ No newline at end of file
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, Integer, JSON, DateTime
+from sqlalchemy.sql import func
+from models.base import BaseModel
+
+class AIAnalysisCache(BaseModel):
+    __tablename__ = "ai_analysis_cache"
+
+    cache_key = Column(String(64), nullable=False, unique=True, index=True)
+    prompt_version = Column(String(50), nullable=False)
+    model = Column(String(100), nullable=False)
+    result = Column(JSON, nullable=False)
+    hit_count = Column(Integer, default=0, nullable=False)
+    last_accessed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from models.base import BaseModel
+
+class AIRateLimitBucket(BaseModel):
+    """Token-bucket levels for a tenant's or user's AI calls, shared by every API process and worker."""
+    __tablename__ = "ai_rate_limit_buckets"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "subject", name="uq_ai_rate_limit_buckets_subject"),
+    )
+
+    tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    # "tenant" for the tenant-wide bucket, "user:<auth0 sub>" for a user's own bucket
+    subject = Column(String(255), nullable=False)
+    # Levels as of updated_at; refilled lazily from the elapsed time on each take
+    requests = Column(Float, nullable=False)
+    tokens = Column(Float, nullable=False)
+
+    tenant = relationship("Tenant")
@@ -0,0 +1,58 @@
+from sqlalchemy import Column, Integer, ForeignKey, Text, Enum, JSON, DateTime, Boolean, Index, text
+from sqlalchemy.orm import relationship
+from models.base import BaseModel
+import enum
+
+class AnalysisJobStatus(enum.Enum):
+    PENDING = "Pending"
+    RUNNING = "Running"
+    COMPLETED = "Completed"
+    FAILED = "Failed"
+
+class AnalysisJobItemStatus(enum.Enum):
+    PENDING = "Pending"
+    RUNNING = "Running"
+    SUCCEEDED = "Succeeded"
+    FAILED = "Failed"
+
+class AnalysisJob(BaseModel):
+    __tablename__ = "analysis_jobs"
+    __table_args__ = (
+        # Recovery only ever scans unfinished jobs for a stale heartbeat
+        Index("ix_analysis_jobs_heartbeat_at", "heartbeat_at", postgresql_where=text("status IN ('PENDING', 'RUNNING')")),
+    )
+
+    tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False, index=True)
+    status = Column(Enum(AnalysisJobStatus), default=AnalysisJobStatus.PENDING, nullable=False)
+    total_items = Column(Integer, default=0, nullable=False)
+    completed_items = Column(Integer, default=0, nullable=False)
+    failed_items = Column(Integer, default=0, nullable=False)
+    concurrency = Column(Integer, nullable=False)
+    enable_cache = Column(Boolean, default=True, nullable=False)
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    # Refreshed by the worker running the job; a stale one means that worker is gone
+    heartbeat_at = Column(DateTime(timezone=True))
+    error = Column(Text)
+
+    tenant = relationship("Tenant")
+    items = relationship("AnalysisJobItem", back_populates="job", cascade="all, delete-orphan")
+
+class AnalysisJobItem(BaseModel):
+    __tablename__ = "analysis_job_items"
+    __table_args__ = (
+        Index("ix_analysis_job_items_job_id_status", "job_id", "status"),
+    )
+
+    tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    job_id = Column(Integer, ForeignKey("analysis_jobs.id", ondelete="CASCADE"), nullable=False)
+    post_id = Column(Integer, ForeignKey("linkedin_posts.id", ondelete="CASCADE"), nullable=False, index=True)
+    status = Column(Enum(AnalysisJobItemStatus), default=AnalysisJobItemStatus.PENDING, nullable=False)
+    result = Column(JSON)
+    error = Column(Text)
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+    tenant = relationship("Tenant")
+    job = relationship("AnalysisJob", back_populates="items")
+    post = relationship("LinkedInPost")
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, ForeignKey, Text, Enum, JSON, DateTime, Index, text
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from models.base import BaseModel
+import enum
+
+class AnalysisQueueStatus(enum.Enum):
+    PENDING = "Pending"
+    RUNNING = "Running"
+    SUCCEEDED = "Succeeded"
+    DEAD = "Dead"
+
+class AnalysisQueueItem(BaseModel):
+    """A post waiting for, or finished with, automatic analysis; claimed by workers with SKIP LOCKED."""
+    __tablename__ = "analysis_queue"
+    __table_args__ = (
+        Index("ix_analysis_queue_tenant_id_status", "tenant_id", "status"),
+        # Workers only ever scan pending rows that are due
+        Index("ix_analysis_queue_available_at", "available_at", postgresql_where=text("status = 'PENDING'")),
+        Index("ix_analysis_queue_locked_at", "locked_at", postgresql_where=text("status = 'RUNNING'")),
+    )
+
+    tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    post_id = Column(Integer, ForeignKey("linkedin_posts.id", ondelete="CASCADE"), nullable=False, unique=True)
+    status = Column(Enum(AnalysisQueueStatus), default=AnalysisQueueStatus.PENDING, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    # Earliest time a worker may pick the item up; pushed out by retry backoff
+    available_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    locked_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+    result = Column(JSON)
+    opportunity_id = Column(Integer, ForeignKey("opportunities.id", ondelete="SET NULL"))
+    finished_at = Column(DateTime(timezone=True))
+
+    tenant = relationship("Tenant")
+    post = relationship("LinkedInPost")
+    opportunity = relationship("Opportunity")
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, Index, desc
 from sqlalchemy.orm import relationship
 from models.base import BaseModel
 
 class Campaign(BaseModel):
     __tablename__ = "campaigns"
+    __table_args__ = (
+        Index("ix_campaigns_tenant_id_created_at", "tenant_id", desc("created_at")),
+        Index("ix_campaigns_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
 
     tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)
@@ -1,9 +1,16 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, DateTime, Boolean
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, DateTime, Boolean, Index, desc, text
 from sqlalchemy.orm import relationship
 from models.base import BaseModel
 
 class CampaignNote(BaseModel):
     __tablename__ = "campaign_notes"
+    __table_args__ = (
+        Index("ix_campaign_notes_tenant_id_created_at", "tenant_id", desc("created_at")),
+        Index("ix_campaign_notes_tenant_id_campaign_id_created_at", "tenant_id", "campaign_id", desc("created_at")),
+        Index("ix_campaign_notes_tenant_id_opportunity_id_created_at", "tenant_id", "opportunity_id", desc("created_at")),
+        # Overdue follow-ups only ever look at open notes
+        Index("ix_campaign_notes_tenant_id_follow_up_at", "tenant_id", "follow_up_at", postgresql_where=text("NOT completed")),
+    )
 
     tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     campaign_id = Column(Integer, ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False)
@@ -1,14 +1,22 @@
-from sqlalchemy import Column, String, Integer, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from models.base import BaseModel
 
 class Company(BaseModel):
     __tablename__ = "companies"
+    __table_args__ = (
+        Index("ix_companies_tenant_id_domain", "tenant_id", "domain"),
+        Index("ix_companies_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_companies_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
 
     tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False, index=True)
     domain = Column(String(255))
     linkedin_url = Column(String(512))
+    # Maintained by a database trigger from name and domain
+    search_vector = deferred(Column(TSVECTOR))
 
     tenant = relationship("Tenant", back_populates="companies")
     contacts = relationship("Contact", back_populates="company", cascade="all, delete-orphan")
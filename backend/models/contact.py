@@ -1,16 +1,26 @@
-from sqlalchemy import Column, String, Integer, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from models.base import BaseModel
 
 class Contact(BaseModel):
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_tenant_id_email", "tenant_id", "email"),
+        Index("ix_contacts_tenant_id_linkedin_profile_url", "tenant_id", "linkedin_profile_url"),
+        Index("ix_contacts_tenant_id_company_id", "tenant_id", "company_id"),
+        Index("ix_contacts_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_contacts_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
 
     tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     company_id = Column(Integer, ForeignKey("companies.id", ondelete="SET NULL"))
     name = Column(String(255), nullable=False)
-    email = Column(String(255), index=True)
+    email = Column(String(255))
     phone = Column(String(50))
-    linkedin_profile_url = Column(String(512), index=True)
+    linkedin_profile_url = Column(String(512))
+    # Maintained by a database trigger from name and email
+    search_vector = deferred(Column(TSVECTOR))
 
     tenant = relationship("Tenant")
     company = relationship("Company", back_populates="contacts")
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, Integer, ForeignKey, Date, UniqueConstraint
+from sqlalchemy.orm import relationship
+from models.base import BaseModel
+
+class DashboardDailyCount(BaseModel):
+    """Per-tenant, per-day row counts by entity and status, maintained by database triggers."""
+    __tablename__ = "dashboard_daily_counts"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "entity", "day", "status", name="uq_dashboard_daily_counts_key"),
+    )
+
+    tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    entity = Column(String(32), nullable=False)
+    # UTC calendar day of the counted rows' created_at
+    day = Column(Date, nullable=False)
+    # Status enum name, or empty for entities without a status
+    status = Column(String(32), default="", server_default="", nullable=False)
+    count = Column(Integer, default=0, nullable=False)
+
+    tenant = relationship("Tenant")
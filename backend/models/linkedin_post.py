@@ -1,19 +1,24 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, DateTime, UniqueConstraint
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, DateTime, UniqueConstraint, Index, desc
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from models.base import BaseModel
 
 class LinkedInPost(BaseModel):
     __tablename__ = "linkedin_posts"
     __table_args__ = (
         UniqueConstraint('tenant_id', 'post_url', name='uq_tenant_post_url'),
+        Index("ix_linkedin_posts_tenant_id_created_at", "tenant_id", desc("created_at")),
+        Index("ix_linkedin_posts_search_vector", "search_vector", postgresql_using="gin"),
     )
 
     tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"))
-    post_url = Column(String(512), nullable=False, index=True)
+    post_url = Column(String(512), nullable=False)
     author_profile_url = Column(String(512))
     content = Column(Text)
     scraped_at = Column(DateTime(timezone=True), nullable=False)
+    # Maintained by a database trigger from content
+    search_vector = deferred(Column(TSVECTOR))
 
     tenant = relationship("Tenant", back_populates="linkedin_posts")
     user = relationship("User", back_populates="linkedin_posts")
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum, JSON, Index, desc
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from models.base import BaseModel
 import enum
 
@@ -12,15 +13,22 @@ class OpportunityStatus(enum.Enum):
 
 class Opportunity(BaseModel):
     __tablename__ = "opportunities"
+    __table_args__ = (
+        Index("ix_opportunities_tenant_id_status", "tenant_id", "status"),
+        Index("ix_opportunities_tenant_id_created_at", "tenant_id", desc("created_at")),
+        Index("ix_opportunities_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     company_id = Column(Integer, ForeignKey("companies.id", ondelete="SET NULL"))
     contact_id = Column(Integer, ForeignKey("contacts.id", ondelete="SET NULL"))
-    source_post_id = Column(Integer, ForeignKey("linkedin_posts.id", ondelete="SET NULL"))
+    source_post_id = Column(Integer, ForeignKey("linkedin_posts.id", ondelete="SET NULL"), index=True)
     title = Column(String(255), nullable=False)
     summary = Column(Text)
     status = Column(Enum(OpportunityStatus), default=OpportunityStatus.DRAFT, nullable=False)
     tags = Column(JSON, default=list)
+    # Maintained by a database trigger from title and summary
+    search_vector = deferred(Column(TSVECTOR))
 
     tenant = relationship("Tenant", back_populates="opportunities")
     company = relationship("Company", back_populates="opportunities")
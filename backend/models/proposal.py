@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, ForeignKey, Text, Enum, Index, desc
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from models.base import BaseModel
 import enum
 
@@ -12,11 +13,18 @@ class ProposalStatus(enum.Enum):
 
 class Proposal(BaseModel):
     __tablename__ = "proposals"
+    __table_args__ = (
+        Index("ix_proposals_tenant_id_status", "tenant_id", "status"),
+        Index("ix_proposals_tenant_id_created_at", "tenant_id", desc("created_at")),
+        Index("ix_proposals_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     opportunity_id = Column(Integer, ForeignKey("opportunities.id", ondelete="CASCADE"), nullable=False, unique=True)
     content = Column(Text, nullable=False)
     status = Column(Enum(ProposalStatus), default=ProposalStatus.DRAFT, nullable=False)
+    # Maintained by a database trigger from content
+    search_vector = deferred(Column(TSVECTOR))
 
     tenant = relationship("Tenant", back_populates="proposals")
     opportunity = relationship("Opportunity", back_populates="proposal")
@@ -1,14 +1,20 @@
-from sqlalchemy import Column, String, Integer, ForeignKey
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from models.base import BaseModel
 
 class ProposalFile(BaseModel):
     __tablename__ = "proposal_files"
+    __table_args__ = (
+        Index("ix_proposal_files_tenant_id_proposal_id", "tenant_id", "proposal_id"),
+        Index("ix_proposal_files_tenant_id_filename", "tenant_id", "filename"),
+    )
 
     tenant_id = Column(Integer, ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     proposal_id = Column(Integer, ForeignKey("proposals.id", ondelete="CASCADE"), nullable=False)
     filename = Column(String(255), nullable=False)
     size = Column(Integer, nullable=False)
+    # Hex SHA-256 of the content, computed while the upload is written; NULL for older files
+    sha256 = Column(String(64))
     url = Column(String(512), nullable=False)
 
     tenant = relationship("Tenant")
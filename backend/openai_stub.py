@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Local OpenAI-compatible stub for load testing the AI endpoints without spending tokens
+Serves POST /v1/chat/completions, plain and streamed, with a canned answer per prompt
+module, configurable latency and injected errors.
+Run with: python openai_stub.py --port 8099 --latency lognormal:1500:0.4 --error 500:0.01
+Point the API at it with OPENAI_BASE_URL=http://localhost:8099/v1 OPENAI_API_KEY=stub
+
+Latency specs (milliseconds, time until the first byte):
+  fixed:MS  uniform:MIN:MAX  lognormal:MEDIAN:SIGMA
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from typing import Dict, List, Tuple
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from prompts import linkedin_analysis, opportunity_analysis, proposal_generation
+from prompts.registry import list_versions
+from utils.token_counter import count_tokens, count_message_tokens
+
+OPPORTUNITY_ANALYSIS = {
+    "is_opportunity": True,
+    "confidence": 0.86,
+    "extracted_fields": {
+        "title": {"value": "React developer for customer dashboard", "confidence": 0.9},
+        "summary": {"value": "A startup needs a freelance React developer to ship a dashboard in six weeks.", "confidence": 0.85},
+        "problem": {"value": "No frontend capacity for the dashboard project", "confidence": 0.7},
+        "scope": {"value": "Build and ship a customer-facing analytics dashboard", "confidence": 0.75},
+        "skills_required": {"value": ["React", "TypeScript", "Charting"], "confidence": 0.8}
+    },
+    "company_suggestion": {"name": {"value": "Acme Analytics", "confidence": 0.7}, "domain": "acme.io", "linkedin_url": None},
+    "contact_suggestion": {"name": {"value": "Jordan Lee", "confidence": 0.6}, "email": None, "phone": None, "linkedin_profile_url": None},
+    "category": "development",
+    "urgency": "normal",
+    "tags": ["react", "frontend", "dashboard"],
+    "budget_range": {"value": "Not mentioned", "confidence": 0.2},
+    "timeline": {"value": "6 weeks", "confidence": 0.8}
+}
+
+LINKEDIN_ANALYSIS = {
+    "opportunity_detected": True,
+    "company_info": {"name": "Acme Analytics", "domain": "acme.io"},
+    "contact_info": {"name": "Jordan Lee", "role": "Founder"},
+    "opportunity_details": {"title": "React developer", "summary": "Dashboard build", "requirements": ["React"]},
+    "urgency": "Medium",
+    "classification": ["development"],
+    "confidence_score": 0.86
+}
+
+PROPOSAL_SECTIONS = [
+    "Executive Summary", "Understanding of Requirements", "Proposed Solution",
+    "Timeline and Milestones", "Investment", "Why Choose Us", "Next Steps"
+]
+PROPOSAL = "\n\n".join(
+    f"## {title}\n\n" + " ".join(["We will deliver a focused, well-tested solution with weekly demos."] * 6)
+    for title in PROPOSAL_SECTIONS
+)
+
+CANNED_BY_SYSTEM_MESSAGE = {
+    **{prompt.system_message: json.dumps(OPPORTUNITY_ANALYSIS) for prompt in list_versions(opportunity_analysis.NAME)},
+    linkedin_analysis.SYSTEM_MESSAGE: json.dumps(LINKEDIN_ANALYSIS),
+    proposal_generation.SYSTEM_MESSAGE: PROPOSAL
+}
+
+# Characters per streamed chunk
+CHARS_PER_TOKEN = 4
+
+# Like the real API, prefixes are cached from 1024 tokens in 128-token steps
+PREFIX_CACHE_MIN_TOKENS = 1024
+PREFIX_CACHE_STEP_TOKENS = 128
+
+def parse_latency(spec: str):
+    """Turn a latency spec into a function returning seconds."""
+    kind, *params = spec.split(":")
+    values = [float(param) for param in params]
+    if kind == "fixed":
+        return lambda: values[0] / 1000
+    if kind == "uniform":
+        return lambda: random.uniform(values[0], values[1]) / 1000
+    if kind == "lognormal":
+        return lambda: random.lognormvariate(math.log(values[0]), values[1]) / 1000
+    raise argparse.ArgumentTypeError(f"Unknown latency spec: {spec}")
+
+def parse_error(spec: str) -> Tuple[int, float]:
+    status, rate = spec.split(":")
+    return int(status), float(rate)
+
+def create_app(args) -> FastAPI:
+    app = FastAPI(title="OpenAI stub")
+    default_latency = parse_latency(args.latency)
+    model_latency: Dict[str, object] = {}
+    for spec in args.model_latency:
+        model, latency = spec.split("=", 1)
+        model_latency[model] = parse_latency(latency)
+    errors: List[Tuple[int, float]] = [parse_error(spec) for spec in args.error]
+    seen_prefixes = set()
+
+    def cached_tokens(system_message: str, model: str) -> int:
+        """Prompt tokens a repeated system message would be served from the provider's prefix cache."""
+        tokens = count_message_tokens([{"role": "system", "content": system_message}], model)
+        if tokens < PREFIX_CACHE_MIN_TOKENS or system_message not in seen_prefixes:
+            seen_prefixes.add(system_message)
+            return 0
+        return tokens // PREFIX_CACHE_STEP_TOKENS * PREFIX_CACHE_STEP_TOKENS
+
+    def completion_id() -> str:
+        return f"chatcmpl-{uuid.uuid4().hex[:24]}"
+
+    def injected_error():
+        roll = random.random()
+        for status, rate in errors:
+            if roll < rate:
+                headers = {"retry-after": str(args.retry_after)} if status == 429 and args.retry_after else {}
+                return JSONResponse(
+                    {"error": {"message": f"Injected {status}", "type": "stub_error", "code": status}},
+                    status_code=status,
+                    headers=headers
+                )
+            roll -= rate
+        return None
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        model = body.get("model", "gpt-4")
+        messages = body.get("messages", [])
+        system_message = next((m["content"] for m in messages if m.get("role") == "system"), "")
+        content = CANNED_BY_SYSTEM_MESSAGE.get(system_message, "{}")
+        prompt_tokens = count_message_tokens(messages, model)
+        completion_tokens = count_tokens(content, model)
+
+        await asyncio.sleep(model_latency.get(model, default_latency)())
+
+        error = injected_error()
+        if error:
+            return error
+
+        if not body.get("stream"):
+            return {
+                "id": completion_id(),
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                    "prompt_tokens_details": {"cached_tokens": cached_tokens(system_message, model)}
+                }
+            }
+
+        async def stream():
+            chunk_id = completion_id()
+            created = int(time.time())
+
+            def chunk(delta: dict, finish_reason=None) -> str:
+                return "data: " + json.dumps({
+                    "id": chunk_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+                }) + "\n\n"
+
+            yield chunk({"role": "assistant", "content": ""})
+            for start in range(0, len(content), CHARS_PER_TOKEN):
+                if args.token_delay_ms:
+                    await asyncio.sleep(args.token_delay_ms / 1000)
+                yield chunk({"content": content[start:start + CHARS_PER_TOKEN]})
+            yield chunk({}, "stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    return app
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", default="lognormal:1500:0.4", help="time to first byte for every model")
+    parser.add_argument("--model-latency", action="append", default=[], metavar="MODEL=SPEC",
+                        help="per-model override, e.g. gpt-4o-mini=lognormal:400:0.3")
+    parser.add_argument("--token-delay-ms", type=float, default=10, help="delay between streamed tokens")
+    parser.add_argument("--error", action="append", default=[], metavar="STATUS:RATE",
+                        help="inject an error status on a fraction of calls, e.g. 429:0.05")
+    parser.add_argument("--retry-after", type=int, default=0, help="Retry-After seconds sent with injected 429s")
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args), host=args.host, port=args.port, log_level="warning")
@@ -1,6 +1,14 @@
-SYSTEM_MESSAGE = "You are an expert at analyzing business opportunities from social media posts. Return only valid JSON."
+from database import settings
+from prompts.registry import PromptVersion, register, get_prompt
 
-USER_PROMPT_TEMPLATE = """Analyze this LinkedIn post for business opportunity potential:
+NAME = "opportunity_analysis"
+
+# Version 1 put the instructions after the post, so consecutive calls shared no prompt prefix
+V1 = register(PromptVersion(
+    name=NAME,
+    version="1",
+    system_message="You are an expert at analyzing business opportunities from social media posts. Return only valid JSON.",
+    user_template="""Analyze this LinkedIn post for business opportunity potential:
 
 POST CONTENT: {post_content}
 AUTHOR PROFILE: {author_profile_url}
@@ -35,9 +43,45 @@ Provide a comprehensive analysis in JSON format with these fields:
 Each extracted_field should have: {{"value": "extracted_value", "confidence": 0.85}}
 
 Return only valid JSON."""
+))
+
+# Version 2 keeps every instruction in the system message, byte-identical across calls, so the
+# provider can reuse its cached prefix; the user turn carries only the post
+V2 = register(PromptVersion(
+    name=NAME,
+    version="2",
+    system_message="""You analyze LinkedIn posts for business opportunities for freelancers and agencies. Reply with one JSON object shaped like:
+{"is_opportunity": bool, "confidence": 0-1,
+ "extracted_fields": {"title": F, "summary": F, "problem": F, "scope": F, "skills_required": F},
+ "company_suggestion": {"name": str, "confidence": 0-1, "domain": str|null, "linkedin_url": str|null} | null,
+ "contact_suggestion": {"name": str|null, "email": str|null, "phone": str|null, "linkedin_profile_url": str|null, "confidence": 0-1} | null,
+ "category": "development"|"consulting"|"design"|"marketing"|"other",
+ "urgency": "urgent"|"normal"|"low",
+ "tags": [str],
+ "budget_range": str|null,
+ "timeline": str|null}
+F is {"value": ..., "confidence": 0-1}: title a brief opportunity title, summary 1-2 sentences, problem what needs solving, scope the project scope, skills_required a list of skills.
+is_opportunity is true when the post contains a business opportunity. Use null for a company or contact the post does not mention, and for budget_range ("$5k-10k", "negotiable") and timeline ("2 weeks", "ASAP") when not stated.""",
+    user_template="""AUTHOR PROFILE: {author_profile_url}
+POST CONTENT: {post_content}"""
+))
+
+DEFAULT_VERSION = V2.version
+
+def active_prompt() -> PromptVersion:
+    """The analysis prompt in use; AI_ANALYSIS_PROMPT_VERSION pins an older version for comparison."""
+    return get_prompt(NAME, settings.ai_analysis_prompt_version or DEFAULT_VERSION)
 
 MODEL_CONFIG = {
     "model": "gpt-4",
     "temperature": 0.3,
     "max_tokens": 2000
-}
\ No newline at end of file
+}
+
+# Used for short posts when model routing is on; the model name is overridable per tenant
+FAST_MODEL_CONFIG = {
+    "model": "gpt-4o-mini",
+    "response_format": {"type": "json_object"},
+    "temperature": 0.3,
+    "max_tokens": 2000
+}
@@ -0,0 +1,27 @@
+from typing import Dict, List, NamedTuple
+
+class PromptVersion(NamedTuple):
+    name: str
+    version: str
+    system_message: str
+    user_template: str
+
+    @property
+    def prompt_id(self) -> str:
+        return f"{self.name}@{self.version}"
+
+_registry: Dict[str, Dict[str, PromptVersion]] = {}
+
+def register(prompt: PromptVersion) -> PromptVersion:
+    _registry.setdefault(prompt.name, {})[prompt.version] = prompt
+    return prompt
+
+def get_prompt(name: str, version: str) -> PromptVersion:
+    """Look up a registered prompt version, raising KeyError for unknown ones."""
+    try:
+        return _registry[name][version]
+    except KeyError:
+        raise KeyError(f"Prompt {name}@{version} is not registered")
+
+def list_versions(name: str) -> List[PromptVersion]:
+    return list(_registry.get(name, {}).values())
@@ -5,6 +5,12 @@ from .auth_queries import AuthQueries
 from .campaign_queries import CampaignQueries
 from .contact_queries import ContactQueries
 from .file_queries import FileQueries
+from .ai_cache_queries import AICacheQueries
+from .analysis_job_queries import AnalysisJobQueries
+from .search_queries import SearchQueries
+from .dashboard_queries import DashboardQueries
+from .analysis_queue_queries import AnalysisQueueQueries
+from .ai_rate_limit_queries import AIRateLimitQueries
 
 __all__ = [
     "LinkedInQueries",
@@ -13,5 +19,11 @@ __all__ = [
     "AuthQueries",
     "CampaignQueries",
     "ContactQueries",
-    "FileQueries"
+    "FileQueries",
+    "AICacheQueries",
+    "AnalysisJobQueries",
+    "SearchQueries",
+    "DashboardQueries",
+    "AnalysisQueueQueries",
+    "AIRateLimitQueries"
 ]
\ No newline at end of file
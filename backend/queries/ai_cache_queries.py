@@ -0,0 +1,75 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update, delete, select, func
+from sqlalchemy.dialects.postgresql import insert
+from models import AIAnalysisCache
+from typing import Optional, Dict, Any
+
+class AICacheQueries:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_and_touch_entry(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a live cached result and record the hit in the same round trip."""
+        statement = (
+            update(AIAnalysisCache)
+            .where(
+                AIAnalysisCache.cache_key == cache_key,
+                AIAnalysisCache.expires_at > func.now()
+            )
+            .values(
+                hit_count=AIAnalysisCache.hit_count + 1,
+                last_accessed_at=func.now()
+            )
+            .returning(AIAnalysisCache.result)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(statement)
+        cached_result = result.scalar_one_or_none()
+        await self.db.commit()
+        return cached_result
+
+    async def upsert_entry(self, entry_data: dict) -> None:
+        """Insert a cache entry, replacing any existing entry with the same key."""
+        statement = insert(AIAnalysisCache).values(**entry_data)
+        statement = statement.on_conflict_do_update(
+            index_elements=[AIAnalysisCache.cache_key],
+            set_={
+                "prompt_version": statement.excluded.prompt_version,
+                "model": statement.excluded.model,
+                "result": statement.excluded.result,
+                "expires_at": statement.excluded.expires_at,
+                "last_accessed_at": func.now(),
+                "updated_at": func.now()
+            }
+        )
+        await self.db.execute(statement)
+        await self.db.commit()
+
+    async def evict_entries(self, max_entries: int) -> int:
+        """Delete expired entries and trim the cache to the most recently used max_entries."""
+        expired = (await self.db.execute(
+            delete(AIAnalysisCache).where(AIAnalysisCache.expires_at <= func.now())
+        )).rowcount
+
+        overflow_ids = (
+            select(AIAnalysisCache.id)
+            .order_by(AIAnalysisCache.last_accessed_at.desc())
+            .offset(max_entries)
+        )
+        overflow = (await self.db.execute(
+            delete(AIAnalysisCache).where(AIAnalysisCache.id.in_(overflow_ids))
+        )).rowcount
+
+        await self.db.commit()
+        return (expired or 0) + (overflow or 0)
+
+    async def get_cache_statistics(self) -> Dict[str, int]:
+        """Get entry count and lifetime hit total for the shared cache."""
+        result = await self.db.execute(
+            select(
+                func.count(AIAnalysisCache.id),
+                func.coalesce(func.sum(AIAnalysisCache.hit_count), 0)
+            )
+        )
+        entries, total_hits = result.one()
+        return {"entries": entries, "total_hits": int(total_hits)}
@@ -0,0 +1,83 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from models import AIRateLimitBucket
+from typing import Optional, List, Dict, Any, NamedTuple
+
+class BucketLimits(NamedTuple):
+    """Capacity and refill rate (per second) of a bucket's request and token dimensions."""
+    request_capacity: float
+    request_rate: float
+    token_capacity: float
+    token_rate: float
+
+def _elapsed_seconds():
+    return func.extract("epoch", func.clock_timestamp() - AIRateLimitBucket.updated_at)
+
+def _refilled(limits: BucketLimits):
+    """Bucket levels refilled for the time since they were last written."""
+    elapsed = _elapsed_seconds()
+    return (
+        func.least(limits.request_capacity, AIRateLimitBucket.requests + limits.request_rate * elapsed),
+        func.least(limits.token_capacity, AIRateLimitBucket.tokens + limits.token_rate * elapsed)
+    )
+
+class AIRateLimitQueries:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def take(self, tenant_id: int, subject: str, limits: BucketLimits, tokens: float) -> bool:
+        """Atomically refill a bucket and take one request plus `tokens` from it; False if it cannot cover them.
+
+        The caller owns the transaction so several buckets can be taken all-or-nothing.
+        """
+        # The insert below seeds an unused bucket unguarded, so a take bigger than the bucket is refused here
+        if limits.request_capacity < 1 or limits.token_capacity < tokens:
+            return False
+
+        requests, available_tokens = _refilled(limits)
+        statement = pg_insert(AIRateLimitBucket).values(
+            tenant_id=tenant_id,
+            subject=subject,
+            requests=limits.request_capacity - 1,
+            tokens=limits.token_capacity - tokens
+        )
+        statement = statement.on_conflict_do_update(
+            constraint="uq_ai_rate_limit_buckets_subject",
+            set_={
+                "requests": requests - 1,
+                "tokens": available_tokens - tokens,
+                "updated_at": func.clock_timestamp()
+            },
+            where=and_(requests >= 1, available_tokens >= tokens)
+        ).returning(AIRateLimitBucket.id)
+
+        result = await self.db.execute(statement)
+        return result.scalar_one_or_none() is not None
+
+    async def get_levels(self, tenant_id: int, subject: str, limits: BucketLimits) -> Optional[Dict[str, float]]:
+        """Current refilled levels of a bucket, or None if it has never been used."""
+        requests, tokens = _refilled(limits)
+        result = await self.db.execute(
+            select(requests, tokens).where(
+                AIRateLimitBucket.tenant_id == tenant_id,
+                AIRateLimitBucket.subject == subject
+            )
+        )
+        row = result.first()
+        return {"requests": float(row[0]), "tokens": float(row[1])} if row else None
+
+    async def adjust_tokens(self, tenant_id: int, subjects: List[str], limits: List[BucketLimits], delta: float) -> None:
+        """Credit (or, when negative, charge) tokens once a call's real usage is known."""
+        for subject, subject_limits in zip(subjects, limits):
+            requests, tokens = _refilled(subject_limits)
+            await self.db.execute(
+                update(AIRateLimitBucket).where(
+                    AIRateLimitBucket.tenant_id == tenant_id,
+                    AIRateLimitBucket.subject == subject
+                ).values(
+                    requests=requests,
+                    tokens=func.least(subject_limits.token_capacity, tokens + delta),
+                    updated_at=func.clock_timestamp()
+                )
+            )
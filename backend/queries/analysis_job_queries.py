@@ -0,0 +1,211 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update, insert, select, exists, func, or_
+from models import AnalysisJob, AnalysisJobItem, AnalysisJobStatus, AnalysisJobItemStatus, AnalysisQueueItem, AnalysisQueueStatus, LinkedInPost, Opportunity
+from datetime import datetime, timezone, timedelta
+from typing import Optional, List, Tuple, Dict, Any
+
+class AnalysisJobQueries:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_job_with_items(self, job_data: dict, post_ids: List[int]) -> AnalysisJob:
+        """Create a job and one pending item per post in a single transaction."""
+        new_job = AnalysisJob(**job_data, total_items=len(post_ids))
+        self.db.add(new_job)
+        await self.db.flush()
+
+        if post_ids:
+            await self.db.execute(
+                insert(AnalysisJobItem),
+                [
+                    {
+                        "tenant_id": new_job.tenant_id,
+                        "job_id": new_job.id,
+                        "post_id": post_id,
+                        "status": AnalysisJobItemStatus.PENDING
+                    }
+                    for post_id in post_ids
+                ]
+            )
+
+        await self.db.commit()
+        await self.db.refresh(new_job)
+        return new_job
+
+    async def get_job_by_id(self, job_id: int, tenant_id: int) -> Optional[AnalysisJob]:
+        """Get a specific job by ID within tenant."""
+        result = await self.db.execute(
+            select(AnalysisJob).where(
+                AnalysisJob.id == job_id,
+                AnalysisJob.tenant_id == tenant_id
+            )
+        )
+        return result.scalars().first()
+
+    async def get_jobs_by_tenant(self, tenant_id: int, skip: int = 0, limit: int = 20) -> List[AnalysisJob]:
+        """Get the most recent jobs for a tenant."""
+        result = await self.db.execute(
+            select(AnalysisJob).where(
+                AnalysisJob.tenant_id == tenant_id
+            ).order_by(AnalysisJob.created_at.desc()).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_job_items(
+        self,
+        job_id: int,
+        tenant_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[AnalysisJobItemStatus] = None
+    ) -> List[AnalysisJobItem]:
+        """Get per-post results for a job with optional status filter."""
+        query = select(AnalysisJobItem).where(
+            AnalysisJobItem.job_id == job_id,
+            AnalysisJobItem.tenant_id == tenant_id
+        )
+
+        if status:
+            query = query.where(AnalysisJobItem.status == status)
+
+        result = await self.db.execute(query.order_by(AnalysisJobItem.id).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_items_finished_since(self, job_id: int, tenant_id: int, since: Optional[datetime]) -> List[AnalysisJobItem]:
+        """Get items that finished at or after a timestamp, oldest first."""
+        query = select(AnalysisJobItem).where(
+            AnalysisJobItem.job_id == job_id,
+            AnalysisJobItem.tenant_id == tenant_id,
+            AnalysisJobItem.finished_at.isnot(None)
+        )
+
+        if since:
+            query = query.where(AnalysisJobItem.finished_at >= since)
+
+        result = await self.db.execute(query.order_by(AnalysisJobItem.finished_at, AnalysisJobItem.id))
+        return list(result.scalars().all())
+
+    async def get_unfinished_items(self, job_id: int) -> List[Tuple[int, int]]:
+        """Get (item_id, post_id) pairs still waiting to be analyzed."""
+        result = await self.db.execute(
+            select(AnalysisJobItem.id, AnalysisJobItem.post_id).where(
+                AnalysisJobItem.job_id == job_id,
+                AnalysisJobItem.status.in_([AnalysisJobItemStatus.PENDING, AnalysisJobItemStatus.RUNNING])
+            ).order_by(AnalysisJobItem.id)
+        )
+        return [(row.id, row.post_id) for row in result.all()]
+
+    async def get_existing_post_ids(self, tenant_id: int, post_ids: List[int]) -> List[int]:
+        """Filter post IDs down to those that exist within tenant."""
+        result = await self.db.execute(
+            select(LinkedInPost.id).where(
+                LinkedInPost.tenant_id == tenant_id,
+                LinkedInPost.id.in_(post_ids)
+            )
+        )
+        return list(result.scalars().all())
+
+    async def get_unanalyzed_post_ids(self, tenant_id: int, limit: int) -> List[int]:
+        """Get posts that have neither a successful analysis nor a linked opportunity."""
+        analyzed = exists().where(
+            AnalysisJobItem.post_id == LinkedInPost.id,
+            AnalysisJobItem.status == AnalysisJobItemStatus.SUCCEEDED
+        )
+        auto_analyzed = exists().where(
+            AnalysisQueueItem.post_id == LinkedInPost.id,
+            AnalysisQueueItem.status == AnalysisQueueStatus.SUCCEEDED
+        )
+        linked = exists().where(Opportunity.source_post_id == LinkedInPost.id)
+
+        result = await self.db.execute(
+            select(LinkedInPost.id).where(
+                LinkedInPost.tenant_id == tenant_id,
+                ~analyzed,
+                ~auto_analyzed,
+                ~linked
+            ).order_by(LinkedInPost.id).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def update_job(self, job_id: int, update_data: dict) -> None:
+        """Update job columns without loading the row."""
+        await self.db.execute(
+            update(AnalysisJob).where(AnalysisJob.id == job_id).values(**update_data)
+        )
+        await self.db.commit()
+
+    async def claim_stale_jobs(self, stale_seconds: float) -> List[Any]:
+        """Take over unfinished jobs whose worker stopped heartbeating, so this worker can resume them."""
+        now = datetime.now(timezone.utc)
+        stale = select(AnalysisJob.id).where(
+            AnalysisJob.status.in_([AnalysisJobStatus.PENDING, AnalysisJobStatus.RUNNING]),
+            or_(
+                AnalysisJob.heartbeat_at.is_(None),
+                AnalysisJob.heartbeat_at < now - timedelta(seconds=stale_seconds)
+            )
+        ).with_for_update(skip_locked=True)
+
+        result = await self.db.execute(
+            update(AnalysisJob).where(
+                AnalysisJob.id.in_(stale.scalar_subquery())
+            ).values(heartbeat_at=now).returning(
+                AnalysisJob.id,
+                AnalysisJob.tenant_id,
+                AnalysisJob.concurrency,
+                AnalysisJob.enable_cache
+            ).execution_options(synchronize_session=False)
+        )
+        jobs = list(result.all())
+        await self.db.commit()
+        return jobs
+
+    async def mark_job_running(self, job_id: int) -> None:
+        """Mark a job as running, keeping its original start time when it is being resumed."""
+        await self.update_job(job_id, {
+            "status": AnalysisJobStatus.RUNNING,
+            "started_at": func.coalesce(AnalysisJob.started_at, func.now()),
+            "heartbeat_at": datetime.now(timezone.utc)
+        })
+
+    async def heartbeat(self, job_id: int) -> None:
+        """Record that this worker is still running the job."""
+        await self.update_job(job_id, {"heartbeat_at": datetime.now(timezone.utc)})
+
+    async def mark_item_running(self, item_id: int) -> None:
+        """Mark an item as picked up by a worker."""
+        await self.db.execute(
+            update(AnalysisJobItem).where(AnalysisJobItem.id == item_id).values(
+                status=AnalysisJobItemStatus.RUNNING,
+                started_at=datetime.now(timezone.utc)
+            )
+        )
+        await self.db.commit()
+
+    async def complete_item(self, item_id: int, job_id: int, result: Optional[Dict[str, Any]], error: Optional[str]) -> None:
+        """Persist an item's outcome and bump the job's progress counters atomically."""
+        succeeded = error is None
+
+        await self.db.execute(
+            update(AnalysisJobItem).where(AnalysisJobItem.id == item_id).values(
+                status=AnalysisJobItemStatus.SUCCEEDED if succeeded else AnalysisJobItemStatus.FAILED,
+                result=result,
+                error=error,
+                finished_at=datetime.now(timezone.utc)
+            )
+        )
+
+        progress = (
+            {"completed_items": AnalysisJob.completed_items + 1}
+            if succeeded else
+            {"failed_items": AnalysisJob.failed_items + 1}
+        )
+        await self.db.execute(update(AnalysisJob).where(AnalysisJob.id == job_id).values(**progress))
+        await self.db.commit()
+
+    async def finish_job(self, job_id: int, error: Optional[str] = None) -> None:
+        """Mark a job as finished."""
+        await self.update_job(job_id, {
+            "status": AnalysisJobStatus.FAILED if error else AnalysisJobStatus.COMPLETED,
+            "finished_at": datetime.now(timezone.utc),
+            "error": error
+        })
@@ -0,0 +1,170 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import update, insert, select, func, and_, or_, bindparam, literal, exists, Integer
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from models import AnalysisQueueItem, AnalysisQueueStatus, Opportunity, Tenant
+from datetime import datetime, timezone, timedelta
+from typing import Optional, List, Dict, Any
+
+# Tenant.settings keys controlling the pipeline
+AUTO_ANALYSIS_ENABLED = "auto_analysis_enabled"
+AUTO_ANALYSIS_MIN_CONFIDENCE = "auto_analysis_min_confidence"
+
+class AnalysisQueueQueries:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def enqueue_posts(self, tenant_id: int, post_ids: List[int]) -> int:
+        """Queue posts for automatic analysis if the tenant opted in; posts already queued are skipped."""
+        post_id_array = bindparam("post_ids", post_ids, type_=ARRAY(Integer))
+        opted_in = select(
+            Tenant.id,
+            func.unnest(post_id_array),
+            literal(AnalysisQueueStatus.PENDING, AnalysisQueueItem.status.type),
+            literal(0)
+        ).where(
+            Tenant.id == tenant_id,
+            Tenant.settings[AUTO_ANALYSIS_ENABLED].as_boolean().is_(True)
+        )
+
+        result = await self.db.execute(
+            pg_insert(AnalysisQueueItem).from_select(
+                ["tenant_id", "post_id", "status", "attempts"], opted_in
+            ).on_conflict_do_nothing(index_elements=["post_id"]).returning(AnalysisQueueItem.id)
+        )
+        queued = len(result.all())
+        await self.db.commit()
+        return queued
+
+    async def claim_items(self, limit: int, visibility_timeout: int) -> List[Any]:
+        """Lock up to `limit` due items for this worker; items stuck running past the timeout are reclaimed."""
+        now = datetime.now(timezone.utc)
+        claimable = select(AnalysisQueueItem.id).where(
+            or_(
+                and_(
+                    AnalysisQueueItem.status == AnalysisQueueStatus.PENDING,
+                    AnalysisQueueItem.available_at <= now
+                ),
+                # A worker that died mid-item never released it
+                and_(
+                    AnalysisQueueItem.status == AnalysisQueueStatus.RUNNING,
+                    AnalysisQueueItem.locked_at < now - timedelta(seconds=visibility_timeout)
+                )
+            )
+        ).order_by(AnalysisQueueItem.available_at).limit(limit).with_for_update(skip_locked=True)
+
+        result = await self.db.execute(
+            update(AnalysisQueueItem).where(
+                AnalysisQueueItem.id.in_(claimable.scalar_subquery())
+            ).values(
+                status=AnalysisQueueStatus.RUNNING,
+                attempts=AnalysisQueueItem.attempts + 1,
+                locked_at=now
+            ).returning(
+                AnalysisQueueItem.id,
+                AnalysisQueueItem.tenant_id,
+                AnalysisQueueItem.post_id,
+                AnalysisQueueItem.attempts
+            ).execution_options(synchronize_session=False)
+        )
+        items = list(result.all())
+        await self.db.commit()
+        return items
+
+    async def get_min_confidence(self, tenant_id: int) -> Optional[float]:
+        """Get the tenant's confidence threshold for drafting opportunities, if set."""
+        result = await self.db.execute(
+            select(Tenant.settings[AUTO_ANALYSIS_MIN_CONFIDENCE].as_float()).where(Tenant.id == tenant_id)
+        )
+        return result.scalar()
+
+    async def post_has_opportunity(self, post_id: int) -> bool:
+        """Check whether an opportunity was already created from a post."""
+        result = await self.db.execute(
+            select(exists().where(Opportunity.source_post_id == post_id))
+        )
+        return bool(result.scalar())
+
+    async def complete_item(
+        self,
+        item_id: int,
+        result: Dict[str, Any],
+        opportunity_data: Optional[dict] = None
+    ) -> Optional[int]:
+        """Store an item's result and, when given, create its draft opportunity in the same transaction."""
+        opportunity_id = None
+        if opportunity_data:
+            opportunity_id = (await self.db.execute(
+                insert(Opportunity).values(**opportunity_data).returning(Opportunity.id)
+            )).scalar_one()
+
+        await self.db.execute(
+            update(AnalysisQueueItem).where(AnalysisQueueItem.id == item_id).values(
+                status=AnalysisQueueStatus.SUCCEEDED,
+                result=result,
+                opportunity_id=opportunity_id,
+                last_error=None,
+                locked_at=None,
+                finished_at=datetime.now(timezone.utc)
+            )
+        )
+        await self.db.commit()
+        return opportunity_id
+
+    async def retry_item(self, item_id: int, error: str, available_at: datetime) -> None:
+        """Put a failed item back in the queue, not to be picked up before `available_at`."""
+        await self.db.execute(
+            update(AnalysisQueueItem).where(AnalysisQueueItem.id == item_id).values(
+                status=AnalysisQueueStatus.PENDING,
+                last_error=error,
+                locked_at=None,
+                available_at=available_at
+            )
+        )
+        await self.db.commit()
+
+    async def mark_item_dead(self, item_id: int, error: str) -> None:
+        """Move an item that ran out of attempts to the dead-letter state."""
+        await self.db.execute(
+            update(AnalysisQueueItem).where(AnalysisQueueItem.id == item_id).values(
+                status=AnalysisQueueStatus.DEAD,
+                last_error=error,
+                locked_at=None,
+                finished_at=datetime.now(timezone.utc)
+            )
+        )
+        await self.db.commit()
+
+    async def requeue_dead_items(self, tenant_id: int) -> int:
+        """Give a tenant's dead-lettered items a fresh set of attempts."""
+        result = await self.db.execute(
+            update(AnalysisQueueItem).where(
+                AnalysisQueueItem.tenant_id == tenant_id,
+                AnalysisQueueItem.status == AnalysisQueueStatus.DEAD
+            ).values(
+                status=AnalysisQueueStatus.PENDING,
+                attempts=0,
+                available_at=func.now(),
+                finished_at=None
+            )
+        )
+        await self.db.commit()
+        return result.rowcount
+
+    async def count_by_status(self, tenant_id: int) -> Dict[AnalysisQueueStatus, int]:
+        """Count a tenant's queue items per status."""
+        result = await self.db.execute(
+            select(AnalysisQueueItem.status, func.count()).where(
+                AnalysisQueueItem.tenant_id == tenant_id
+            ).group_by(AnalysisQueueItem.status)
+        )
+        return {status: count for status, count in result.all()}
+
+    async def get_dead_items(self, tenant_id: int, skip: int = 0, limit: int = 50) -> List[AnalysisQueueItem]:
+        """Get a tenant's dead-lettered items, most recent failure first."""
+        result = await self.db.execute(
+            select(AnalysisQueueItem).where(
+                AnalysisQueueItem.tenant_id == tenant_id,
+                AnalysisQueueItem.status == AnalysisQueueStatus.DEAD
+            ).order_by(AnalysisQueueItem.finished_at.desc()).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
@@ -1,47 +1,76 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
 from models import User, Tenant
-from typing import Optional
+from typing import Optional, Dict, Any, Tuple
 
 class AuthQueries:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_user_by_auth0_id(self, auth0_user_id: str) -> Optional[User]:
+    async def get_user_by_auth0_id(self, auth0_user_id: str) -> Optional[User]:
         """Get user by Auth0 user ID across all tenants."""
-        return self.db.query(User).filter(
-            User.auth0_user_id == auth0_user_id
-        ).first()
+        result = await self.db.execute(
+            select(User).where(
+                User.auth0_user_id == auth0_user_id
+            )
+        )
+        return result.scalars().first()
 
-    def get_user_by_auth0_id_and_tenant(self, auth0_user_id: str, tenant_id: int) -> Optional[User]:
+    async def get_user_by_auth0_id_and_tenant(self, auth0_user_id: str, tenant_id: int) -> Optional[User]:
         """Get user by Auth0 user ID within specific tenant."""
-        return self.db.query(User).filter(
-            User.auth0_user_id == auth0_user_id,
-            User.tenant_id == tenant_id
-        ).first()
+        result = await self.db.execute(
+            select(User).where(
+                User.auth0_user_id == auth0_user_id,
+                User.tenant_id == tenant_id
+            )
+        )
+        return result.scalars().first()
+
+    async def get_user_with_tenant_settings(self, auth0_user_id: str, tenant_id: Optional[int] = None) -> Optional[Tuple[User, Dict[str, Any]]]:
+        """Get a user and their tenant's settings JSON in one query, within `tenant_id` when given."""
+        query = select(User, Tenant.settings).join(Tenant, Tenant.id == User.tenant_id).where(
+            User.auth0_user_id == auth0_user_id
+        )
+        if tenant_id:
+            query = query.where(User.tenant_id == tenant_id)
+        row = (await self.db.execute(query)).first()
+        if row is None:
+            return None
+        return row[0], dict(row[1] or {})
 
-    def create_tenant(self, tenant_data: dict) -> Tenant:
+    async def create_tenant(self, tenant_data: dict) -> Tenant:
         """Create a new tenant."""
         new_tenant = Tenant(**tenant_data)
         self.db.add(new_tenant)
-        self.db.flush()  # Get ID without committing
+        await self.db.flush()  # Get ID without committing
         return new_tenant
 
-    def create_user(self, user_data: dict) -> User:
+    async def create_user(self, user_data: dict) -> User:
         """Create a new user."""
         new_user = User(**user_data)
         self.db.add(new_user)
-        self.db.commit()
-        self.db.refresh(new_user)
+        await self.db.commit()
+        await self.db.refresh(new_user)
         return new_user
 
-    def get_tenant_by_id(self, tenant_id: int) -> Optional[Tenant]:
+    async def get_tenant_by_id(self, tenant_id: int) -> Optional[Tenant]:
         """Get tenant by ID."""
-        return self.db.query(Tenant).filter(Tenant.id == tenant_id).first()
+        return await self.db.get(Tenant, tenant_id)
+
+    async def get_tenant_settings(self, tenant_id: int) -> Dict[str, Any]:
+        """Get a tenant's settings JSON."""
+        result = await self.db.execute(select(Tenant.settings).where(Tenant.id == tenant_id))
+        return dict(result.scalar() or {})
+
+    async def update_tenant_settings(self, tenant_id: int, tenant_settings: Dict[str, Any]) -> None:
+        """Replace a tenant's settings JSON."""
+        await self.db.execute(update(Tenant).where(Tenant.id == tenant_id).values(settings=tenant_settings))
+        await self.db.commit()
 
-    def update_user_last_login(self, user: User) -> User:
+    async def update_user_last_login(self, user: User) -> User:
         """Update user's last login timestamp."""
         from sqlalchemy.sql import func
         user.updated_at = func.now()
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.commit()
+        await self.db.refresh(user)
         return user
\ No newline at end of file
@@ -1,41 +1,46 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from models import Company
 from typing import Optional, List
 
 class CompanyQueries:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_company(self, company_data: dict) -> Company:
+    async def create_company(self, company_data: dict) -> Company:
         new_company = Company(**company_data)
         self.db.add(new_company)
-        self.db.commit()
-        self.db.refresh(new_company)
+        await self.db.commit()
+        await self.db.refresh(new_company)
         return new_company
 
-    def get_companies_by_tenant(self, tenant_id: int, skip: int = 0, limit: int = 100, domain_filter: Optional[str] = None) -> List[Company]:
-        query = self.db.query(Company).filter(Company.tenant_id == tenant_id)
+    async def get_companies_by_tenant(self, tenant_id: int, skip: int = 0, limit: int = 100, domain_filter: Optional[str] = None) -> List[Company]:
+        query = select(Company).where(Company.tenant_id == tenant_id)
 
         if domain_filter:
-            query = query.filter(Company.domain == domain_filter)
+            query = query.where(Company.domain == domain_filter)
 
-        return query.offset(skip).limit(limit).all()
+        result = await self.db.execute(query.offset(skip).limit(limit))
+        return list(result.scalars().all())
 
-    def get_company_by_id(self, company_id: int, tenant_id: int) -> Optional[Company]:
-        return self.db.query(Company).filter(
-            Company.id == company_id,
-            Company.tenant_id == tenant_id
-        ).first()
+    async def get_company_by_id(self, company_id: int, tenant_id: int) -> Optional[Company]:
+        result = await self.db.execute(
+            select(Company).where(
+                Company.id == company_id,
+                Company.tenant_id == tenant_id
+            )
+        )
+        return result.scalars().first()
 
-    def update_company(self, company: Company, update_data: dict) -> Company:
+    async def update_company(self, company: Company, update_data: dict) -> Company:
         for field, value in update_data.items():
             if field == "linkedin_url" and value:
                 value = str(value)
             setattr(company, field, value)
-        self.db.commit()
-        self.db.refresh(company)
+        await self.db.commit()
+        await self.db.refresh(company)
         return company
 
-    def delete_company(self, company: Company) -> None:
-        self.db.delete(company)
-        self.db.commit()
\ No newline at end of file
+    async def delete_company(self, company: Company) -> None:
+        await self.db.delete(company)
+        await self.db.commit()
\ No newline at end of file
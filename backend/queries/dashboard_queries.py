@@ -0,0 +1,122 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, literal, union_all, and_, or_
+from models import Opportunity, Proposal, LinkedInPost, Campaign, CampaignNote, Company, DashboardDailyCount
+from datetime import date, datetime
+from typing import Dict, Any, List, Sequence, Optional, Tuple
+
+# Entity names the dashboard_daily_counts triggers write
+OPPORTUNITY = "opportunity"
+PROPOSAL = "proposal"
+CAMPAIGN = "campaign"
+LINKEDIN_POST = "linkedin_post"
+CAMPAIGN_NOTE = "campaign_note"
+
+# Position in the activity feed: (created_at, entity_type, id), newest first
+ActivityCursor = Tuple[datetime, str, int]
+
+class DashboardQueries:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_daily_count_totals(
+        self,
+        tenant_id: int,
+        entities: Sequence[str],
+        since: date
+    ) -> Dict[str, Dict[str, int]]:
+        """Sum the daily rollups from a day onwards, as entity -> status -> count."""
+        result = await self.db.execute(
+            select(
+                DashboardDailyCount.entity,
+                DashboardDailyCount.status,
+                func.sum(DashboardDailyCount.count).label("count")
+            ).where(
+                DashboardDailyCount.tenant_id == tenant_id,
+                DashboardDailyCount.entity.in_(entities),
+                DashboardDailyCount.day >= since
+            ).group_by(DashboardDailyCount.entity, DashboardDailyCount.status)
+        )
+
+        totals = {entity: {} for entity in entities}
+        for row in result.all():
+            totals[row.entity][row.status] = int(row.count)
+        return totals
+
+    async def get_recent_opportunities(self, tenant_id: int, limit: int = 8) -> List[Any]:
+        """Get the newest opportunities with their company name."""
+        result = await self.db.execute(
+            select(
+                Opportunity.id,
+                Opportunity.title,
+                Opportunity.status,
+                Opportunity.created_at,
+                Company.name.label("company_name")
+            ).outerjoin(
+                Company, Company.id == Opportunity.company_id
+            ).where(
+                Opportunity.tenant_id == tenant_id
+            ).order_by(Opportunity.created_at.desc()).limit(limit)
+        )
+        return list(result.all())
+
+    async def get_activity_page(
+        self,
+        tenant_id: int,
+        limit: int,
+        after: Optional[ActivityCursor] = None
+    ) -> List[Any]:
+        """Get the next page of the activity feed across entity types, newest first."""
+        branches = [
+            self._activity_branch(entity_type, tenant_id, limit, after).subquery()
+            for entity_type in (OPPORTUNITY, PROPOSAL, LINKEDIN_POST, CAMPAIGN_NOTE)
+        ]
+        feed = union_all(*[select(branch) for branch in branches]).subquery()
+
+        result = await self.db.execute(
+            select(feed).order_by(
+                feed.c.created_at.desc(),
+                feed.c.entity_type,
+                feed.c.id.desc()
+            ).limit(limit)
+        )
+        return list(result.all())
+
+    def _activity_branch(self, entity_type: str, tenant_id: int, limit: int, after: Optional[ActivityCursor]):
+        """Build one entity's slice of the feed: at most a page, read from its (tenant_id, created_at) index."""
+        model, title, joins = self._activity_columns(entity_type)
+        query = select(
+            literal(entity_type).label("entity_type"),
+            model.id.label("id"),
+            model.created_at.label("created_at"),
+            title.label("title")
+        )
+        for target, onclause in joins:
+            query = query.join(target, onclause)
+
+        query = query.where(model.tenant_id == tenant_id)
+        if after:
+            query = query.where(self._after_cursor(model, entity_type, after))
+        return query.order_by(model.created_at.desc(), model.id.desc()).limit(limit)
+
+    def _after_cursor(self, model, entity_type: str, after: ActivityCursor):
+        """Rows of one entity that sort after the cursor in (created_at desc, entity_type, id desc) order."""
+        created_at, cursor_type, cursor_id = after
+        if entity_type > cursor_type:
+            return model.created_at <= created_at
+        if entity_type < cursor_type:
+            return model.created_at < created_at
+        # The bare upper bound lets the index scan start at the cursor
+        return and_(
+            model.created_at <= created_at,
+            or_(model.created_at < created_at, model.id < cursor_id)
+        )
+
+    def _activity_columns(self, entity_type: str):
+        """Model, column shown in the activity description, and any joins needed."""
+        if entity_type == OPPORTUNITY:
+            return Opportunity, Opportunity.title, []
+        if entity_type == PROPOSAL:
+            return Proposal, Opportunity.title, [(Opportunity, Opportunity.id == Proposal.opportunity_id)]
+        if entity_type == LINKEDIN_POST:
+            return LinkedInPost, LinkedInPost.post_url, []
+        return CampaignNote, Campaign.name, [(Campaign, Campaign.id == CampaignNote.campaign_id)]
@@ -1,70 +1,85 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
 from models import ProposalFile
 from typing import Optional, List
 
 class FileQueries:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_proposal_file(self, file_data: dict) -> ProposalFile:
+    async def create_proposal_file(self, file_data: dict) -> ProposalFile:
         """Create a new proposal file record."""
         new_file = ProposalFile(**file_data)
         self.db.add(new_file)
-        self.db.commit()
-        self.db.refresh(new_file)
+        await self.db.commit()
+        await self.db.refresh(new_file)
         return new_file
 
-    def get_proposal_files_by_tenant(self, tenant_id: int, skip: int = 0, limit: int = 100) -> List[ProposalFile]:
+    async def get_proposal_files_by_tenant(self, tenant_id: int, skip: int = 0, limit: int = 100) -> List[ProposalFile]:
         """Get all proposal files for a tenant."""
-        return self.db.query(ProposalFile).filter(
-            ProposalFile.tenant_id == tenant_id
-        ).offset(skip).limit(limit).all()
+        result = await self.db.execute(
+            select(ProposalFile).where(
+                ProposalFile.tenant_id == tenant_id
+            ).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
 
-    def get_proposal_files_by_proposal(self, proposal_id: int, tenant_id: int) -> List[ProposalFile]:
+    async def get_proposal_files_by_proposal(self, proposal_id: int, tenant_id: int) -> List[ProposalFile]:
         """Get all files for a specific proposal."""
-        return self.db.query(ProposalFile).filter(
-            ProposalFile.proposal_id == proposal_id,
-            ProposalFile.tenant_id == tenant_id
-        ).all()
+        result = await self.db.execute(
+            select(ProposalFile).where(
+                ProposalFile.proposal_id == proposal_id,
+                ProposalFile.tenant_id == tenant_id
+            )
+        )
+        return list(result.scalars().all())
 
-    def get_proposal_file_by_id(self, file_id: int, tenant_id: int) -> Optional[ProposalFile]:
+    async def get_proposal_file_by_id(self, file_id: int, tenant_id: int) -> Optional[ProposalFile]:
         """Get a specific proposal file by ID."""
-        return self.db.query(ProposalFile).filter(
-            ProposalFile.id == file_id,
-            ProposalFile.tenant_id == tenant_id
-        ).first()
+        result = await self.db.execute(
+            select(ProposalFile).where(
+                ProposalFile.id == file_id,
+                ProposalFile.tenant_id == tenant_id
+            )
+        )
+        return result.scalars().first()
 
-    def get_proposal_file_by_filename(self, filename: str, tenant_id: int) -> Optional[ProposalFile]:
+    async def get_proposal_file_by_filename(self, filename: str, tenant_id: int) -> Optional[ProposalFile]:
         """Get proposal file by filename within tenant."""
-        return self.db.query(ProposalFile).filter(
-            ProposalFile.filename == filename,
-            ProposalFile.tenant_id == tenant_id
-        ).first()
+        result = await self.db.execute(
+            select(ProposalFile).where(
+                ProposalFile.filename == filename,
+                ProposalFile.tenant_id == tenant_id
+            )
+        )
+        return result.scalars().first()
 
-    def delete_proposal_file(self, proposal_file: ProposalFile) -> None:
+    async def delete_proposal_file(self, proposal_file: ProposalFile) -> None:
         """Delete a proposal file record."""
-        self.db.delete(proposal_file)
-        self.db.commit()
+        await self.db.delete(proposal_file)
+        await self.db.commit()
 
-    def update_proposal_file(self, proposal_file: ProposalFile, update_data: dict) -> ProposalFile:
+    async def update_proposal_file(self, proposal_file: ProposalFile, update_data: dict) -> ProposalFile:
         """Update a proposal file record."""
         for field, value in update_data.items():
             setattr(proposal_file, field, value)
-        self.db.commit()
-        self.db.refresh(proposal_file)
+        await self.db.commit()
+        await self.db.refresh(proposal_file)
         return proposal_file
 
-    def count_files_by_tenant(self, tenant_id: int) -> int:
+    async def count_files_by_tenant(self, tenant_id: int) -> int:
         """Count total files for a tenant."""
-        return self.db.query(ProposalFile).filter(
-            ProposalFile.tenant_id == tenant_id
-        ).count()
+        return await self.db.scalar(
+            select(func.count(ProposalFile.id)).where(
+                ProposalFile.tenant_id == tenant_id
+            )
+        )
 
-    def get_total_storage_used(self, tenant_id: int) -> int:
+    async def get_total_storage_used(self, tenant_id: int) -> int:
         """Get total storage used by a tenant in bytes."""
-        result = self.db.query(
-            self.db.func.sum(ProposalFile.size)
-        ).filter(
-            ProposalFile.tenant_id == tenant_id
-        ).scalar()
+        result = await self.db.scalar(
+            select(func.sum(ProposalFile.size)).where(
+                ProposalFile.tenant_id == tenant_id
+            )
+        )
         return result or 0
\ No newline at end of file
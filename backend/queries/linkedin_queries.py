@@ -1,37 +1,88 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, literal, bindparam, any_, String, Text, DateTime, true, false
+from sqlalchemy.dialects.postgresql import insert, ARRAY
 from models import LinkedInPost, User
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 
 class LinkedInQueries:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_user_by_auth0_id(self, auth0_user_id: str, tenant_id: int) -> Optional[User]:
-        return self.db.query(User).filter(
-            User.auth0_user_id == auth0_user_id,
-            User.tenant_id == tenant_id
-        ).first()
+    async def get_user_by_auth0_id(self, auth0_user_id: str, tenant_id: int) -> Optional[User]:
+        result = await self.db.execute(
+            select(User).where(
+                User.auth0_user_id == auth0_user_id,
+                User.tenant_id == tenant_id
+            )
+        )
+        return result.scalars().first()
 
-    def get_post_by_url(self, post_url: str, tenant_id: int) -> Optional[LinkedInPost]:
-        return self.db.query(LinkedInPost).filter(
-            LinkedInPost.tenant_id == tenant_id,
-            LinkedInPost.post_url == post_url
-        ).first()
+    async def get_post_by_url(self, post_url: str, tenant_id: int) -> Optional[LinkedInPost]:
+        result = await self.db.execute(
+            select(LinkedInPost).where(
+                LinkedInPost.tenant_id == tenant_id,
+                LinkedInPost.post_url == post_url
+            )
+        )
+        return result.scalars().first()
 
-    def create_linkedin_post(self, post_data: dict) -> LinkedInPost:
+    async def create_linkedin_post(self, post_data: dict) -> LinkedInPost:
         new_post = LinkedInPost(**post_data)
         self.db.add(new_post)
-        self.db.commit()
-        self.db.refresh(new_post)
+        await self.db.commit()
+        await self.db.refresh(new_post)
         return new_post
 
-    def get_posts_by_tenant(self, tenant_id: int, skip: int = 0, limit: int = 100) -> List[LinkedInPost]:
-        return self.db.query(LinkedInPost).filter(
-            LinkedInPost.tenant_id == tenant_id
-        ).offset(skip).limit(limit).all()
+    async def insert_posts_ignoring_duplicates(
+        self,
+        tenant_id: int,
+        user_id: Optional[int],
+        posts: List[dict]
+    ) -> Dict[str, Tuple[int, bool]]:
+        """Insert posts new to the tenant in one statement; return post_url -> (post_id, created)."""
+        post_urls = bindparam("post_urls", [post["post_url"] for post in posts], type_=ARRAY(String))
+
+        # Each column travels as one array parameter, so the statement size is fixed however many posts there are
+        rows = select(
+            literal(tenant_id).label("tenant_id"),
+            literal(user_id).label("user_id"),
+            func.unnest(post_urls).label("post_url"),
+            func.unnest(bindparam("author_profile_urls", [post["author_profile_url"] for post in posts], type_=ARRAY(String))).label("author_profile_url"),
+            func.unnest(bindparam("contents", [post["content"] for post in posts], type_=ARRAY(Text))).label("content"),
+            func.unnest(bindparam("scraped_ats", [post["scraped_at"] for post in posts], type_=ARRAY(DateTime(timezone=True)))).label("scraped_at")
+        )
+        inserted = insert(LinkedInPost).from_select(
+            ["tenant_id", "user_id", "post_url", "author_profile_url", "content", "scraped_at"], rows
+        ).on_conflict_do_nothing(
+            constraint="uq_tenant_post_url"
+        ).returning(LinkedInPost.id, LinkedInPost.post_url).cte("inserted")
+
+        # The outer SELECT sees the table as it was before the insert, i.e. only the existing duplicates
+        existing = select(LinkedInPost.id, LinkedInPost.post_url, false().label("created")).where(
+            LinkedInPost.tenant_id == tenant_id,
+            LinkedInPost.post_url == any_(post_urls)
+        )
+
+        result = await self.db.execute(
+            select(inserted.c.id, inserted.c.post_url, true().label("created")).union_all(existing)
+        )
+        posts_by_url = {row.post_url: (row.id, row.created) for row in result.all()}
+        await self.db.commit()
+        return posts_by_url
+
+    async def get_posts_by_tenant(self, tenant_id: int, skip: int = 0, limit: int = 100) -> List[LinkedInPost]:
+        result = await self.db.execute(
+            select(LinkedInPost).where(
+                LinkedInPost.tenant_id == tenant_id
+            ).order_by(LinkedInPost.created_at.desc()).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
 
-    def get_post_by_id(self, post_id: int, tenant_id: int) -> Optional[LinkedInPost]:
-        return self.db.query(LinkedInPost).filter(
-            LinkedInPost.id == post_id,
-            LinkedInPost.tenant_id == tenant_id
-        ).first()
\ No newline at end of file
+    async def get_post_by_id(self, post_id: int, tenant_id: int) -> Optional[LinkedInPost]:
+        result = await self.db.execute(
+            select(LinkedInPost).where(
+                LinkedInPost.id == post_id,
+                LinkedInPost.tenant_id == tenant_id
+            )
+        )
+        return result.scalars().first()
\ No newline at end of file
@@ -1,20 +1,22 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func
 from models import Proposal
+from queries.search_queries import build_tsquery
 from typing import Optional, List
 
 class ProposalQueries:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create_proposal(self, proposal_data: dict) -> Proposal:
+    async def create_proposal(self, proposal_data: dict) -> Proposal:
         """Create a new proposal."""
         new_proposal = Proposal(**proposal_data)
         self.db.add(new_proposal)
-        self.db.commit()
-        self.db.refresh(new_proposal)
+        await self.db.commit()
+        await self.db.refresh(new_proposal)
         return new_proposal
 
-    def get_proposals_by_tenant(
+    async def get_proposals_by_tenant(
         self,
         tenant_id: int,
         skip: int = 0,
@@ -22,63 +24,89 @@ class ProposalQueries:
         status: Optional[str] = None
     ) -> List[Proposal]:
         """Get proposals for a specific tenant with optional status filter."""
-        query = self.db.query(Proposal).filter(Proposal.tenant_id == tenant_id)
+        query = select(Proposal).where(Proposal.tenant_id == tenant_id)
 
         if status:
-            query = query.filter(Proposal.status == status)
+            query = query.where(Proposal.status == status)
 
-        return query.offset(skip).limit(limit).all()
+        result = await self.db.execute(query.order_by(Proposal.created_at.desc()).offset(skip).limit(limit))
+        return list(result.scalars().all())
 
-    def get_proposal_by_id(self, proposal_id: int, tenant_id: int) -> Optional[Proposal]:
+    async def get_proposal_by_id(self, proposal_id: int, tenant_id: int) -> Optional[Proposal]:
         """Get a specific proposal by ID within tenant."""
-        return self.db.query(Proposal).filter(
-            Proposal.id == proposal_id,
-            Proposal.tenant_id == tenant_id
-        ).first()
+        result = await self.db.execute(
+            select(Proposal).where(
+                Proposal.id == proposal_id,
+                Proposal.tenant_id == tenant_id
+            )
+        )
+        return result.scalars().first()
 
-    def get_proposal_by_opportunity_id(self, opportunity_id: int, tenant_id: int) -> Optional[Proposal]:
+    async def get_proposal_by_opportunity_id(self, opportunity_id: int, tenant_id: int) -> Optional[Proposal]:
         """Get proposal by opportunity ID within tenant."""
-        return self.db.query(Proposal).filter(
-            Proposal.opportunity_id == opportunity_id,
-            Proposal.tenant_id == tenant_id
-        ).first()
+        result = await self.db.execute(
+            select(Proposal).where(
+                Proposal.opportunity_id == opportunity_id,
+                Proposal.tenant_id == tenant_id
+            )
+        )
+        return result.scalars().first()
 
-    def update_proposal(self, proposal: Proposal, update_data: dict) -> Proposal:
+    async def update_proposal(self, proposal: Proposal, update_data: dict) -> Proposal:
         """Update an existing proposal."""
         for field, value in update_data.items():
             setattr(proposal, field, value)
-        self.db.commit()
-        self.db.refresh(proposal)
+        await self.db.commit()
+        await self.db.refresh(proposal)
         return proposal
 
-    def delete_proposal(self, proposal: Proposal) -> None:
+    async def update_proposal_content(self, proposal_id: int, content: str) -> None:
+        """Overwrite a proposal's content without loading the row."""
+        await self.db.execute(
+            update(Proposal).where(Proposal.id == proposal_id).values(content=content)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+
+    async def delete_proposal(self, proposal: Proposal) -> None:
         """Delete a proposal."""
-        self.db.delete(proposal)
-        self.db.commit()
+        await self.db.delete(proposal)
+        await self.db.commit()
 
-    def get_proposals_by_status(self, tenant_id: int, status: str) -> List[Proposal]:
+    async def get_proposals_by_status(self, tenant_id: int, status: str) -> List[Proposal]:
         """Get proposals by status."""
-        return self.db.query(Proposal).filter(
-            Proposal.tenant_id == tenant_id,
-            Proposal.status == status
-        ).all()
+        result = await self.db.execute(
+            select(Proposal).where(
+                Proposal.tenant_id == tenant_id,
+                Proposal.status == status
+            )
+        )
+        return list(result.scalars().all())
 
-    def count_proposals_by_tenant(self, tenant_id: int) -> int:
+    async def count_proposals_by_tenant(self, tenant_id: int) -> int:
         """Count total proposals for a tenant."""
-        return self.db.query(Proposal).filter(
-            Proposal.tenant_id == tenant_id
-        ).count()
+        return await self.db.scalar(
+            select(func.count(Proposal.id)).where(
+                Proposal.tenant_id == tenant_id
+            )
+        )
 
-    def count_proposals_by_status(self, tenant_id: int, status: str) -> int:
+    async def count_proposals_by_status(self, tenant_id: int, status: str) -> int:
         """Count proposals by status for a tenant."""
-        return self.db.query(Proposal).filter(
-            Proposal.tenant_id == tenant_id,
-            Proposal.status == status
-        ).count()
+        return await self.db.scalar(
+            select(func.count(Proposal.id)).where(
+                Proposal.tenant_id == tenant_id,
+                Proposal.status == status
+            )
+        )
 
-    def search_proposals_by_content(self, tenant_id: int, search_term: str) -> List[Proposal]:
-        """Search proposals by content."""
-        return self.db.query(Proposal).filter(
-            Proposal.tenant_id == tenant_id,
-            Proposal.content.ilike(f"%{search_term}%")
-        ).all()
\ No newline at end of file
+    async def search_proposals_by_content(self, tenant_id: int, search_term: str) -> List[Proposal]:
+        """Search proposals by content, best match first."""
+        tsquery = build_tsquery(search_term)
+        result = await self.db.execute(
+            select(Proposal).where(
+                Proposal.tenant_id == tenant_id,
+                Proposal.search_vector.op("@@")(tsquery)
+            ).order_by(func.ts_rank_cd(Proposal.search_vector, tsquery).desc())
+        )
+        return list(result.scalars().all())
\ No newline at end of file
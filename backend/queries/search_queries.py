@@ -0,0 +1,120 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, literal, literal_column, union_all, case, or_
+from models import Opportunity, Proposal, Contact, Company, LinkedInPost
+from database import settings
+from typing import List, Dict, Any, Sequence
+
+# Text search configuration the search_vector triggers were built with
+SEARCH_CONFIG = "english"
+_search_config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+
+# Score added when a name matches the raw term as a substring (partial words, emails)
+NAME_MATCH_BOOST = 0.1
+
+def build_tsquery(search_term: str):
+    """Parse free text (quotes, OR, -exclusions) into a tsquery with the search config."""
+    return func.websearch_to_tsquery(_search_config, search_term)
+
+def _escape_like(search_term: str) -> str:
+    return search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+class SearchQueries:
+    # entity type -> (model, name column matched by substring or None)
+    ENTITIES = {
+        "opportunity": (Opportunity, None),
+        "proposal": (Proposal, None),
+        "contact": (Contact, Contact.name),
+        "company": (Company, Company.name),
+        "linkedin_post": (LinkedInPost, None),
+    }
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search_ranked(
+        self,
+        tenant_id: int,
+        search_term: str,
+        entity_types: Sequence[str],
+        skip: int = 0,
+        limit: int = 20
+    ) -> List[Any]:
+        """Get (entity_type, id, rank, created_at) rows across entity types, best match first."""
+        tsquery = build_tsquery(search_term)
+        pattern = f"%{_escape_like(search_term)}%"
+
+        selects = []
+        for entity_type in entity_types:
+            model, name_column = self.ENTITIES[entity_type]
+            match = model.search_vector.op("@@")(tsquery)
+            rank = func.ts_rank_cd(model.search_vector, tsquery, 32)
+
+            if name_column is not None:
+                name_match = name_column.ilike(pattern, escape="\\")
+                match = or_(match, name_match)
+                rank = rank + case((name_match, NAME_MATCH_BOOST), else_=0.0)
+
+            # Ranking reads every matched vector, so broad terms only rank the most recent matches
+            candidates = select(model.id).where(
+                model.tenant_id == tenant_id, match
+            ).order_by(model.created_at.desc()).limit(settings.search_max_ranked_candidates).subquery()
+
+            selects.append(
+                select(
+                    literal(entity_type).label("entity_type"),
+                    model.id.label("id"),
+                    rank.label("rank"),
+                    model.created_at.label("created_at")
+                ).join(candidates, candidates.c.id == model.id)
+            )
+
+        ranked = union_all(*selects).subquery()
+        result = await self.db.execute(
+            select(ranked).order_by(
+                ranked.c.rank.desc(),
+                ranked.c.created_at.desc(),
+                ranked.c.entity_type,
+                ranked.c.id
+            ).offset(skip).limit(limit)
+        )
+        return list(result.all())
+
+    async def get_result_details(
+        self,
+        tenant_id: int,
+        search_term: str,
+        entity_type: str,
+        ids: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Get display title and a matching snippet for one page of hits of a single type."""
+        title, body, joins = self._display_columns(entity_type)
+        model = self.ENTITIES[entity_type][0]
+
+        # Plain-text fragments: content comes from LinkedIn and users, so no markup is injected
+        snippet = func.ts_headline(
+            _search_config,
+            func.coalesce(body, ""),
+            build_tsquery(search_term),
+            'MaxFragments=2, MaxWords=30, MinWords=10, StartSel="", StopSel="", FragmentDelimiter=" ... "'
+        )
+
+        query = select(model.id, title.label("title"), snippet.label("snippet"))
+        for target, onclause in joins:
+            query = query.join(target, onclause)
+
+        result = await self.db.execute(
+            query.where(model.tenant_id == tenant_id, model.id.in_(ids))
+        )
+        return {row.id: {"title": row.title, "snippet": row.snippet} for row in result.all()}
+
+    def _display_columns(self, entity_type: str):
+        """Column used as the result title, column snippets are cut from, and any joins needed."""
+        if entity_type == "opportunity":
+            return Opportunity.title, Opportunity.summary, []
+        if entity_type == "proposal":
+            return Opportunity.title, Proposal.content, [(Opportunity, Opportunity.id == Proposal.opportunity_id)]
+        if entity_type == "contact":
+            return Contact.name, Contact.email, []
+        if entity_type == "company":
+            return Company.name, Company.domain, []
+        return LinkedInPost.post_url, LinkedInPost.content, []
@@ -7,6 +7,7 @@ from . import contacts
 from . import proposals
 from . import campaigns
 from . import files
+from . import search
 
 __all__ = [
     "auth",
@@ -17,5 +18,6 @@ __all__ = [
     "contacts",
     "proposals",
     "campaigns",
-    "files"
+    "files",
+    "search"
 ]
\ No newline at end of file
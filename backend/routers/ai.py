@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
-from middleware.auth import get_current_tenant_id
+from middleware.auth import get_current_tenant_id, get_current_user_id
 from controllers.ai_controller import AIController
-from schemas.ai import AnalyzeExtractRequest, ProposalGenerationRequest, AnalyzeOpportunityRequest, AnalyzeOpportunityResponse
+from schemas.ai import AnalyzeExtractRequest, ProposalGenerationRequest, AnalyzeOpportunityRequest, AnalyzeOpportunityResponse, AnalyzeBatchRequest, AnalysisJobResponse, AnalysisJobItemResponse, AutoAnalysisSettingsUpdate, AutoAnalysisSettingsResponse, AutoAnalysisRetryResponse, AnalysisQueueItemResponse, RoutingPolicyUpdate, RoutingOverviewResponse, RateLimitPolicyUpdate, RateLimitOverviewResponse, PromptOverviewResponse
+from typing import List, Optional
 
 router = APIRouter()
 
@@ -12,42 +13,224 @@ router = APIRouter()
 async def analyze_extract_post(
     request: AnalyzeExtractRequest,
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
-    controller = AIController(db)
+    controller = AIController(db, user_id)
     return await controller.analyze_extract_post(request, tenant_id)
 
 @router.post("/generate-proposal")
 async def generate_proposal(
     request: ProposalGenerationRequest,
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
-    controller = AIController(db)
+    controller = AIController(db, user_id)
     return await controller.generate_proposal(request, tenant_id)
 
+@router.post("/generate-proposal/stream")
+async def generate_proposal_streaming(
+    request: ProposalGenerationRequest,
+    tenant_id: int = Depends(get_current_tenant_id),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Streaming proposal generation (NDJSON). Emits token events as they arrive and a
+    section event for each suggested section once the following heading closes it.
+    """
+    controller = AIController(db, user_id)
+    return await controller.generate_proposal_streaming(request, tenant_id)
+
 @router.post("/analyze-opportunity", response_model=AnalyzeOpportunityResponse)
 async def analyze_opportunity(
     request: AnalyzeOpportunityRequest,
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Unified AI analysis endpoint. Loads post context server-side and performs
     comprehensive opportunity analysis including company/contact detection.
     """
-    controller = AIController(db)
+    controller = AIController(db, user_id)
     return await controller.analyze_opportunity(request, tenant_id)
 
 @router.post("/analyze-opportunity/stream")
 async def analyze_opportunity_streaming(
     request: AnalyzeOpportunityRequest,
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Streaming version of AI analysis endpoint. Returns progressive updates
     during the analysis process via Server-Sent Events.
     """
+    controller = AIController(db, user_id)
+    return await controller.analyze_opportunity_streaming(request, tenant_id)
+
+@router.get("/cache/stats")
+async def get_analysis_cache_statistics(
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Hit/miss counters for the opportunity analysis cache."""
+    controller = AIController(db)
+    return await controller.get_cache_statistics()
+
+@router.get("/routing", response_model=RoutingOverviewResponse)
+async def get_model_routing(
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Effective model routing policy plus per-route latency and token counters for this worker."""
+    controller = AIController(db)
+    return await controller.get_routing_overview(tenant_id)
+
+@router.put("/routing", response_model=RoutingOverviewResponse)
+async def update_model_routing(
+    request: RoutingPolicyUpdate,
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Override how this tenant's posts are routed: posts up to max_fast_chars go to
+    fast_model first and are re-run on the large model below min_confidence.
+    fast_model must be one of allowed_fast_models (AI_ROUTING_ALLOWED_FAST_MODELS).
+    """
+    controller = AIController(db)
+    return await controller.update_routing_policy(request, tenant_id)
+
+@router.get("/prompts", response_model=PromptOverviewResponse)
+async def get_prompt_overview(
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Analysis prompt versions with their static prefix size, plus per-version token usage
+    and latency for this worker. Pin a version with AI_ANALYSIS_PROMPT_VERSION to compare.
+    """
+    controller = AIController(db)
+    return await controller.get_prompt_overview()
+
+@router.get("/rate-limits", response_model=RateLimitOverviewResponse)
+async def get_rate_limits(
+    tenant_id: int = Depends(get_current_tenant_id),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Effective AI budgets plus the current levels of the tenant's and caller's buckets."""
+    controller = AIController(db, user_id)
+    return await controller.get_rate_limits(tenant_id)
+
+@router.put("/rate-limits", response_model=RateLimitOverviewResponse)
+async def update_rate_limits(
+    request: RateLimitPolicyUpdate,
+    tenant_id: int = Depends(get_current_tenant_id),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Override this tenant's AI budgets. Calls and estimated prompt plus completion tokens
+    are limited per minute for the whole tenant and for each user; 0 switches AI calls off.
+    """
+    controller = AIController(db, user_id)
+    return await controller.update_rate_limits(request, tenant_id)
+
+
+@router.post("/analyze-batch", response_model=AnalysisJobResponse)
+async def analyze_batch(
+    request: AnalyzeBatchRequest,
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Start a bulk analysis job over the given post IDs, or over every post of
+    the tenant that has not been analyzed yet. Poll or stream the job for progress.
+    """
+    controller = AIController(db)
+    return await controller.create_analysis_job(request, tenant_id)
+
+@router.get("/analyze-batch", response_model=List[AnalysisJobResponse])
+async def get_analysis_jobs(
+    tenant_id: int = Depends(get_current_tenant_id),
+    skip: int = 0,
+    limit: int = 20,
+    db: AsyncSession = Depends(get_db)
+):
+    controller = AIController(db)
+    return await controller.get_analysis_jobs(tenant_id, skip, limit)
+
+@router.get("/analyze-batch/{job_id}", response_model=AnalysisJobResponse)
+async def get_analysis_job(
+    job_id: int,
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    controller = AIController(db)
+    return await controller.get_analysis_job(job_id, tenant_id)
+
+@router.get("/analyze-batch/{job_id}/items", response_model=List[AnalysisJobItemResponse])
+async def get_analysis_job_items(
+    job_id: int,
+    tenant_id: int = Depends(get_current_tenant_id),
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    controller = AIController(db)
+    return await controller.get_analysis_job_items(job_id, tenant_id, skip, limit, status)
+
+@router.get("/analyze-batch/{job_id}/stream")
+async def stream_analysis_job(
+    job_id: int,
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Stream per-post results and progress snapshots as NDJSON until the job finishes."""
+    controller = AIController(db)
+    return await controller.stream_analysis_job(job_id, tenant_id)
+
+@router.get("/auto-analysis", response_model=AutoAnalysisSettingsResponse)
+async def get_auto_analysis_settings(
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Automatic analysis settings and how many posts are in each queue state."""
+    controller = AIController(db)
+    return await controller.get_auto_analysis_settings(tenant_id)
+
+@router.put("/auto-analysis", response_model=AutoAnalysisSettingsResponse)
+async def update_auto_analysis_settings(
+    request: AutoAnalysisSettingsUpdate,
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Opt in to analyzing newly ingested posts in the background. Posts found to be
+    opportunities with at least min_confidence become draft opportunities.
+    """
+    controller = AIController(db)
+    return await controller.update_auto_analysis_settings(request, tenant_id)
+
+@router.get("/auto-analysis/dead", response_model=List[AnalysisQueueItemResponse])
+async def get_dead_analysis_items(
+    tenant_id: int = Depends(get_current_tenant_id),
+    skip: int = 0,
+    limit: int = 50,
+    db: AsyncSession = Depends(get_db)
+):
+    controller = AIController(db)
+    return await controller.get_dead_analysis_items(tenant_id, skip, limit)
+
+@router.post("/auto-analysis/dead/retry", response_model=AutoAnalysisRetryResponse)
+async def retry_dead_analysis_items(
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Requeue every post whose automatic analysis ran out of attempts."""
     controller = AIController(db)
-    return await controller.analyze_opportunity_streaming(request, tenant_id)
\ No newline at end of file
+    return await controller.retry_dead_analysis_items(tenant_id)
@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
-from middleware.auth import get_current_user
+from middleware.auth import get_current_user, get_current_principal
 from controllers.auth_controller import AuthController
+from services.principal_resolver import Principal
 from typing import Dict, Any
 
 router = APIRouter()
@@ -10,18 +11,19 @@ router = APIRouter()
 @router.get("/me")
 async def get_me(
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db)
 ):
     controller = AuthController(db)
-    return controller.get_me(current_user)
+    return await controller.get_me(current_user, principal)
 
 @router.post("/authenticate")
 async def authenticate(
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     controller = AuthController(db)
-    return controller.authenticate_user(current_user)
+    return await controller.authenticate_user(current_user)
 
 @router.post("/logout")
 async def logout():
@@ -32,7 +34,7 @@ async def logout():
 async def validate_access(
     tenant_id: int,
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     controller = AuthController(db)
-    return controller.validate_access(current_user, tenant_id)
\ No newline at end of file
+    return await controller.validate_access(current_user, tenant_id)
\ No newline at end of file
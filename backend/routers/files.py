@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, Response, UploadFile, File, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
 from middleware.auth import get_current_tenant_id
 from controllers.file_controller import FileController
@@ -13,61 +13,93 @@ async def upload_proposal_file(
     file: UploadFile = File(...),
     proposal_id: int = Query(..., description="Proposal ID to associate with the file"),
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     controller = FileController(db)
     return await controller.upload_proposal_file(file, proposal_id, tenant_id)
 
+@router.post("/upload/stream", response_model=FileUploadResponse)
+async def upload_proposal_file_stream(
+    request: Request,
+    filename: str = Query(..., description="Original filename, used for the extension check"),
+    proposal_id: int = Query(..., description="Proposal ID to associate with the file"),
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Upload a file sent as the raw request body.
+
+    Unlike the multipart upload, which is buffered in full before it is checked, the body is
+    written to disk as it arrives and rejected with a 413 once it passes the size limit.
+    """
+    controller = FileController(db)
+    return await controller.upload_proposal_file_stream(request, filename, proposal_id, tenant_id)
+
 @router.get("/", response_model=List[ProposalFileResponse])
 async def get_proposal_files(
     tenant_id: int = Depends(get_current_tenant_id),
     proposal_id: Optional[int] = Query(None, description="Filter by proposal ID"),
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     controller = FileController(db)
-    return controller.get_proposal_files(tenant_id, proposal_id, skip, limit)
+    return await controller.get_proposal_files(tenant_id, proposal_id, skip, limit)
 
 @router.get("/statistics", response_model=FileStatisticsResponse)
 async def get_file_statistics(
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     controller = FileController(db)
-    return controller.get_file_statistics(tenant_id)
+    return await controller.get_file_statistics(tenant_id)
 
 @router.post("/cleanup", response_model=FileCleanupResponse)
 async def cleanup_orphaned_files(
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     controller = FileController(db)
-    return controller.cleanup_orphaned_files(tenant_id)
+    return await controller.cleanup_orphaned_files(tenant_id)
 
-@router.get("/{file_id}", response_model=ProposalFileResponse)
+@router.get("/{file_id:int}", response_model=ProposalFileResponse)
 async def get_proposal_file(
     file_id: int,
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     controller = FileController(db)
-    return controller.get_proposal_file(file_id, tenant_id)
+    return await controller.get_proposal_file(file_id, tenant_id)
 
 @router.get("/by-filename/{filename}", response_model=ProposalFileResponse)
 async def get_file_by_filename(
     filename: str,
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     controller = FileController(db)
-    return controller.get_file_by_filename(filename, tenant_id)
+    return await controller.get_file_by_filename(filename, tenant_id)
+
+@router.get("/{filename}", response_class=Response)
+@router.head("/{filename}", response_class=Response)
+async def download_file(
+    filename: str,
+    request: Request,
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Download a file's content; this is the URL stored on each file.
+
+    Supports single byte ranges for partial and resumed downloads, and answers
+    If-None-Match for the file's ETag (its SHA-256) with 304 Not Modified.
+    """
+    controller = FileController(db)
+    return await controller.download_file(filename, tenant_id, request)
 
 @router.delete("/{filename}")
 async def delete_file(
     filename: str,
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     controller = FileController(db)
-    return controller.delete_file(filename, tenant_id)
\ No newline at end of file
+    return await controller.delete_file(filename, tenant_id)
\ No newline at end of file
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db
-from middleware.auth import get_current_user, get_current_tenant_id
+from middleware.auth import get_current_principal, get_current_tenant_id
 from controllers.linkedin_controller import LinkedInController
+from services.principal_resolver import Principal
 from schemas.linkedin import LinkedInPostCreate, LinkedInPostResponse, LinkedInPostBatchCreate, BatchIngestionResponse
 from typing import List, Dict, Any
 
@@ -11,39 +12,54 @@ router = APIRouter()
 @router.post("/ingest", response_model=LinkedInPostResponse)
 async def ingest_linkedin_post(
     post_data: LinkedInPostCreate,
-    current_user: Dict[str, Any] = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     controller = LinkedInController(db)
-    return controller.ingest_linkedin_post(post_data, current_user, tenant_id)
+    return await controller.ingest_linkedin_post(post_data, principal, tenant_id)
 
 @router.get("/posts", response_model=List[LinkedInPostResponse])
 async def get_linkedin_posts(
     tenant_id: int = Depends(get_current_tenant_id),
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     controller = LinkedInController(db)
-    return controller.get_linkedin_posts(tenant_id, skip, limit)
+    return await controller.get_linkedin_posts(tenant_id, skip, limit)
 
 @router.get("/posts/{post_id}", response_model=LinkedInPostResponse)
 async def get_linkedin_post(
     post_id: int,
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     controller = LinkedInController(db)
-    return controller.get_linkedin_post(post_id, tenant_id)
+    return await controller.get_linkedin_post(post_id, tenant_id)
 
 @router.post("/ingest/batch", response_model=BatchIngestionResponse)
 async def ingest_linkedin_posts_batch(
     batch_data: LinkedInPostBatchCreate,
-    current_user: Dict[str, Any] = Depends(get_current_user),
+    principal: Principal = Depends(get_current_principal),
     tenant_id: int = Depends(get_current_tenant_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Ingest multiple LinkedIn posts in batch. Maximum 50 posts per request."""
+    """Ingest multiple LinkedIn posts in batch. Maximum LINKEDIN_BATCH_MAX_POSTS (default 5000) posts per request."""
     controller = LinkedInController(db)
-    return controller.ingest_linkedin_posts_batch(batch_data, current_user, tenant_id)
\ No newline at end of file
+    return await controller.ingest_linkedin_posts_batch(batch_data, principal, tenant_id)
+
+@router.post("/ingest/stream")
+async def ingest_linkedin_posts_stream(
+    request: Request,
+    principal: Principal = Depends(get_current_principal),
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Ingest an NDJSON upload (one post per line, optionally gzip-encoded) of any size.
+
+    Posts are written in chunks as the upload arrives. Once it is complete the response
+    streams NDJSON: one result per input line, then a summary line.
+    """
+    controller = LinkedInController(db)
+    return await controller.ingest_linkedin_posts_stream(request, principal, tenant_id)
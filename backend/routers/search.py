@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_db
+from middleware.auth import get_current_tenant_id
+from controllers.search_controller import SearchController
+from schemas.search import SearchEntityType, SearchResponse
+from typing import List, Optional
+
+router = APIRouter()
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., description="Search text; supports quoted phrases, OR and -exclusions"),
+    types: Optional[List[SearchEntityType]] = Query(None, description="Limit results to these entity types"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    tenant_id: int = Depends(get_current_tenant_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """Ranked search across opportunities, proposals, contacts, companies and LinkedIn posts."""
+    controller = SearchController(db)
+    return await controller.search(tenant_id, q, types, skip, limit)
@@ -1,5 +1,8 @@
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
+from datetime import datetime
+from enum import Enum
+from schemas.base import BaseResponseSchema
 
 # Legacy schemas (to be deprecated)
 class AnalyzeExtractRequest(BaseModel):
@@ -18,6 +21,8 @@ class AnalyzeExtractResponse(BaseModel):
 class AnalyzeOpportunityRequest(BaseModel):
     post_id: int
     enable_cache: bool = True
+    # Set to false to send the post to the model even if the local pre-screen rejects it
+    enable_prefilter: bool = True
 
 class CompanySuggestion(BaseModel):
     name: str
@@ -36,6 +41,11 @@ class ExtractedField(BaseModel):
     value: Any
     confidence: float
 
+class PrefilterResult(BaseModel):
+    score: float
+    min_score: float
+    signals: List[str]
+
 class AnalyzeOpportunityResponse(BaseModel):
     is_opportunity: bool
     confidence: float
@@ -47,6 +57,43 @@ class AnalyzeOpportunityResponse(BaseModel):
     tags: List[str]
     budget_range: Optional[str] = None
     timeline: Optional[str] = None
+    # Set when the post was rejected by the local pre-screen without calling the model
+    prefilter: Optional[PrefilterResult] = None
+
+class RoutingPolicyUpdate(BaseModel):
+    enabled: Optional[bool] = None
+    fast_model: Optional[str] = None
+    max_fast_chars: Optional[int] = None
+    min_confidence: Optional[float] = None
+
+class RoutingOverviewResponse(BaseModel):
+    policy: Dict[str, Any]
+    large_model: str
+    allowed_fast_models: List[str]
+    routes: Dict[str, Dict[str, Any]]
+
+class PromptVersionResponse(BaseModel):
+    prompt_id: str
+    active: bool
+    # Tokens of the instruction block every call of this version starts with
+    static_prefix_tokens: int
+
+class PromptOverviewResponse(BaseModel):
+    versions: List[PromptVersionResponse]
+    # Per prompt version and model: call count, token totals and averages, latency percentiles
+    metrics: Dict[str, Dict[str, Dict[str, Any]]]
+
+class RateLimitPolicyUpdate(BaseModel):
+    enabled: Optional[bool] = None
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+    user_requests_per_minute: Optional[int] = None
+    user_tokens_per_minute: Optional[int] = None
+
+class RateLimitOverviewResponse(BaseModel):
+    policy: Dict[str, Any]
+    # Remaining requests and tokens in the "tenant" and "user" buckets
+    levels: Dict[str, Dict[str, float]]
 
 class ProposalGenerationRequest(BaseModel):
     opportunity_id: int
@@ -55,4 +102,70 @@ class ProposalGenerationRequest(BaseModel):
 
 class ProposalGenerationResponse(BaseModel):
     proposal_content: str
-    suggested_sections: List[Dict[str, str]]
\ No newline at end of file
+    suggested_sections: List[Dict[str, str]]
+
+# Bulk analysis job schemas
+class AnalysisJobStatus(str, Enum):
+    PENDING = "Pending"
+    RUNNING = "Running"
+    COMPLETED = "Completed"
+    FAILED = "Failed"
+
+class AnalysisJobItemStatus(str, Enum):
+    PENDING = "Pending"
+    RUNNING = "Running"
+    SUCCEEDED = "Succeeded"
+    FAILED = "Failed"
+
+class AnalyzeBatchRequest(BaseModel):
+    post_ids: Optional[List[int]] = None
+    all_unanalyzed: bool = False
+    enable_cache: bool = True
+    concurrency: Optional[int] = None
+
+class AnalysisJobResponse(BaseResponseSchema):
+    tenant_id: int
+    status: AnalysisJobStatus
+    total_items: int
+    completed_items: int
+    failed_items: int
+    concurrency: int
+    enable_cache: bool
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    error: Optional[str]
+
+class AnalysisJobItemResponse(BaseResponseSchema):
+    job_id: int
+    post_id: int
+    status: AnalysisJobItemStatus
+    result: Optional[Dict[str, Any]]
+    error: Optional[str]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+
+# Automatic analysis schemas
+class AutoAnalysisSettingsUpdate(BaseModel):
+    enabled: Optional[bool] = None
+    min_confidence: Optional[float] = None
+
+class AutoAnalysisSettingsResponse(BaseModel):
+    enabled: bool
+    min_confidence: float
+    queue: Dict[str, int]
+
+class AutoAnalysisRetryResponse(BaseModel):
+    requeued: int
+
+class AnalysisQueueStatus(str, Enum):
+    PENDING = "Pending"
+    RUNNING = "Running"
+    SUCCEEDED = "Succeeded"
+    DEAD = "Dead"
+
+class AnalysisQueueItemResponse(BaseResponseSchema):
+    post_id: int
+    status: AnalysisQueueStatus
+    attempts: int
+    last_error: Optional[str]
+    finished_at: Optional[datetime]
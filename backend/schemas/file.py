@@ -8,6 +8,7 @@ class FileUploadResponse(BaseModel):
     filename: str
     original_filename: str
     size: int
+    sha256: str
     url: str
     proposal_id: int
     created_at: str
@@ -17,6 +18,7 @@ class ProposalFileResponse(BaseResponseSchema):
     proposal_id: int
     filename: str
     size: int
+    sha256: Optional[str] = None
     url: str
 
 class FileStatisticsResponse(BaseModel):
@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+class SearchEntityType(str, Enum):
+    OPPORTUNITY = "opportunity"
+    PROPOSAL = "proposal"
+    CONTACT = "contact"
+    COMPANY = "company"
+    LINKEDIN_POST = "linkedin_post"
+
+class SearchResult(BaseModel):
+    entity_type: SearchEntityType
+    id: int
+    title: Optional[str] = None
+    snippet: Optional[str] = None
+    rank: float
+    created_at: datetime
+
+class SearchResponse(BaseModel):
+    query: str
+    results: List[SearchResult]
+    skip: int
+    limit: int
+    has_more: bool
@@ -7,6 +7,7 @@ from .auth_service import AuthService
 from .campaign_service import CampaignService
 from .contact_service import ContactService
 from .file_service import FileService
+from .search_service import SearchService
 
 __all__ = [
     "AIService",
@@ -17,5 +18,6 @@ __all__ = [
     "AuthService",
     "CampaignService",
     "ContactService",
-    "FileService"
+    "FileService",
+    "SearchService"
 ]
\ No newline at end of file
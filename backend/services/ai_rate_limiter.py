@@ -0,0 +1,161 @@
+from database import settings, AsyncSessionLocal
+from queries.ai_rate_limit_queries import AIRateLimitQueries, BucketLimits
+from services.principal_resolver import principal_resolver
+from utils.response_helpers import rate_limit_error
+from utils.token_counter import count_message_tokens
+from typing import Dict, Any, List, NamedTuple, Optional
+import asyncio
+import logging
+import math
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+# Tenant.settings key holding per-tenant overrides of the AI budgets
+RATE_LIMIT_SETTINGS_KEY = "ai_rate_limits"
+
+TENANT_SUBJECT = "tenant"
+
+# A bucket refills completely within a minute; a longer wait means a zero budget
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+class RateLimitPolicy(NamedTuple):
+    enabled: bool
+    requests_per_minute: int
+    tokens_per_minute: int
+    user_requests_per_minute: int
+    user_tokens_per_minute: int
+
+def resolve_rate_limit_policy(tenant_settings: Dict[str, Any]) -> RateLimitPolicy:
+    """Overlay a tenant's budget overrides on the deployment defaults."""
+    overrides = tenant_settings.get(RATE_LIMIT_SETTINGS_KEY) or {}
+    return RateLimitPolicy(
+        enabled=bool(overrides.get("enabled", settings.ai_rate_limit_enabled)),
+        requests_per_minute=int(overrides.get("requests_per_minute", settings.ai_rate_limit_tenant_requests_per_minute)),
+        tokens_per_minute=int(overrides.get("tokens_per_minute", settings.ai_rate_limit_tenant_tokens_per_minute)),
+        user_requests_per_minute=int(overrides.get("user_requests_per_minute", settings.ai_rate_limit_user_requests_per_minute)),
+        user_tokens_per_minute=int(overrides.get("user_tokens_per_minute", settings.ai_rate_limit_user_tokens_per_minute))
+    )
+
+def estimate_tokens(model_config: Dict[str, Any], messages: List[Dict[str, str]]) -> int:
+    """Upper estimate of a call's tokens: the prompt plus the full completion allowance."""
+    return count_message_tokens(messages, model_config["model"]) + model_config.get("max_tokens", 0)
+
+def _per_minute_limits(requests_per_minute: int, tokens_per_minute: int) -> BucketLimits:
+    # A full minute's budget can be spent in a burst, then refills continuously
+    return BucketLimits(requests_per_minute, requests_per_minute / 60, tokens_per_minute, tokens_per_minute / 60)
+
+class Reservation(NamedTuple):
+    tenant_id: int
+    subjects: List[str]
+    limits: List[BucketLimits]
+    tokens: int
+
+class AIRateLimiter:
+    """Per-tenant and per-user token buckets for AI calls, kept in the database so all workers share them.
+
+    Each bucket bounds both the number of calls and their estimated prompt plus completion
+    tokens. A call that would overdraw a bucket waits briefly for it to refill, and is
+    rejected with a 429 and Retry-After if the wait would be longer than that.
+    """
+
+    def __init__(self, max_wait_seconds: Optional[float] = None):
+        self.max_wait_seconds = settings.ai_rate_limit_max_wait_seconds if max_wait_seconds is None else max_wait_seconds
+
+    async def acquire(self, tenant_id: int, user_id: Optional[str], tokens: int, tenant_bucket: bool = True) -> Optional[Reservation]:
+        """Take one call and `tokens` from the tenant's (and user's) buckets; None when limits are off.
+
+        With `tenant_bucket` off only the user's bucket is charged, for a call the tenant already paid for.
+        """
+        deadline = time.monotonic() + self.max_wait_seconds
+
+        async with AsyncSessionLocal() as db:
+            policy = resolve_rate_limit_policy(await principal_resolver.get_tenant_settings(db, tenant_id))
+            if not policy.enabled:
+                return None
+
+            # User bucket first so concurrent takes lock rows in the same order
+            subjects, limits = [], []
+            if user_id:
+                subjects.append(f"user:{user_id}")
+                limits.append(_per_minute_limits(policy.user_requests_per_minute, policy.user_tokens_per_minute))
+            if tenant_bucket:
+                subjects.append(TENANT_SUBJECT)
+                limits.append(_per_minute_limits(policy.requests_per_minute, policy.tokens_per_minute))
+            if not subjects:
+                return None
+            for subject, bucket in zip(subjects, limits):
+                if bucket.request_capacity < 1 or bucket.token_capacity < 1:
+                    # A zero budget switches AI off for the tenant or user
+                    raise self._limit_error(tenant_id, subject, MAX_RETRY_AFTER_SECONDS)
+            # A call bigger than a whole bucket could never fit; let it drain the bucket instead
+            tokens = min([tokens] + [int(bucket.token_capacity) for bucket in limits])
+
+            queries = AIRateLimitQueries(db)
+            while True:
+                denied = await self._take_all(queries, tenant_id, subjects, limits, tokens)
+                if denied is None:
+                    await db.commit()
+                    return Reservation(tenant_id, subjects, limits, tokens)
+                await db.rollback()
+
+                subject, bucket = denied
+                retry_after = await self._seconds_until_available(queries, tenant_id, subject, bucket, tokens)
+                await db.rollback()
+                if time.monotonic() + retry_after > deadline:
+                    raise self._limit_error(tenant_id, subject, retry_after)
+                # Jitter so callers queued on the same bucket do not retry in lockstep
+                await asyncio.sleep(retry_after * random.uniform(1.0, 1.2))
+
+    async def settle(self, reservation: Optional[Reservation], actual_tokens: Optional[int]) -> None:
+        """Correct a reservation's estimate once the call's real token usage is known."""
+        if reservation is None or actual_tokens is None or actual_tokens == reservation.tokens:
+            return
+        async with AsyncSessionLocal() as db:
+            await AIRateLimitQueries(db).adjust_tokens(
+                reservation.tenant_id, reservation.subjects, reservation.limits, reservation.tokens - actual_tokens
+            )
+            await db.commit()
+
+    async def get_levels(self, tenant_id: int, user_id: Optional[str], policy: RateLimitPolicy) -> Dict[str, Any]:
+        """Current levels of the tenant's and user's buckets (full when never used)."""
+        buckets = {
+            "tenant": (TENANT_SUBJECT, _per_minute_limits(policy.requests_per_minute, policy.tokens_per_minute))
+        }
+        if user_id:
+            buckets["user"] = (
+                f"user:{user_id}", _per_minute_limits(policy.user_requests_per_minute, policy.user_tokens_per_minute)
+            )
+
+        levels = {}
+        async with AsyncSessionLocal() as db:
+            queries = AIRateLimitQueries(db)
+            for name, (subject, limits) in buckets.items():
+                current = await queries.get_levels(tenant_id, subject, limits)
+                current = current or {"requests": limits.request_capacity, "tokens": limits.token_capacity}
+                levels[name] = {key: round(value, 1) for key, value in current.items()}
+        return levels
+
+    async def _take_all(self, queries: AIRateLimitQueries, tenant_id: int, subjects: List[str], limits: List[BucketLimits], tokens: int):
+        """Take from every bucket in the open transaction; returns the first bucket that could not cover the call."""
+        for subject, bucket in zip(subjects, limits):
+            if not await queries.take(tenant_id, subject, bucket, tokens):
+                return subject, bucket
+        return None
+
+    async def _seconds_until_available(self, queries: AIRateLimitQueries, tenant_id: int, subject: str, bucket: BucketLimits, tokens: int) -> float:
+        levels = await queries.get_levels(tenant_id, subject, bucket)
+        if levels is None:
+            return 0.0
+        wait = max(
+            0.0,
+            (1 - levels["requests"]) / bucket.request_rate if bucket.request_rate else MAX_RETRY_AFTER_SECONDS,
+            (tokens - levels["tokens"]) / bucket.token_rate if bucket.token_rate else MAX_RETRY_AFTER_SECONDS
+        )
+        return min(wait, MAX_RETRY_AFTER_SECONDS)
+
+    def _limit_error(self, tenant_id: int, subject: str, retry_after: float):
+        scope = "your" if subject != TENANT_SUBJECT else "your organization's"
+        logger.info(f"AI rate limit hit for tenant {tenant_id} ({subject}), retry in {retry_after:.1f}s")
+        return rate_limit_error(f"AI usage limit reached for {scope} account", max(1, math.ceil(retry_after)))
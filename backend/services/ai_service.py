@@ -1,24 +1,61 @@
-from openai import AsyncOpenAI
-from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from models import LinkedInPost, Opportunity
 from queries.linkedin_queries import LinkedInQueries
 from queries.opportunity_queries import OpportunityQueries
-from database import settings
-from utils.response_helpers import not_found_error
+from services.analysis_cache_service import AnalysisCacheService
+from database import settings, AsyncSessionLocal
+from utils.response_helpers import not_found_error, validation_error
 from prompts import linkedin_analysis, proposal_generation, opportunity_analysis
+from prompts.registry import PromptVersion, list_versions
+from utils.stream_parsers import IncrementalJSONParser, IncrementalSectionParser
+from utils.opportunity_prefilter import score_post
+from utils.openai_client import get_openai_client
+from utils.single_flight import SingleFlight, Flight, advisory_lock
+from utils.rate_limiter import TokenBucket
+from services.model_router import RoutingPolicy, RouteMetrics, resolve_routing_policy, allowed_fast_models, choose_route, FAST, ESCALATED, ROUTING_SETTINGS_KEY
+from queries.auth_queries import AuthQueries
+from services.ai_rate_limiter import AIRateLimiter, Reservation, resolve_rate_limit_policy, estimate_tokens, RATE_LIMIT_SETTINGS_KEY
+from services.prompt_metrics import PromptMetrics
+from services.principal_resolver import principal_resolver
+from utils.token_counter import count_tokens, count_message_tokens
 import json
-from typing import Optional, Dict, Any
+import logging
+import time
+from typing import Optional, Dict, Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Opportunity analyses in flight in this process, keyed by their input
+_analysis_flights = SingleFlight()
+
+# The other prompts are unversioned; usage is still reported under these names
+LINKEDIN_ANALYSIS_PROMPT_ID = "linkedin_analysis"
+PROPOSAL_PROMPT_ID = "proposal_generation"
 
 class AIService:
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: AsyncSession,
+        user_id: Optional[str] = None,
+        rate_limit_wait_seconds: Optional[float] = None,
+        call_pacer: Optional[TokenBucket] = None
+    ):
         self.db = db
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        # Calls are charged to this user's AI budget as well as the tenant's
+        self.user_id = user_id
+        # Background work paces its model calls with this; cache hits and prefiltered posts skip it
+        self.call_pacer = call_pacer
+        self.client = get_openai_client()
+        self.rate_limiter = AIRateLimiter(rate_limit_wait_seconds)
         self.linkedin_queries = LinkedInQueries(db)
         self.opportunity_queries = OpportunityQueries(db)
+        self.cache_service = AnalysisCacheService(db)
+        self.auth_queries = AuthQueries(db)
 
     async def analyze_linkedin_post(self, post_id: int, tenant_id: int) -> Dict[str, Any]:
         # Use queries layer instead of direct DB access
-        post = self.linkedin_queries.get_post_by_id(post_id, tenant_id)
+        post = await self.linkedin_queries.get_post_by_id(post_id, tenant_id)
 
         if not post:
             raise not_found_error("Post", post_id)
@@ -29,9 +66,11 @@ class AIService:
         )
 
         try:
-            response = await self.client.chat.completions.create(
-                **linkedin_analysis.MODEL_CONFIG,
-                messages=[
+            response = await self._create_completion(
+                tenant_id,
+                LINKEDIN_ANALYSIS_PROMPT_ID,
+                linkedin_analysis.MODEL_CONFIG,
+                [
                     {"role": "system", "content": linkedin_analysis.SYSTEM_MESSAGE},
                     {"role": "user", "content": prompt}
                 ]
@@ -40,6 +79,8 @@ class AIService:
             result = json.loads(response.choices[0].message.content)
             return result
 
+        except HTTPException:
+            raise
         except Exception as e:
             raise Exception(f"AI analysis failed: {str(e)}")
 
@@ -50,23 +91,15 @@ class AIService:
         template_id: Optional[int] = None,
         additional_context: Optional[str] = None
     ) -> Dict[str, Any]:
-        # Use queries layer instead of direct DB access
-        opportunity = self.opportunity_queries.get_opportunity_by_id(opportunity_id, tenant_id)
-
-        if not opportunity:
-            raise not_found_error("Opportunity", opportunity_id)
-
-        prompt = proposal_generation.USER_PROMPT_TEMPLATE.format(
-            title=opportunity.title,
-            summary=opportunity.summary,
-            tags=opportunity.tags,
-            additional_context=additional_context or 'None'
-        )
+        opportunity = await self._get_opportunity_or_404(opportunity_id, tenant_id)
+        prompt = self._build_proposal_prompt(opportunity, additional_context)
 
         try:
-            response = await self.client.chat.completions.create(
-                **proposal_generation.MODEL_CONFIG,
-                messages=[
+            response = await self._create_completion(
+                tenant_id,
+                PROPOSAL_PROMPT_ID,
+                proposal_generation.MODEL_CONFIG,
+                [
                     {"role": "system", "content": proposal_generation.SYSTEM_MESSAGE},
                     {"role": "user", "content": prompt}
                 ]
@@ -81,203 +114,635 @@ class AIService:
                 "suggested_sections": sections
             }
 
+        except HTTPException:
+            raise
         except Exception as e:
             raise Exception(f"Proposal generation failed: {str(e)}")
 
-    def _parse_proposal_sections(self, content: str) -> list:
-        sections = []
-        current_section = None
-        current_content = []
-
-        for line in content.split('\n'):
-            if line.strip().startswith(('#', '##', '###')):
-                if current_section:
-                    sections.append({
-                        "title": current_section,
-                        "content": '\n'.join(current_content).strip()
-                    })
-                current_section = line.strip().lstrip('#').strip()
-                current_content = []
-            else:
-                current_content.append(line)
-
-        if current_section:
-            sections.append({
-                "title": current_section,
-                "content": '\n'.join(current_content).strip()
-            })
-
-        return sections
-
-    async def analyze_opportunity_comprehensive(self, post, enable_cache: bool = True) -> Dict[str, Any]:
-        """Comprehensive AI analysis of LinkedIn post for opportunity detection."""
+    async def generate_proposal_streaming(
+        self,
+        opportunity_id: int,
+        tenant_id: int,
+        template_id: Optional[int] = None,
+        additional_context: Optional[str] = None
+    ):
+        """Stream proposal tokens, emitting each section as soon as the next heading closes it.
+
+        Returns an async iterator of event dicts. The opportunity is loaded up front
+        so a missing opportunity surfaces as a 404 rather than mid-stream.
+        """
+        opportunity = await self._get_opportunity_or_404(opportunity_id, tenant_id)
+        messages = [
+            {"role": "system", "content": proposal_generation.SYSTEM_MESSAGE},
+            {"role": "user", "content": self._build_proposal_prompt(opportunity, additional_context)}
+        ]
+        # Reserved before streaming starts so an exhausted budget is a 429, not a mid-stream error
+        reservation = await self._reserve(tenant_id, proposal_generation.MODEL_CONFIG, messages)
+
+        async def generate():
+            yield {"status": "starting", "message": "Generating proposal..."}
+
+            parser = IncrementalSectionParser()
+            content_parts = []
+
+            try:
+                async for delta in self._stream_completion(reservation, PROPOSAL_PROMPT_ID, proposal_generation.MODEL_CONFIG, messages):
+                    content_parts.append(delta)
+                    yield {"status": "token", "content": delta}
+
+                    for section in parser.feed(delta):
+                        yield {"status": "section", "section": section}
+
+                for section in parser.finish():
+                    yield {"status": "section", "section": section}
+
+                yield {
+                    "status": "completed",
+                    "proposal_content": "".join(content_parts),
+                    "suggested_sections": parser.sections
+                }
 
-        # Use prompt from prompts layer
-        prompt = opportunity_analysis.USER_PROMPT_TEMPLATE.format(
-            post_content=post.content,
-            author_profile_url=post.author_profile_url or 'Not provided'
-        )
+            except HTTPException as e:
+                yield {"status": "error", "error": e.detail}
+            except Exception as e:
+                yield {"status": "error", "error": f"Proposal generation failed: {str(e)}"}
 
-        try:
-            response = await self.client.chat.completions.create(
-                **opportunity_analysis.MODEL_CONFIG,
-                messages=[
-                    {"role": "system", "content": opportunity_analysis.SYSTEM_MESSAGE},
-                    {"role": "user", "content": prompt}
-                ]
-            )
+        return generate()
 
-            result = json.loads(response.choices[0].message.content)
+    async def _get_opportunity_or_404(self, opportunity_id: int, tenant_id: int) -> Opportunity:
+        # Use queries layer instead of direct DB access
+        opportunity = await self.opportunity_queries.get_opportunity_by_id(opportunity_id, tenant_id)
 
-            # Helper function to extract value from nested format
-            def extract_value(field, default=None):
-                if isinstance(field, dict) and 'value' in field:
-                    return field['value'] if field['value'] not in ['Not mentioned', 'Not provided', None] else default
-                return field if field not in ['Not mentioned', 'Not provided', None] else default
-
-            def extract_confidence(field, default=0.0):
-                if isinstance(field, dict) and 'confidence' in field:
-                    return field['confidence']
-                return default
-
-            # Process company suggestion
-            company_raw = result.get("company_suggestion")
-            company_suggestion = None
-            if company_raw and extract_value(company_raw.get('name')):
-                company_suggestion = {
-                    "name": extract_value(company_raw.get('name')),
-                    "confidence": extract_confidence(company_raw.get('name'), 0.0),
-                    "domain": extract_value(company_raw.get('domain')),
-                    "linkedin_url": extract_value(company_raw.get('linkedin_url'))
-                }
+        if not opportunity:
+            raise not_found_error("Opportunity", opportunity_id)
 
-            # Process contact suggestion
-            contact_raw = result.get("contact_suggestion")
-            contact_suggestion = None
-            if contact_raw:
-                contact_suggestion = {
-                    "name": extract_value(contact_raw.get('name')),
-                    "email": extract_value(contact_raw.get('email')),
-                    "phone": extract_value(contact_raw.get('phone')),
-                    "linkedin_profile_url": extract_value(contact_raw.get('linkedin_profile_url')),
-                    "confidence": max([
-                        extract_confidence(contact_raw.get('name'), 0.0),
-                        extract_confidence(contact_raw.get('email'), 0.0),
-                        extract_confidence(contact_raw.get('phone'), 0.0),
-                        extract_confidence(contact_raw.get('linkedin_profile_url'), 0.0)
-                    ])
-                }
+        return opportunity
 
-            # Ensure all required fields exist with defaults
-            return {
-                "is_opportunity": result.get("is_opportunity", False),
-                "confidence": result.get("confidence", 0.0),
-                "extracted_fields": result.get("extracted_fields", {}),
-                "company_suggestion": company_suggestion,
-                "contact_suggestion": contact_suggestion,
-                "category": result.get("category", "other"),
-                "urgency": result.get("urgency", "normal"),
-                "tags": result.get("tags", []),
-                "budget_range": extract_value(result.get("budget_range")),
-                "timeline": extract_value(result.get("timeline"))
-            }
+    def _build_proposal_prompt(self, opportunity: Opportunity, additional_context: Optional[str]) -> str:
+        return proposal_generation.USER_PROMPT_TEMPLATE.format(
+            title=opportunity.title,
+            summary=opportunity.summary,
+            tags=opportunity.tags,
+            additional_context=additional_context or 'None'
+        )
 
-        except json.JSONDecodeError as e:
-            raise Exception(f"AI returned invalid JSON: {str(e)}")
-        except Exception as e:
-            raise Exception(f"AI analysis failed: {str(e)}")
+    def _parse_proposal_sections(self, content: str) -> list:
+        parser = IncrementalSectionParser()
+        parser.feed(content)
+        parser.finish()
+        return parser.sections
 
-    async def analyze_opportunity_comprehensive_streaming(self, post, enable_cache: bool = True):
-        """Streaming version of comprehensive AI analysis with progressive updates."""
+    async def analyze_opportunity_comprehensive(
+        self,
+        post,
+        enable_cache: bool = True,
+        enable_prefilter: bool = True
+    ) -> Dict[str, Any]:
+        """Comprehensive AI analysis of LinkedIn post for opportunity detection."""
+        if enable_prefilter:
+            rejected = self.prefilter_post(post)
+            if rejected is not None:
+                return rejected
+
+        policy = await self._get_routing_policy(post.tenant_id)
+        route = choose_route(post.content, policy)
+
+        cache_key = None
+        if enable_cache:
+            cache_key = self._analysis_cache_key(post, route, policy)
+            cached_result = await self.cache_service.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+
+        messages = self._build_analysis_messages(post)
+
+        while True:
+            flight, leader = await self._join_analysis_flight(
+                post, messages, route, policy, cache_key,
+                lambda flight: self._run_routed_analysis(post.tenant_id, messages, route, policy)
+            )
+            try:
+                return await flight.result()
+            except HTTPException as e:
+                # The leader may have run out of its own user budget; this caller makes its own call
+                if leader or e.status_code != 429:
+                    raise
+
+    async def analyze_opportunity_comprehensive_streaming(
+        self,
+        post,
+        enable_cache: bool = True,
+        enable_prefilter: bool = True
+    ):
+        """Streaming version of comprehensive AI analysis, emitting each section as soon as the model finishes it."""
 
         # Yield initial status
         yield json.dumps({"status": "starting", "message": "Initializing AI analysis..."}) + "\n"
 
-        # Use prompt from prompts layer
-        prompt = opportunity_analysis.USER_PROMPT_TEMPLATE.format(
-            post_content=post.content,
-            author_profile_url=post.author_profile_url or 'Not provided'
-        )
+        if enable_prefilter:
+            rejected = self.prefilter_post(post)
+            if rejected is not None:
+                yield json.dumps({"status": "completed", "result": rejected, "prefiltered": True}) + "\n"
+                return
+
+        policy = await self._get_routing_policy(post.tenant_id)
+        route = choose_route(post.content, policy)
+
+        cache_key = None
+        if enable_cache:
+            cache_key = self._analysis_cache_key(post, route, policy)
+            cached_result = await self.cache_service.get(cache_key)
+            if cached_result is not None:
+                yield json.dumps({"status": "completed", "result": cached_result, "cached": True}) + "\n"
+                return
+
+        messages = self._build_analysis_messages(post)
 
         yield json.dumps({"status": "analyzing", "message": "Analyzing post content with AI..."}) + "\n"
 
+        # Identical analyses already in flight are followed instead of re-run; their events are replayed
         try:
-            response = await self.client.chat.completions.create(
-                **opportunity_analysis.MODEL_CONFIG,
-                messages=[
-                    {"role": "system", "content": opportunity_analysis.SYSTEM_MESSAGE},
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            while True:
+                flight, leader = await self._join_analysis_flight(
+                    post, messages, route, policy, cache_key,
+                    lambda flight: self._stream_routed_analysis(post.tenant_id, messages, route, policy, flight)
+                )
+                try:
+                    async for event in flight.events():
+                        yield event
+                    final_result = await flight.result()
+                    break
+                except HTTPException as e:
+                    # The leader may have run out of its own user budget; this caller makes its own call
+                    if leader or e.status_code != 429:
+                        raise
+
+            yield json.dumps({"status": "finalizing", "message": "Finalizing analysis results..."}) + "\n"
+
+            completed = {"status": "completed", "result": final_result}
+            if not leader:
+                completed["shared"] = True
+            yield json.dumps(completed) + "\n"
 
-            yield json.dumps({"status": "processing", "message": "Processing AI response..."}) + "\n"
+        except json.JSONDecodeError as e:
+            yield json.dumps({"status": "error", "error": f"AI returned invalid JSON: {str(e)}"}) + "\n"
+        except HTTPException as e:
+            error = {"status": "error", "error": e.detail}
+            if e.headers and "Retry-After" in e.headers:
+                error["retry_after"] = int(e.headers["Retry-After"])
+            yield json.dumps(error) + "\n"
+        except Exception as e:
+            yield json.dumps({"status": "error", "error": f"AI analysis failed: {str(e)}"}) + "\n"
+
+    async def _stream_routed_analysis(self, tenant_id: int, messages: list, route: str, policy: RoutingPolicy, flight: Flight) -> Dict[str, Any]:
+        """Streaming counterpart of _run_routed_analysis, publishing progress events to the flight."""
+        started = time.perf_counter()
+        escalation_reason = None
+        try:
+            if route == FAST:
+                outcome = {}
+                try:
+                    async for event in self._stream_analysis_events(tenant_id, self._fast_model_config(policy), messages, outcome):
+                        flight.publish(event)
+                    final_result = self._validate_analysis(outcome["result"])
+                    if final_result["confidence"] < policy.min_confidence:
+                        escalation_reason = "low_confidence"
+                except ValueError:
+                    escalation_reason = "invalid_response"
+                except HTTPException:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Fast model analysis failed, escalating: {e}")
+                    escalation_reason = "fast_model_error"
+
+                if escalation_reason:
+                    route = ESCALATED
+                    # Events already sent came from the fast model; the large model's supersede them
+                    flight.publish(json.dumps({"status": "escalating", "message": "Double-checking with a more capable model..."}) + "\n")
+
+            if route != FAST:
+                outcome = {}
+                async for event in self._stream_analysis_events(tenant_id, opportunity_analysis.MODEL_CONFIG, messages, outcome):
+                    flight.publish(event)
+                final_result = self._normalize_analysis_result(outcome["result"])
+
+        except Exception:
+            RouteMetrics.record(route, time.perf_counter() - started, error=True, escalation_reason=escalation_reason)
+            raise
+
+        # Streamed responses carry no token usage, so only latency is recorded
+        RouteMetrics.record(route, time.perf_counter() - started, escalation_reason=escalation_reason)
+        return final_result
+
+    async def _join_analysis_flight(
+        self,
+        post,
+        messages: list,
+        route: str,
+        policy: RoutingPolicy,
+        cache_key: Optional[str],
+        produce
+    ) -> Tuple[Flight, bool]:
+        """Join the in-flight analysis of identical input, or start it; returns the flight and whether this caller leads.
+
+        Users of a tenant share one call, which the leader's reservation charges to the tenant.
+        A follower still pays its estimate from its own user budget, without waiting, so sharing
+        does not let one user run past their limit; over it, the follower gets the 429.
+        """
+        flight_key = None
+        if settings.ai_singleflight_enabled:
+            # The routing policy changes which models answer, so tenants with different policies do not share
+            content_key = AnalysisCacheService.build_cache_key(post.content, post.author_profile_url)
+            flight_key = f"{post.tenant_id}:{content_key}:{tuple(policy)}"
+        flight, leader = _analysis_flights.join(
+            flight_key, lambda flight: self._run_analysis_flight(flight_key, cache_key, lambda: produce(flight))
+        )
+        if not leader:
+            model_config = self._fast_model_config(policy) if route == FAST else opportunity_analysis.MODEL_CONFIG
+            await AIRateLimiter(0).acquire(post.tenant_id, self.user_id, estimate_tokens(model_config, messages), tenant_bucket=False)
+        return flight, leader
+
+    async def _run_analysis_flight(self, flight_key: Optional[str], cache_key: Optional[str], produce) -> Dict[str, Any]:
+        """Run a shared analysis, caching its result before the next caller can start the same one.
+
+        It runs detached from the request that started it, so it uses its own sessions.
+        """
+        if flight_key and settings.ai_singleflight_cross_worker:
+            async with advisory_lock(f"analysis:{flight_key}", settings.ai_singleflight_lock_wait_seconds) as waited:
+                if waited and cache_key:
+                    # Another worker just ran this analysis; its result is in the shared cache
+                    async with AsyncSessionLocal() as db:
+                        cached_result = await AnalysisCacheService(db).get(cache_key)
+                    if cached_result is not None:
+                        return cached_result
+                return await self._produce_and_cache(cache_key, produce)
+        return await self._produce_and_cache(cache_key, produce)
+
+    async def _produce_and_cache(self, cache_key: Optional[str], produce) -> Dict[str, Any]:
+        result = await produce()
+        if cache_key:
+            async with AsyncSessionLocal() as db:
+                await AnalysisCacheService(db).set(cache_key, result)
+        return result
+
+    async def _stream_analysis_events(self, tenant_id: int, model_config: Dict[str, Any], messages: list, outcome: Dict[str, Any]):
+        """Stream one model's analysis as progress events, leaving the decoded document in outcome["result"]."""
+        reservation = await self._reserve(tenant_id, model_config, messages)
+
+        # Report each top-level key and extracted field the moment its JSON value closes
+        parser = IncrementalJSONParser(max_depth=2)
+        prompt_id = opportunity_analysis.active_prompt().prompt_id
+        async for delta in self._stream_completion(reservation, prompt_id, model_config, messages):
+            for path, value in parser.feed(delta):
+                event = self._build_analysis_stream_event(path, value)
+                if event:
+                    yield json.dumps(event) + "\n"
+
+        outcome["result"] = parser.result()
+
+    async def _run_routed_analysis(self, tenant_id: int, messages: list, route: str, policy: RoutingPolicy) -> Dict[str, Any]:
+        """Analyze on the route's model, escalating a weak or malformed fast-model answer to the large model."""
+        started = time.perf_counter()
+        usage = {}
+        escalation_reason = None
+        prompt_id = opportunity_analysis.active_prompt().prompt_id
+
+        if route == FAST:
+            try:
+                response = await self._create_completion(tenant_id, prompt_id, self._fast_model_config(policy), messages, usage)
+                result = self._validate_analysis(json.loads(response.choices[0].message.content))
+                if result["confidence"] >= policy.min_confidence:
+                    RouteMetrics.record(FAST, time.perf_counter() - started, usage)
+                    return result
+                escalation_reason = "low_confidence"
+            except ValueError:
+                escalation_reason = "invalid_response"
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.warning(f"Fast model analysis failed, escalating: {e}")
+                escalation_reason = "fast_model_error"
+            route = ESCALATED
 
+        try:
+            response = await self._create_completion(tenant_id, prompt_id, opportunity_analysis.MODEL_CONFIG, messages, usage)
             result = json.loads(response.choices[0].message.content)
+        except json.JSONDecodeError as e:
+            RouteMetrics.record(route, time.perf_counter() - started, usage, error=True, escalation_reason=escalation_reason)
+            raise Exception(f"AI returned invalid JSON: {str(e)}")
+        except HTTPException:
+            RouteMetrics.record(route, time.perf_counter() - started, usage, error=True, escalation_reason=escalation_reason)
+            raise
+        except Exception as e:
+            RouteMetrics.record(route, time.perf_counter() - started, usage, error=True, escalation_reason=escalation_reason)
+            raise Exception(f"AI analysis failed: {str(e)}")
 
-            # Helper functions (same as non-streaming version)
-            def extract_value(field, default=None):
-                if isinstance(field, dict) and 'value' in field:
-                    return field['value'] if field['value'] not in ['Not mentioned', 'Not provided', None] else default
-                return field if field not in ['Not mentioned', 'Not provided', None] else default
-
-            def extract_confidence(field, default=0.0):
-                if isinstance(field, dict) and 'confidence' in field:
-                    return field['confidence']
-                return default
-
-            # Stream progress updates for different analysis phases
-            yield json.dumps({"status": "extracting_fields", "message": "Extracting opportunity fields..."}) + "\n"
-
-            # Process company suggestion
-            company_raw = result.get("company_suggestion")
-            company_suggestion = None
-            if company_raw and extract_value(company_raw.get('name')):
-                company_suggestion = {
-                    "name": extract_value(company_raw.get('name')),
-                    "confidence": extract_confidence(company_raw.get('name'), 0.0),
-                    "domain": extract_value(company_raw.get('domain')),
-                    "linkedin_url": extract_value(company_raw.get('linkedin_url'))
-                }
-                yield json.dumps({"status": "company_extracted", "message": f"Found company: {company_suggestion['name']}"}) + "\n"
-
-            # Process contact suggestion
-            contact_raw = result.get("contact_suggestion")
-            contact_suggestion = None
-            if contact_raw:
-                contact_suggestion = {
-                    "name": extract_value(contact_raw.get('name')),
-                    "email": extract_value(contact_raw.get('email')),
-                    "phone": extract_value(contact_raw.get('phone')),
-                    "linkedin_profile_url": extract_value(contact_raw.get('linkedin_profile_url')),
-                    "confidence": max([
-                        extract_confidence(contact_raw.get('name'), 0.0),
-                        extract_confidence(contact_raw.get('email'), 0.0),
-                        extract_confidence(contact_raw.get('phone'), 0.0),
-                        extract_confidence(contact_raw.get('linkedin_profile_url'), 0.0)
-                    ])
-                }
-                yield json.dumps({"status": "contact_extracted", "message": f"Found contact info"}) + "\n"
+        RouteMetrics.record(route, time.perf_counter() - started, usage, escalation_reason=escalation_reason)
+        return self._normalize_analysis_result(result)
 
-            yield json.dumps({"status": "finalizing", "message": "Finalizing analysis results..."}) + "\n"
+    async def _reserve(self, tenant_id: int, model_config: Dict[str, Any], messages: list) -> Optional[Reservation]:
+        if self.call_pacer is not None:
+            await self.call_pacer.acquire()
+        return await self.rate_limiter.acquire(tenant_id, self.user_id, estimate_tokens(model_config, messages))
 
-            # Final result
-            final_result = {
-                "is_opportunity": result.get("is_opportunity", False),
-                "confidence": result.get("confidence", 0.0),
-                "extracted_fields": result.get("extracted_fields", {}),
-                "company_suggestion": company_suggestion,
-                "contact_suggestion": contact_suggestion,
-                "category": result.get("category", "other"),
-                "urgency": result.get("urgency", "normal"),
-                "tags": result.get("tags", []),
-                "budget_range": extract_value(result.get("budget_range")),
-                "timeline": extract_value(result.get("timeline"))
+    async def _create_completion(
+        self,
+        tenant_id: int,
+        prompt_id: str,
+        model_config: Dict[str, Any],
+        messages: list,
+        usage_totals: Optional[Dict[str, int]] = None
+    ):
+        """Make a model call within the tenant's and user's AI budgets, recording its token usage.
+
+        The call's prompt and completion tokens are also added to `usage_totals` when given.
+        """
+        reservation = await self._reserve(tenant_id, model_config, messages)
+        started = time.perf_counter()
+        try:
+            response = await self.client.create_chat_completion(**model_config, messages=messages)
+        except Exception:
+            # Nothing was generated, so give the reserved tokens back; the request still counts
+            await self.rate_limiter.settle(reservation, 0)
+            raise
+
+        usage = _call_usage(response)
+        if usage is None:
+            usage = {
+                "prompt_tokens": count_message_tokens(messages, model_config["model"]),
+                "completion_tokens": count_tokens(response.choices[0].message.content or "", model_config["model"])
             }
+        await self.rate_limiter.settle(reservation, usage["prompt_tokens"] + usage["completion_tokens"])
+        _report_usage(prompt_id, model_config["model"], time.perf_counter() - started, usage)
+        if usage_totals is not None:
+            for key in ("prompt_tokens", "completion_tokens"):
+                usage_totals[key] = usage_totals.get(key, 0) + usage[key]
+        return response
+
+    async def _stream_completion(self, reservation: Optional[Reservation], prompt_id: str, model_config: Dict[str, Any], messages: list):
+        """Stream a reserved model call's content deltas, then record and charge its counted usage."""
+        started = time.perf_counter()
+        parts = []
+        try:
+            response = await self.client.create_chat_completion(**model_config, messages=messages, stream=True)
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                yield delta
+        except Exception:
+            # Give the reserved tokens back if nothing was generated; the request still counts
+            await self.rate_limiter.settle(reservation, _streamed_usage(model_config, messages, parts)["total"] if parts else 0)
+            raise
+
+        # Streamed responses carry no usage, so it is counted from the prompt and what was streamed
+        usage = _streamed_usage(model_config, messages, parts)
+        await self.rate_limiter.settle(reservation, usage.pop("total"))
+        _report_usage(prompt_id, model_config["model"], time.perf_counter() - started, usage)
+
+    async def _get_routing_policy(self, tenant_id: int) -> RoutingPolicy:
+        return resolve_routing_policy(await principal_resolver.get_tenant_settings(self.db, tenant_id))
+
+    def _analysis_cache_key(self, post, route: str, policy: RoutingPolicy) -> str:
+        """Cache key for the post's analysis as this route answers it; large-model answers are shared by every tenant."""
+        fast_route = None
+        if route == FAST:
+            fast_route = {"model_config": self._fast_model_config(policy), "min_confidence": policy.min_confidence}
+        return AnalysisCacheService.build_cache_key(post.content, post.author_profile_url, fast_route)
+
+    def _fast_model_config(self, policy: RoutingPolicy) -> Dict[str, Any]:
+        return {**opportunity_analysis.FAST_MODEL_CONFIG, "model": policy.fast_model}
+
+    def _validate_analysis(self, result: Any) -> Dict[str, Any]:
+        """Normalize a fast-model answer, raising ValueError if it lacks a usable verdict."""
+        if not isinstance(result, dict):
+            raise ValueError("Analysis is not a JSON object")
+        if not isinstance(result.get("is_opportunity"), bool):
+            raise ValueError("Analysis has no is_opportunity verdict")
+        confidence = result.get("confidence")
+        if isinstance(confidence, bool) or not isinstance(confidence, (int, float)) or not 0 <= confidence <= 1:
+            raise ValueError("Analysis confidence is not between 0 and 1")
+        if not isinstance(result.get("extracted_fields", {}), dict):
+            raise ValueError("Analysis extracted_fields is not an object")
+        return self._normalize_analysis_result(result)
+
+    def prefilter_post(self, post) -> Optional[Dict[str, Any]]:
+        """Screen out posts that clearly are not opportunities; returns the no-opportunity result, or None to analyze."""
+        if not settings.ai_prefilter_enabled:
+            return None
+
+        prefilter = score_post(post.content)
+        if prefilter.score >= settings.ai_prefilter_min_score:
+            return None
+
+        logger.debug(f"Prefilter skipped post {post.id} (score {prefilter.score}, signals {prefilter.signals})")
+        result = self._normalize_analysis_result({"is_opportunity": False, "confidence": 0.0})
+        # Kept on the stored result so a skipped post can be told apart from a model verdict
+        result["prefilter"] = {
+            "score": prefilter.score,
+            "min_score": settings.ai_prefilter_min_score,
+            "signals": prefilter.signals
+        }
+        return result
+
+    async def get_routing_overview(self, tenant_id: int) -> Dict[str, Any]:
+        """Get the tenant's effective routing policy and this process's per-route metrics."""
+        policy = await self._get_routing_policy(tenant_id)
+        return {
+            "policy": policy._asdict(),
+            "large_model": opportunity_analysis.MODEL_CONFIG["model"],
+            "allowed_fast_models": allowed_fast_models(),
+            "routes": RouteMetrics.snapshot()
+        }
+
+    async def update_routing_policy(self, tenant_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Store per-tenant overrides of the routing policy."""
+        if "min_confidence" in updates and not 0 <= updates["min_confidence"] <= 1:
+            raise validation_error("min_confidence must be between 0 and 1")
+        if "max_fast_chars" in updates and updates["max_fast_chars"] < 0:
+            raise validation_error("max_fast_chars cannot be negative")
+        if "fast_model" in updates and updates["fast_model"] not in allowed_fast_models():
+            raise validation_error(f"fast_model must be one of: {', '.join(allowed_fast_models())}")
+
+        tenant_settings = await self.auth_queries.get_tenant_settings(tenant_id)
+        tenant_settings[ROUTING_SETTINGS_KEY] = {**(tenant_settings.get(ROUTING_SETTINGS_KEY) or {}), **updates}
+        await self.auth_queries.update_tenant_settings(tenant_id, tenant_settings)
+        principal_resolver.invalidate_tenant(tenant_id)
+        return await self.get_routing_overview(tenant_id)
+
+    def get_prompt_overview(self) -> Dict[str, Any]:
+        """Registered analysis prompt versions and this process's token and latency metrics per version."""
+        active = opportunity_analysis.active_prompt()
+        model = opportunity_analysis.MODEL_CONFIG["model"]
+        return {
+            "versions": [
+                {
+                    "prompt_id": prompt.prompt_id,
+                    "active": prompt == active,
+                    "static_prefix_tokens": count_message_tokens([{"role": "system", "content": prompt.system_message}], model)
+                }
+                for prompt in list_versions(opportunity_analysis.NAME)
+            ],
+            "metrics": PromptMetrics.snapshot()
+        }
+
+    async def get_rate_limits(self, tenant_id: int) -> Dict[str, Any]:
+        """Get the tenant's effective AI budgets and how much of them is left right now."""
+        policy = resolve_rate_limit_policy(await principal_resolver.get_tenant_settings(self.db, tenant_id))
+        return {
+            "policy": policy._asdict(),
+            "levels": await self.rate_limiter.get_levels(tenant_id, self.user_id, policy)
+        }
+
+    async def update_rate_limits(self, tenant_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Store per-tenant overrides of the AI budgets."""
+        for key, value in updates.items():
+            if key != "enabled" and (value is None or value < 0):
+                raise validation_error(f"{key} cannot be negative")
+
+        tenant_settings = await self.auth_queries.get_tenant_settings(tenant_id)
+        tenant_settings[RATE_LIMIT_SETTINGS_KEY] = {**(tenant_settings.get(RATE_LIMIT_SETTINGS_KEY) or {}), **updates}
+        await self.auth_queries.update_tenant_settings(tenant_id, tenant_settings)
+        principal_resolver.invalidate_tenant(tenant_id)
+        return await self.get_rate_limits(tenant_id)
+
+    async def get_cache_statistics(self) -> Dict[str, Any]:
+        """Get analysis cache hit/miss counters, shared cache totals and in-flight deduplication counters."""
+        statistics = await self.cache_service.get_statistics()
+        statistics["single_flight"] = _analysis_flights.stats()
+        return statistics
+
+    def _build_analysis_messages(self, post) -> list:
+        return build_analysis_messages(opportunity_analysis.active_prompt(), post.content, post.author_profile_url)
+
+    def _build_analysis_stream_event(self, path: tuple, value: Any) -> Optional[Dict[str, Any]]:
+        """Turn a completed member of the streamed analysis JSON into a progress event."""
+        if path == ("company_suggestion",):
+            company_suggestion = self._normalize_company_suggestion(value)
+            if company_suggestion:
+                return {
+                    "status": "company_extracted",
+                    "message": f"Found company: {company_suggestion['name']}",
+                    "company_suggestion": company_suggestion
+                }
+            return None
+
+        if path == ("contact_suggestion",):
+            contact_suggestion = self._normalize_contact_suggestion(value)
+            if contact_suggestion:
+                return {
+                    "status": "contact_extracted",
+                    "message": "Found contact info",
+                    "contact_suggestion": contact_suggestion
+                }
+            return None
 
-            # Yield final result
-            yield json.dumps({"status": "completed", "result": final_result}) + "\n"
+        if len(path) == 2 and path[0] == "extracted_fields":
+            return {
+                "status": "field_extracted",
+                "field": path[1],
+                "value": _extract_value(value),
+                "confidence": _extract_confidence(value)
+            }
 
-        except json.JSONDecodeError as e:
-            yield json.dumps({"status": "error", "error": f"AI returned invalid JSON: {str(e)}"}) + "\n"
-        except Exception as e:
-            yield json.dumps({"status": "error", "error": f"AI analysis failed: {str(e)}"}) + "\n"
\ No newline at end of file
+        if len(path) == 1 and path[0] in ("is_opportunity", "confidence", "category", "urgency", "tags", "budget_range", "timeline"):
+            return {"status": "field_extracted", "field": path[0], "value": _extract_value(value)}
+
+        return None
+
+    def _normalize_company_suggestion(self, company_raw: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(company_raw, dict) or not _extract_value(company_raw.get('name')):
+            return None
+
+        return {
+            "name": _extract_value(company_raw.get('name')),
+            "confidence": _extract_confidence(company_raw.get('name'), 0.0),
+            "domain": _extract_value(company_raw.get('domain')),
+            "linkedin_url": _extract_value(company_raw.get('linkedin_url'))
+        }
+
+    def _normalize_contact_suggestion(self, contact_raw: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(contact_raw, dict) or not contact_raw:
+            return None
+
+        return {
+            "name": _extract_value(contact_raw.get('name')),
+            "email": _extract_value(contact_raw.get('email')),
+            "phone": _extract_value(contact_raw.get('phone')),
+            "linkedin_profile_url": _extract_value(contact_raw.get('linkedin_profile_url')),
+            "confidence": max([
+                _extract_confidence(contact_raw.get('name'), 0.0),
+                _extract_confidence(contact_raw.get('email'), 0.0),
+                _extract_confidence(contact_raw.get('phone'), 0.0),
+                _extract_confidence(contact_raw.get('linkedin_profile_url'), 0.0)
+            ])
+        }
+
+    def _normalize_analysis_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten the model's nested value/confidence format into the response shape."""
+        # Ensure all required fields exist with defaults
+        return {
+            "is_opportunity": result.get("is_opportunity", False),
+            "confidence": result.get("confidence", 0.0),
+            "extracted_fields": result.get("extracted_fields", {}),
+            "company_suggestion": self._normalize_company_suggestion(result.get("company_suggestion")),
+            "contact_suggestion": self._normalize_contact_suggestion(result.get("contact_suggestion")),
+            "category": result.get("category", "other"),
+            "urgency": result.get("urgency", "normal"),
+            "tags": result.get("tags", []),
+            "budget_range": _extract_value(result.get("budget_range")),
+            "timeline": _extract_value(result.get("timeline"))
+        }
+
+def build_analysis_messages(prompt: PromptVersion, post_content: Optional[str], author_profile_url: Optional[str]) -> list:
+    """Render an analysis prompt version for one post; the static system message always comes first."""
+    return [
+        {"role": "system", "content": prompt.system_message},
+        {"role": "user", "content": prompt.user_template.format(
+            post_content=post_content,
+            author_profile_url=author_profile_url or 'Not provided'
+        )}
+    ]
+
+def _extract_value(field, default=None):
+    """Extract value from the model's nested {"value", "confidence"} format."""
+    if isinstance(field, dict) and 'value' in field:
+        return field['value'] if field['value'] not in ['Not mentioned', 'Not provided', None] else default
+    return field if field not in ['Not mentioned', 'Not provided', None] else default
+
+def _streamed_usage(model_config: Dict[str, Any], messages: list, parts: list) -> Dict[str, int]:
+    usage = {
+        "prompt_tokens": count_message_tokens(messages, model_config["model"]),
+        "completion_tokens": count_tokens("".join(parts), model_config["model"])
+    }
+    usage["total"] = usage["prompt_tokens"] + usage["completion_tokens"]
+    return usage
+
+def _call_usage(response) -> Optional[Dict[str, int]]:
+    """Token usage reported with a completion, including prompt tokens served from the provider's prefix cache."""
+    reported = getattr(response, "usage", None)
+    if not reported:
+        return None
+    details = getattr(reported, "prompt_tokens_details", None) or {}
+    cached = details.get("cached_tokens") if isinstance(details, dict) else getattr(details, "cached_tokens", None)
+    return {
+        "prompt_tokens": reported.prompt_tokens,
+        "completion_tokens": reported.completion_tokens,
+        "cached_tokens": cached or 0
+    }
+
+def _report_usage(prompt_id: str, model: str, latency_seconds: float, usage: Dict[str, int]) -> None:
+    logger.info(
+        f"{prompt_id} on {model}: {usage['prompt_tokens']} prompt tokens "
+        f"({usage.get('cached_tokens', 0)} cached), {usage['completion_tokens']} completion tokens, "
+        f"{latency_seconds * 1000:.0f}ms"
+    )
+    PromptMetrics.record(prompt_id, model, latency_seconds, usage)
+
+def _extract_confidence(field, default=0.0):
+    if isinstance(field, dict) and 'confidence' in field:
+        return field['confidence']
+    return default
\ No newline at end of file
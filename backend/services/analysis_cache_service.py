@@ -0,0 +1,113 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from queries.ai_cache_queries import AICacheQueries
+from prompts import opportunity_analysis
+from database import settings
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AnalysisCacheService:
+    """Content-addressed cache for opportunity analysis results, shared across workers via the database."""
+
+    # Per-process counters; the database keeps the cross-worker hit totals
+    _counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0}
+    # Stores in this process since the last eviction sweep
+    _stores_since_eviction = 0
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.queries = AICacheQueries(db)
+        self.ttl = timedelta(seconds=settings.ai_cache_ttl_seconds)
+        self.max_entries = settings.ai_cache_max_entries
+
+    @staticmethod
+    def build_cache_key(
+        post_content: Optional[str],
+        author_profile_url: Optional[str],
+        fast_route: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Hash every input that can change the analysis output.
+
+        `fast_route` describes the fast model and escalation threshold when the post is routed to
+        the fast model first, so its answers are never served where the large model would answer.
+        """
+        payload = {
+            "post_content": post_content or "",
+            "author_profile_url": author_profile_url or "",
+            "prompt_version": opportunity_analysis.active_prompt().version,
+            "model_config": opportunity_analysis.MODEL_CONFIG
+        }
+        if fast_route is not None:
+            payload["fast_route"] = fast_route
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    async def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached analysis for a key, or None on miss."""
+        try:
+            result = await self.queries.get_and_touch_entry(cache_key)
+        except Exception as e:
+            # The cache must never take the analysis path down with it
+            await self.db.rollback()
+            self._counters["errors"] += 1
+            logger.warning(f"Analysis cache lookup failed: {e}")
+            return None
+
+        if result is None:
+            self._counters["misses"] += 1
+            return None
+
+        self._counters["hits"] += 1
+        return result
+
+    async def set(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Store an analysis result, periodically enforcing the TTL and size bound.
+
+        The sweep runs once every `ai_cache_evict_every_stores` stores, so the cache can
+        overshoot max_entries by that many entries per worker between sweeps.
+        """
+        entry_data = {
+            "cache_key": cache_key,
+            "prompt_version": opportunity_analysis.active_prompt().version,
+            "model": opportunity_analysis.MODEL_CONFIG["model"],
+            "result": result,
+            "hit_count": 0,
+            "expires_at": datetime.now(timezone.utc) + self.ttl
+        }
+
+        try:
+            await self.queries.upsert_entry(entry_data)
+            self._counters["stores"] += 1
+            await self._maybe_evict()
+        except Exception as e:
+            await self.db.rollback()
+            self._counters["errors"] += 1
+            logger.warning(f"Analysis cache store failed: {e}")
+
+    async def _maybe_evict(self) -> None:
+        cls = type(self)
+        cls._stores_since_eviction += 1
+        if cls._stores_since_eviction < settings.ai_cache_evict_every_stores:
+            return
+        # Reset first so stores that land while this sweep runs do not start another
+        cls._stores_since_eviction = 0
+        self._counters["evictions"] += await self.queries.evict_entries(self.max_entries)
+
+    async def get_statistics(self) -> Dict[str, Any]:
+        """Get process-local counters alongside shared cache totals."""
+        lookups = self._counters["hits"] + self._counters["misses"]
+
+        return {
+            "process": {
+                **self._counters,
+                "hit_rate_percent": round((self._counters["hits"] / lookups) * 100, 2) if lookups > 0 else 0
+            },
+            "shared": await self.queries.get_cache_statistics(),
+            "ttl_seconds": int(self.ttl.total_seconds()),
+            "max_entries": self.max_entries,
+            "prompt_version": opportunity_analysis.active_prompt().version
+        }
@@ -0,0 +1,307 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import AsyncSessionLocal, settings
+from models import AnalysisJob, AnalysisJobItem, AnalysisJobStatus, AnalysisJobItemStatus
+from queries.analysis_job_queries import AnalysisJobQueries
+from queries.linkedin_queries import LinkedInQueries
+from services.ai_service import AIService
+from services.ai_rate_limiter import MAX_RETRY_AFTER_SECONDS
+from utils.rate_limiter import TokenBucket
+from utils.response_helpers import validation_error, not_found_error
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Shared by every job in this process so concurrent jobs draw from one OpenAI budget
+_batch_rate_limiter = TokenBucket(settings.ai_batch_rate_per_second, settings.ai_batch_burst)
+
+# Strong references to running jobs; bare asyncio tasks can be garbage collected mid-flight
+_running_jobs: Dict[int, asyncio.Task] = {}
+
+def _launch_job(job_id: int, tenant_id: int, concurrency: int, enable_cache: bool) -> None:
+    runner = AnalysisJobRunner(job_id, tenant_id, concurrency, enable_cache)
+    task = asyncio.create_task(runner.run())
+    _running_jobs[job_id] = task
+    task.add_done_callback(lambda _: _running_jobs.pop(job_id, None))
+
+class AnalysisJobService:
+    """Service for creating, launching and inspecting bulk analysis jobs."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.queries = AnalysisJobQueries(db)
+
+    async def create_job(
+        self,
+        tenant_id: int,
+        post_ids: Optional[List[int]] = None,
+        all_unanalyzed: bool = False,
+        enable_cache: bool = True,
+        concurrency: Optional[int] = None
+    ) -> AnalysisJob:
+        """Create a persisted job covering the requested posts."""
+        resolved_post_ids = await self._resolve_post_ids(tenant_id, post_ids, all_unanalyzed)
+        concurrency = self._validate_concurrency(concurrency)
+
+        job_data = {
+            "tenant_id": tenant_id,
+            "status": AnalysisJobStatus.PENDING,
+            "concurrency": concurrency,
+            "enable_cache": enable_cache,
+            # Counts as claimed by this worker, which starts it right away
+            "heartbeat_at": datetime.now(timezone.utc)
+        }
+
+        return await self.queries.create_job_with_items(job_data, resolved_post_ids)
+
+    def start_job(self, job: AnalysisJob) -> None:
+        """Run a job in the background on this worker's event loop."""
+        _launch_job(job.id, job.tenant_id, job.concurrency, job.enable_cache)
+
+    async def get_job(self, job_id: int, tenant_id: int) -> AnalysisJob:
+        """Get a job or raise 404."""
+        job = await self.queries.get_job_by_id(job_id, tenant_id)
+        if not job:
+            raise not_found_error("Analysis job", job_id)
+        return job
+
+    async def get_job_items(
+        self,
+        job_id: int,
+        tenant_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None
+    ) -> List[AnalysisJobItem]:
+        """Get per-post results for a job, validating the status filter."""
+        await self.get_job(job_id, tenant_id)
+
+        item_status = None
+        if status:
+            try:
+                item_status = AnalysisJobItemStatus(status.capitalize())
+            except ValueError:
+                valid_statuses = [s.value for s in AnalysisJobItemStatus]
+                raise validation_error(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
+
+        return await self.queries.get_job_items(job_id, tenant_id, skip, limit, item_status)
+
+    async def stream_job_progress(self, job_id: int, tenant_id: int, poll_interval: float = 1.0):
+        """Yield NDJSON lines for each finished item and a progress snapshot per poll."""
+        await self.get_job(job_id, tenant_id)
+
+        since: Optional[datetime] = None
+        emitted_at_since = set()
+
+        while True:
+            # Drop cached rows so each poll sees what the workers have committed
+            self.db.expire_all()
+
+            for item in await self.queries.get_items_finished_since(job_id, tenant_id, since):
+                if item.id in emitted_at_since:
+                    continue
+                if item.finished_at != since:
+                    since = item.finished_at
+                    emitted_at_since = set()
+                emitted_at_since.add(item.id)
+
+                yield json.dumps({
+                    "status": "item_finished",
+                    "item_id": item.id,
+                    "post_id": item.post_id,
+                    "item_status": item.status.value,
+                    "result": item.result,
+                    "error": item.error
+                }) + "\n"
+
+            job = await self.get_job(job_id, tenant_id)
+            yield json.dumps({"status": "progress", **self.format_progress(job)}) + "\n"
+
+            if job.status in (AnalysisJobStatus.COMPLETED, AnalysisJobStatus.FAILED):
+                yield json.dumps({"status": "completed", "job_status": job.status.value}) + "\n"
+                return
+
+            await asyncio.sleep(poll_interval)
+
+    def format_progress(self, job: AnalysisJob) -> Dict[str, Any]:
+        """Summarize a job's progress counters."""
+        processed = job.completed_items + job.failed_items
+        return {
+            "job_id": job.id,
+            "job_status": job.status.value,
+            "total_items": job.total_items,
+            "completed_items": job.completed_items,
+            "failed_items": job.failed_items,
+            "progress_percent": round((processed / job.total_items) * 100, 2) if job.total_items > 0 else 100.0
+        }
+
+    async def _resolve_post_ids(self, tenant_id: int, post_ids: Optional[List[int]], all_unanalyzed: bool) -> List[int]:
+        """Turn the request into a deduplicated list of tenant-owned post IDs."""
+        if all_unanalyzed == bool(post_ids):
+            raise validation_error("Provide either post_ids or all_unanalyzed, but not both")
+
+        if all_unanalyzed:
+            resolved = await self.queries.get_unanalyzed_post_ids(tenant_id, settings.ai_batch_max_posts)
+        else:
+            unique_ids = list(dict.fromkeys(post_ids))
+            if len(unique_ids) > settings.ai_batch_max_posts:
+                raise validation_error(f"Batch size cannot exceed {settings.ai_batch_max_posts} posts")
+
+            existing = set(await self.queries.get_existing_post_ids(tenant_id, unique_ids))
+            missing = [post_id for post_id in unique_ids if post_id not in existing]
+            if missing:
+                raise not_found_error("Posts", ", ".join(str(post_id) for post_id in missing[:10]))
+            resolved = unique_ids
+
+        if not resolved:
+            raise validation_error("No posts to analyze")
+
+        return resolved
+
+    def _validate_concurrency(self, concurrency: Optional[int]) -> int:
+        """Apply the default and ceiling for worker pool size."""
+        if concurrency is None:
+            return settings.ai_batch_default_concurrency
+        if concurrency < 1 or concurrency > settings.ai_batch_max_concurrency:
+            raise validation_error(f"Concurrency must be between 1 and {settings.ai_batch_max_concurrency}")
+        return concurrency
+
+class AnalysisJobRunner:
+    """Drains a job's pending items through a bounded pool of asyncio workers."""
+
+    def __init__(self, job_id: int, tenant_id: int, concurrency: int, enable_cache: bool = True):
+        self.job_id = job_id
+        self.tenant_id = tenant_id
+        self.concurrency = concurrency
+        self.enable_cache = enable_cache
+
+    async def run(self) -> None:
+        async with AsyncSessionLocal() as db:
+            await self._run(AnalysisJobQueries(db))
+
+    async def _run(self, queries: AnalysisJobQueries) -> None:
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            # Items left running by a worker that died are picked up again
+            items = await queries.get_unfinished_items(self.job_id)
+            await queries.mark_job_running(self.job_id)
+
+            queue: asyncio.Queue = asyncio.Queue()
+            for item in items:
+                queue.put_nowait(item)
+
+            # Each worker owns its session; sessions are not safe to share across tasks
+            workers = [
+                asyncio.create_task(self._worker(queue))
+                for _ in range(min(self.concurrency, len(items)))
+            ]
+            await asyncio.gather(*workers)
+
+            await queries.finish_job(self.job_id)
+            logger.info(f"Analysis job {self.job_id} finished ({len(items)} items)")
+
+        except Exception as e:
+            logger.error(f"Analysis job {self.job_id} failed: {e}")
+            await queries.db.rollback()
+            await queries.finish_job(self.job_id, error=str(e))
+
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self) -> None:
+        """Keep the job's heartbeat fresh so other workers leave it alone while this one runs it."""
+        async with AsyncSessionLocal() as db:
+            queries = AnalysisJobQueries(db)
+            while True:
+                await asyncio.sleep(settings.ai_batch_job_heartbeat_seconds)
+                try:
+                    await queries.heartbeat(self.job_id)
+                except Exception as e:
+                    await db.rollback()
+                    logger.warning(f"Analysis job {self.job_id} heartbeat failed: {e}")
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        async with AsyncSessionLocal() as db:
+            queries = AnalysisJobQueries(db)
+            linkedin_queries = LinkedInQueries(db)
+            # Background work waits out a spent budget instead of failing the item
+            ai_service = AIService(db, rate_limit_wait_seconds=MAX_RETRY_AFTER_SECONDS, call_pacer=_batch_rate_limiter)
+
+            while True:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                await self._process_item(item, queries, linkedin_queries, ai_service)
+
+    async def _process_item(
+        self,
+        item: Tuple[int, int],
+        queries: AnalysisJobQueries,
+        linkedin_queries: LinkedInQueries,
+        ai_service: AIService
+    ) -> None:
+        item_id, post_id = item
+
+        try:
+            await queries.mark_item_running(item_id)
+
+            post = await linkedin_queries.get_post_by_id(post_id, self.tenant_id)
+            if not post:
+                raise ValueError(f"Post with id {post_id} not found")
+
+            result = await ai_service.analyze_opportunity_comprehensive(post, enable_cache=self.enable_cache)
+
+            await queries.complete_item(item_id, self.job_id, result, None)
+
+        except Exception as e:
+            logger.warning(f"Analysis job {self.job_id} item {item_id} failed: {e}")
+            await queries.db.rollback()
+            await queries.complete_item(item_id, self.job_id, None, str(e))
+
+class AnalysisJobRecovery:
+    """Resumes jobs whose worker died or restarted mid-run, on startup and whenever a heartbeat goes stale.
+
+    Jobs are claimed with SKIP LOCKED, so with several API workers each orphaned job is resumed once.
+    """
+
+    def __init__(self, interval: Optional[float] = None, stale_seconds: Optional[float] = None):
+        self.interval = interval if interval is not None else settings.ai_batch_job_heartbeat_seconds
+        self.stale_seconds = stale_seconds if stale_seconds is not None else settings.ai_batch_job_stale_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.resume_stale_jobs()
+            except Exception as e:
+                logger.error(f"Resuming stale analysis jobs failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def resume_stale_jobs(self) -> int:
+        async with AsyncSessionLocal() as db:
+            jobs = await AnalysisJobQueries(db).claim_stale_jobs(self.stale_seconds)
+
+        for job in jobs:
+            if job.id in _running_jobs:
+                # Still running here; only its heartbeat fell behind
+                continue
+            logger.info(f"Resuming analysis job {job.id}")
+            _launch_job(job.id, job.tenant_id, job.concurrency, job.enable_cache)
+        return len(jobs)
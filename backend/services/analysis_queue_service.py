@@ -0,0 +1,179 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import AsyncSessionLocal, settings
+from models import AnalysisQueueStatus, OpportunityStatus
+from queries.analysis_queue_queries import AnalysisQueueQueries, AUTO_ANALYSIS_ENABLED, AUTO_ANALYSIS_MIN_CONFIDENCE
+from queries.linkedin_queries import LinkedInQueries
+from queries.auth_queries import AuthQueries
+from services.ai_service import AIService, _extract_value
+from services.ai_rate_limiter import MAX_RETRY_AFTER_SECONDS
+from services.principal_resolver import principal_resolver
+from utils.rate_limiter import TokenBucket
+from utils.response_helpers import validation_error
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, List, Optional
+import asyncio
+import logging
+import random
+
+logger = logging.getLogger(__name__)
+
+# Opportunity.title is a String(255)
+MAX_TITLE_LENGTH = 255
+
+class AnalysisQueueService:
+    """Service for a tenant's automatic analysis settings and queue."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.queries = AnalysisQueueQueries(db)
+        self.tenant_queries = AuthQueries(db)
+
+    async def enqueue_posts(self, tenant_id: int, post_ids: List[int]) -> int:
+        """Queue newly ingested posts; a no-op unless the tenant enabled automatic analysis."""
+        if not post_ids:
+            return 0
+        try:
+            return await self.queries.enqueue_posts(tenant_id, post_ids)
+        except Exception as e:
+            # The posts are already stored; they can still be analyzed manually
+            await self.db.rollback()
+            logger.error(f"Failed to queue {len(post_ids)} posts for analysis: {e}")
+            return 0
+
+    async def get_settings(self, tenant_id: int) -> Dict[str, Any]:
+        """Get a tenant's automatic analysis settings with queue counts."""
+        tenant_settings = await principal_resolver.get_tenant_settings(self.db, tenant_id)
+        counts = await self.queries.count_by_status(tenant_id)
+
+        return {
+            "enabled": bool(tenant_settings.get(AUTO_ANALYSIS_ENABLED, False)),
+            "min_confidence": tenant_settings.get(AUTO_ANALYSIS_MIN_CONFIDENCE, settings.auto_analysis_min_confidence),
+            "queue": {status.value: counts.get(status, 0) for status in AnalysisQueueStatus}
+        }
+
+    async def update_settings(self, tenant_id: int, enabled: Optional[bool], min_confidence: Optional[float]) -> Dict[str, Any]:
+        """Turn automatic analysis on or off and set the draft opportunity threshold."""
+        tenant_settings = await self.tenant_queries.get_tenant_settings(tenant_id)
+
+        if enabled is not None:
+            tenant_settings[AUTO_ANALYSIS_ENABLED] = enabled
+        if min_confidence is not None:
+            if not 0 <= min_confidence <= 1:
+                raise validation_error("min_confidence must be between 0 and 1")
+            tenant_settings[AUTO_ANALYSIS_MIN_CONFIDENCE] = min_confidence
+
+        await self.tenant_queries.update_tenant_settings(tenant_id, tenant_settings)
+        principal_resolver.invalidate_tenant(tenant_id)
+        return await self.get_settings(tenant_id)
+
+    async def retry_dead_items(self, tenant_id: int) -> int:
+        """Send a tenant's dead-lettered posts back through the queue."""
+        return await self.queries.requeue_dead_items(tenant_id)
+
+    async def get_dead_items(self, tenant_id: int, skip: int = 0, limit: int = 50):
+        """Get a tenant's dead-lettered posts with their last error."""
+        return await self.queries.get_dead_items(tenant_id, skip, limit)
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff with jitter for an item that has failed `attempts` times."""
+    delay = min(settings.auto_analysis_backoff_seconds * 2 ** (attempts - 1), settings.auto_analysis_max_backoff_seconds)
+    # Jitter spreads out retries of items that failed together, e.g. during an OpenAI outage
+    return delay * random.uniform(0.5, 1.0)
+
+class AnalysisQueueWorker:
+    """Claims queued posts with SKIP LOCKED and analyzes them; any number of workers can run side by side."""
+
+    def __init__(self, concurrency: Optional[int] = None, poll_interval: Optional[float] = None):
+        self.concurrency = concurrency or settings.auto_analysis_worker_concurrency
+        self.poll_interval = poll_interval if poll_interval is not None else settings.auto_analysis_poll_interval_seconds
+        self.rate_limiter = TokenBucket(settings.ai_batch_rate_per_second, settings.ai_batch_burst)
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None, until_empty: bool = False) -> None:
+        """Process items until stopped, or until nothing is due when `until_empty` is set."""
+        stop_event = stop_event or asyncio.Event()
+        in_flight = set()
+
+        async with AsyncSessionLocal() as db:
+            queries = AnalysisQueueQueries(db)
+
+            while not stop_event.is_set():
+                free_slots = self.concurrency - len(in_flight)
+                claimed = []
+                if free_slots > 0:
+                    claimed = await queries.claim_items(free_slots, settings.auto_analysis_visibility_timeout_seconds)
+
+                for item in claimed:
+                    task = asyncio.create_task(self._process_item(item))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+
+                if len(in_flight) >= self.concurrency:
+                    await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                elif len(claimed) < free_slots:
+                    # Nothing more is due right now
+                    if until_empty and not in_flight:
+                        break
+                    await self._wait(stop_event, in_flight)
+
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+    async def _wait(self, stop_event: asyncio.Event, in_flight: set) -> None:
+        """Sleep for the poll interval, waking early on stop or when an item finishes."""
+        stop_waiter = asyncio.create_task(stop_event.wait())
+        try:
+            await asyncio.wait({stop_waiter, *in_flight}, timeout=self.poll_interval, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop_waiter.cancel()
+
+    async def _process_item(self, item) -> None:
+        # Each item owns its session; sessions are not safe to share across tasks
+        async with AsyncSessionLocal() as db:
+            queries = AnalysisQueueQueries(db)
+
+            try:
+                post = await LinkedInQueries(db).get_post_by_id(item.post_id, item.tenant_id)
+                if not post:
+                    raise ValueError(f"Post with id {item.post_id} not found")
+
+                ai_service = AIService(db, rate_limit_wait_seconds=MAX_RETRY_AFTER_SECONDS, call_pacer=self.rate_limiter)
+                result = await ai_service.analyze_opportunity_comprehensive(post)
+
+                opportunity_data = await self._draft_opportunity(queries, post, result)
+                await queries.complete_item(item.id, result, opportunity_data)
+
+            except Exception as e:
+                await db.rollback()
+                if item.attempts >= settings.auto_analysis_max_attempts:
+                    logger.error(f"Analysis of post {item.post_id} failed {item.attempts} times, giving up: {e}")
+                    await queries.mark_item_dead(item.id, str(e))
+                else:
+                    delay = retry_delay(item.attempts)
+                    logger.warning(f"Analysis of post {item.post_id} failed (attempt {item.attempts}), retrying in {delay:.0f}s: {e}")
+                    await queries.retry_item(item.id, str(e), datetime.now(timezone.utc) + timedelta(seconds=delay))
+
+    async def _draft_opportunity(self, queries: AnalysisQueueQueries, post, result: Dict[str, Any]) -> Optional[dict]:
+        """Build a draft opportunity from a confident analysis, unless the post already has one."""
+        if not result.get("is_opportunity"):
+            return None
+
+        min_confidence = await queries.get_min_confidence(post.tenant_id)
+        if min_confidence is None:
+            min_confidence = settings.auto_analysis_min_confidence
+        if (result.get("confidence") or 0.0) < min_confidence:
+            return None
+
+        if await queries.post_has_opportunity(post.id):
+            return None
+
+        fields = result.get("extracted_fields") or {}
+        title = _extract_value(fields.get("title")) or (post.content or "").strip().split("\n")[0] or post.post_url
+
+        return {
+            "tenant_id": post.tenant_id,
+            "source_post_id": post.id,
+            "title": str(title)[:MAX_TITLE_LENGTH],
+            "summary": _extract_value(fields.get("summary")),
+            "status": OpportunityStatus.DRAFT,
+            "tags": result.get("tags") or []
+        }
@@ -1,6 +1,7 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from queries.auth_queries import AuthQueries
-from utils.auth_helpers import extract_user_info, get_tenant_id_from_token
+from services.principal_resolver import Principal, principal_resolver
+from utils.auth_helpers import extract_user_info
 from utils.validation import validate_email
 from utils.response_helpers import validation_error
 from typing import Dict, Any, Optional, Tuple
@@ -8,11 +9,11 @@ from typing import Dict, Any, Optional, Tuple
 class AuthService:
     """Service for authentication-related business operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.queries = AuthQueries(db)
 
-    def authenticate_or_create_user(self, current_user: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+    async def authenticate_or_create_user(self, current_user: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
         """
         Authenticate existing user or create new user/tenant if first time.
         Returns: (user_data, is_new_user)
@@ -21,44 +22,37 @@ class AuthService:
         auth0_user_id = user_info["auth0_user_id"]
 
         # Check if user exists
-        existing_user = self.queries.get_user_by_auth0_id(auth0_user_id)
+        existing_user = await self.queries.get_user_by_auth0_id(auth0_user_id)
 
         if existing_user:
             # Update last login and return existing user
-            updated_user = self.queries.update_user_last_login(existing_user)
+            updated_user = await self.queries.update_user_last_login(existing_user)
+            principal_resolver.invalidate_user(auth0_user_id)
             return self._format_user_response(updated_user), False
 
         # New user - create tenant and user
-        return self._create_new_user_with_tenant(user_info), True
+        user_data = await self._create_new_user_with_tenant(user_info)
+        principal_resolver.invalidate_user(auth0_user_id)
+        return user_data, True
 
-    def get_user_profile(self, current_user: Dict[str, Any]) -> Dict[str, Any]:
+    async def get_user_profile(self, current_user: Dict[str, Any], principal: Principal) -> Dict[str, Any]:
         """Get user profile with tenant information."""
-        user_info = extract_user_info(current_user)
-        auth0_user_id = user_info["auth0_user_id"]
-
-        # Try to get user with explicit tenant from token
-        tenant_id = get_tenant_id_from_token(current_user)
-        if tenant_id:
-            user = self.queries.get_user_by_auth0_id_and_tenant(auth0_user_id, tenant_id)
-        else:
-            user = self.queries.get_user_by_auth0_id(auth0_user_id)
-
-        if not user:
+        if principal.user_id is None:
             # Auto-create user if doesn't exist
-            user_data, _ = self.authenticate_or_create_user(current_user)
+            user_data, _ = await self.authenticate_or_create_user(current_user)
             return user_data
 
-        return self._format_user_response(user)
+        return self._format_user_response(principal)
 
-    def validate_tenant_access(self, current_user: Dict[str, Any], tenant_id: int) -> bool:
+    async def validate_tenant_access(self, current_user: Dict[str, Any], tenant_id: int) -> bool:
         """Validate if user has access to specific tenant."""
         user_info = extract_user_info(current_user)
         auth0_user_id = user_info["auth0_user_id"]
 
-        user = self.queries.get_user_by_auth0_id_and_tenant(auth0_user_id, tenant_id)
+        user = await self.queries.get_user_by_auth0_id_and_tenant(auth0_user_id, tenant_id)
         return user is not None
 
-    def _create_new_user_with_tenant(self, user_info: Dict[str, str]) -> Dict[str, Any]:
+    async def _create_new_user_with_tenant(self, user_info: Dict[str, str]) -> Dict[str, Any]:
         """Create new user with their own tenant."""
         # Validate user info
         self._validate_user_info(user_info)
@@ -70,7 +64,7 @@ class AuthService:
                 "name": tenant_name,
                 "settings": {"created_by": user_info["auth0_user_id"]}
             }
-            new_tenant = self.queries.create_tenant(tenant_data)
+            new_tenant = await self.queries.create_tenant(tenant_data)
 
             # Create user
             user_data = {
@@ -80,12 +74,12 @@ class AuthService:
                 "name": user_info["name"],
                 "role": "admin"  # First user in tenant is admin
             }
-            new_user = self.queries.create_user(user_data)
+            new_user = await self.queries.create_user(user_data)
 
             return self._format_user_response(new_user)
 
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             raise Exception(f"Failed to create user: {str(e)}")
 
     def _validate_user_info(self, user_info: Dict[str, str]) -> None:
@@ -114,9 +108,9 @@ class AuthService:
         return base_name
 
     def _format_user_response(self, user) -> Dict[str, Any]:
-        """Format user data for API response."""
+        """Format user data, from a User or a Principal, for API response."""
         return {
-            "id": user.id,
+            "id": user.user_id if isinstance(user, Principal) else user.id,
             "tenant_id": user.tenant_id,
             "auth0_user_id": user.auth0_user_id,
             "email": user.email,
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from queries.contact_queries import ContactQueries
 from queries.company_queries import CompanyQueries
 from utils.validation import validate_email, validate_linkedin_url
@@ -8,48 +8,48 @@ from typing import Dict, Any, List, Optional
 class ContactService:
     """Service for contact-related business operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.queries = ContactQueries(db)
         self.company_queries = CompanyQueries(db)
 
-    def create_contact_with_validation(self, contact_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_contact_with_validation(self, contact_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create contact with business validation."""
         self._validate_contact_data(contact_data)
-        self._validate_company_exists(contact_data)
-        self._check_contact_uniqueness(contact_data)
+        await self._validate_company_exists(contact_data)
+        await self._check_contact_uniqueness(contact_data)
         self._normalize_contact_data(contact_data)
 
-        return self.queries.create_contact(contact_data)
+        return await self.queries.create_contact(contact_data)
 
-    def update_contact_with_validation(self, contact: Any, update_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def update_contact_with_validation(self, contact: Any, update_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update contact with business validation."""
         if update_data:
             self._validate_contact_data(update_data, is_update=True)
 
             # Validate company exists if being updated
             if "company_id" in update_data:
-                self._validate_company_exists(update_data)
+                await self._validate_company_exists(update_data)
 
             # Check uniqueness for email/LinkedIn if being updated
-            self._check_contact_uniqueness_for_update(contact, update_data)
+            await self._check_contact_uniqueness_for_update(contact, update_data)
             self._normalize_contact_data(update_data)
 
-        return self.queries.update_contact(contact, update_data)
+        return await self.queries.update_contact(contact, update_data)
 
-    def search_contacts(self, tenant_id: int, search_term: str) -> List[Dict[str, Any]]:
+    async def search_contacts(self, tenant_id: int, search_term: str) -> List[Dict[str, Any]]:
         """Search contacts by name."""
         if len(search_term.strip()) < 2:
             raise validation_error("Search term must be at least 2 characters")
 
-        return self.queries.search_contacts_by_name(tenant_id, search_term)
+        return await self.queries.search_contacts_by_name(tenant_id, search_term)
 
-    def get_contact_statistics(self, tenant_id: int) -> Dict[str, Any]:
+    async def get_contact_statistics(self, tenant_id: int) -> Dict[str, Any]:
         """Get contact statistics for a tenant."""
-        total_contacts = self.queries.count_contacts_by_tenant(tenant_id)
+        total_contacts = await self.queries.count_contacts_by_tenant(tenant_id)
 
         # Count contacts with email/phone
-        all_contacts = self.queries.get_contacts_by_tenant(tenant_id, limit=1000)
+        all_contacts = await self.queries.get_contacts_by_tenant(tenant_id, limit=1000)
         contacts_with_email = sum(1 for c in all_contacts if c.email)
         contacts_with_phone = sum(1 for c in all_contacts if c.phone)
         contacts_with_linkedin = sum(1 for c in all_contacts if c.linkedin_profile_url)
@@ -66,10 +66,10 @@ class ContactService:
             }
         }
 
-    def merge_contacts(self, primary_contact_id: int, secondary_contact_id: int, tenant_id: int) -> Dict[str, Any]:
+    async def merge_contacts(self, primary_contact_id: int, secondary_contact_id: int, tenant_id: int) -> Dict[str, Any]:
         """Merge two contacts (business logic for deduplication)."""
-        primary = self.queries.get_contact_by_id(primary_contact_id, tenant_id)
-        secondary = self.queries.get_contact_by_id(secondary_contact_id, tenant_id)
+        primary = await self.queries.get_contact_by_id(primary_contact_id, tenant_id)
+        secondary = await self.queries.get_contact_by_id(secondary_contact_id, tenant_id)
 
         if not primary or not secondary:
             raise not_found_error("Contact")
@@ -85,12 +85,12 @@ class ContactService:
 
         # Update primary contact with merged data
         if merge_data:
-            updated_primary = self.queries.update_contact(primary, merge_data)
+            updated_primary = await self.queries.update_contact(primary, merge_data)
         else:
             updated_primary = primary
 
         # Delete secondary contact
-        self.queries.delete_contact(secondary)
+        await self.queries.delete_contact(secondary)
 
         return updated_primary
 
@@ -156,47 +156,47 @@ class ContactService:
                 url = f"https://{url}"
             data["linkedin_profile_url"] = url
 
-    def _validate_company_exists(self, contact_data: Dict[str, Any]) -> None:
+    async def _validate_company_exists(self, contact_data: Dict[str, Any]) -> None:
         """Validate that the company exists if company_id is provided."""
         company_id = contact_data.get("company_id")
         if company_id:
             tenant_id = contact_data["tenant_id"]
-            company = self.company_queries.get_company_by_id(company_id, tenant_id)
+            company = await self.company_queries.get_company_by_id(company_id, tenant_id)
             if not company:
                 raise not_found_error("Company", company_id)
 
-    def _check_contact_uniqueness(self, contact_data: Dict[str, Any]) -> None:
+    async def _check_contact_uniqueness(self, contact_data: Dict[str, Any]) -> None:
         """Check if contact already exists by email or LinkedIn URL."""
         tenant_id = contact_data["tenant_id"]
 
         # Check email uniqueness
         email = contact_data.get("email")
         if email:
-            existing_contact = self.queries.get_contact_by_email(email, tenant_id)
+            existing_contact = await self.queries.get_contact_by_email(email, tenant_id)
             if existing_contact:
                 raise conflict_error(f"Contact with email '{email}' already exists")
 
         # Check LinkedIn URL uniqueness
         linkedin_url = contact_data.get("linkedin_profile_url")
         if linkedin_url:
-            existing_contact = self.queries.get_contact_by_linkedin_url(str(linkedin_url), tenant_id)
+            existing_contact = await self.queries.get_contact_by_linkedin_url(str(linkedin_url), tenant_id)
             if existing_contact:
                 raise conflict_error(f"Contact with LinkedIn URL already exists")
 
-    def _check_contact_uniqueness_for_update(self, contact: Any, update_data: Dict[str, Any]) -> None:
+    async def _check_contact_uniqueness_for_update(self, contact: Any, update_data: Dict[str, Any]) -> None:
         """Check contact uniqueness during update (excluding current contact)."""
         tenant_id = contact.tenant_id
 
         # Check email uniqueness
         email = update_data.get("email")
         if email:
-            existing_contact = self.queries.get_contact_by_email(email, tenant_id)
+            existing_contact = await self.queries.get_contact_by_email(email, tenant_id)
             if existing_contact and existing_contact.id != contact.id:
                 raise conflict_error(f"Contact with email '{email}' already exists")
 
         # Check LinkedIn URL uniqueness
         linkedin_url = update_data.get("linkedin_profile_url")
         if linkedin_url:
-            existing_contact = self.queries.get_contact_by_linkedin_url(str(linkedin_url), tenant_id)
+            existing_contact = await self.queries.get_contact_by_linkedin_url(str(linkedin_url), tenant_id)
             if existing_contact and existing_contact.id != contact.id:
                 raise conflict_error(f"Contact with LinkedIn URL already exists")
\ No newline at end of file
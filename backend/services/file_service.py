@@ -1,24 +1,27 @@
+import asyncio
+import hashlib
 import os
-import shutil
 import uuid
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from sqlalchemy.orm import Session
-from fastapi import UploadFile
+from typing import Dict, Any, List, Optional, AsyncIterator, BinaryIO, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException, UploadFile
+from models import ProposalFile
 from queries.file_queries import FileQueries
 from queries.opportunity_queries import OpportunityQueries
-from utils.response_helpers import validation_error, not_found_error
+from utils.response_helpers import validation_error, not_found_error, payload_too_large_error
 from utils.validation import validate_email
 
 class FileService:
     """Service for file-related business operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.queries = FileQueries(db)
         self.opportunity_queries = OpportunityQueries(db)
         self.upload_dir = Path("uploads")
         self.max_file_size = 10 * 1024 * 1024  # 10MB
+        self.chunk_size = 1024 * 1024  # Uploads are read, hashed and written in blocks of this size
         self.allowed_extensions = {'.pdf', '.doc', '.docx', '.txt', '.png', '.jpg', '.jpeg'}
         self.max_files_per_tenant = 100
 
@@ -31,11 +34,37 @@ class FileService:
         """Upload and save proposal file with validation."""
         # Business validation
         self._validate_file(file)
-        self._check_tenant_limits(tenant_id)
-        self._validate_proposal_exists(proposal_id, tenant_id)
+        try:
+            return await self._store_proposal_file(file.filename, self._read_upload(file), proposal_id, tenant_id)
+        finally:
+            await file.close()
+
+    async def upload_proposal_file_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        content_length: Optional[int],
+        proposal_id: int,
+        tenant_id: int
+    ) -> Dict[str, Any]:
+        """Save a raw request body as a proposal file while it arrives, stopping at the size limit."""
+        self._validate_filename(filename)
+        if content_length is not None and content_length > self.max_file_size:
+            raise self._too_large_error()
+        return await self._store_proposal_file(filename, chunks, proposal_id, tenant_id)
+
+    async def _store_proposal_file(
+        self,
+        original_filename: str,
+        chunks: AsyncIterator[bytes],
+        proposal_id: int,
+        tenant_id: int
+    ) -> Dict[str, Any]:
+        await self._check_tenant_limits(tenant_id)
+        await self._validate_proposal_exists(proposal_id, tenant_id)
 
         # Generate secure filename
-        secure_filename = self._generate_secure_filename(file.filename)
+        secure_filename = self._generate_secure_filename(original_filename)
 
         # Create tenant directory
         tenant_dir = self.upload_dir / str(tenant_id)
@@ -44,11 +73,8 @@ class FileService:
         file_path = tenant_dir / secure_filename
 
         try:
-            # Save file to disk
-            await self._save_file_to_disk(file, file_path)
-
-            # Get file size
-            file_size = file_path.stat().st_size
+            # Save file to disk, sizing and hashing it on the way
+            file_size, sha256 = await self._save_file_to_disk(chunks, file_path)
 
             # Create database record
             file_data = {
@@ -56,31 +82,57 @@ class FileService:
                 "proposal_id": proposal_id,
                 "filename": secure_filename,
                 "size": file_size,
+                "sha256": sha256,
                 "url": f"/api/files/{secure_filename}"
             }
 
-            proposal_file = self.queries.create_proposal_file(file_data)
+            proposal_file = await self.queries.create_proposal_file(file_data)
 
             return {
                 "id": proposal_file.id,
                 "filename": proposal_file.filename,
-                "original_filename": file.filename,
+                "original_filename": original_filename,
                 "size": proposal_file.size,
+                "sha256": proposal_file.sha256,
                 "url": proposal_file.url,
                 "proposal_id": proposal_file.proposal_id,
                 "created_at": proposal_file.created_at.isoformat()
             }
 
+        except HTTPException:
+            file_path.unlink(missing_ok=True)
+            raise
         except Exception as e:
             # Clean up file if database operation fails
-            if file_path.exists():
-                file_path.unlink()
+            file_path.unlink(missing_ok=True)
             raise Exception(f"File upload failed: {str(e)}")
 
-    def delete_proposal_file(self, filename: str, tenant_id: int) -> Dict[str, str]:
+    async def get_file_download(self, filename: str, tenant_id: int) -> Tuple[ProposalFile, Path, int]:
+        """Find a tenant's file for download: its record, path on disk and size.
+
+        Files uploaded before content hashing get their SHA-256 computed and stored here.
+        """
+        # The lookup is tenant-scoped, so only the tenant's own directory is ever read
+        proposal_file = await self.queries.get_proposal_file_by_filename(filename, tenant_id)
+        if not proposal_file:
+            raise not_found_error("File")
+
+        file_path = self.upload_dir / str(tenant_id) / proposal_file.filename
+        try:
+            stat_result = await asyncio.to_thread(file_path.stat)
+        except FileNotFoundError:
+            raise not_found_error("File")
+
+        if proposal_file.sha256 is None:
+            sha256 = await asyncio.to_thread(self._hash_file, file_path)
+            proposal_file = await self.queries.update_proposal_file(proposal_file, {"sha256": sha256})
+
+        return proposal_file, file_path, stat_result.st_size
+
+    async def delete_proposal_file(self, filename: str, tenant_id: int) -> Dict[str, str]:
         """Delete proposal file from both disk and database."""
         # Get file record
-        proposal_file = self.queries.get_proposal_file_by_filename(filename, tenant_id)
+        proposal_file = await self.queries.get_proposal_file_by_filename(filename, tenant_id)
         if not proposal_file:
             raise not_found_error("File")
 
@@ -93,14 +145,14 @@ class FileService:
                 raise Exception(f"Failed to delete file from disk: {str(e)}")
 
         # Delete from database
-        self.queries.delete_proposal_file(proposal_file)
+        await self.queries.delete_proposal_file(proposal_file)
 
         return {"message": "File deleted successfully"}
 
-    def get_file_statistics(self, tenant_id: int) -> Dict[str, Any]:
+    async def get_file_statistics(self, tenant_id: int) -> Dict[str, Any]:
         """Get file statistics for a tenant."""
-        total_files = self.queries.count_files_by_tenant(tenant_id)
-        total_storage = self.queries.get_total_storage_used(tenant_id)
+        total_files = await self.queries.count_files_by_tenant(tenant_id)
+        total_storage = await self.queries.get_total_storage_used(tenant_id)
 
         return {
             "total_files": total_files,
@@ -111,14 +163,14 @@ class FileService:
             "storage_usage_percent": round((total_storage / (self.max_file_size * self.max_files_per_tenant)) * 100, 2)
         }
 
-    def cleanup_orphaned_files(self, tenant_id: int) -> Dict[str, Any]:
+    async def cleanup_orphaned_files(self, tenant_id: int) -> Dict[str, Any]:
         """Clean up files on disk that don't have database records."""
         tenant_dir = self.upload_dir / str(tenant_id)
         if not tenant_dir.exists():
             return {"cleaned_files": 0, "message": "No tenant directory found"}
 
         # Get all files from database
-        db_files = {f.filename for f in self.queries.get_proposal_files_by_tenant(tenant_id, limit=1000)}
+        db_files = {f.filename for f in await self.queries.get_proposal_files_by_tenant(tenant_id, limit=1000)}
 
         # Get all files from disk
         disk_files = {f.name for f in tenant_dir.iterdir() if f.is_file()}
@@ -142,45 +194,51 @@ class FileService:
 
     def _validate_file(self, file: UploadFile) -> None:
         """Validate uploaded file according to business rules."""
-        # Check file extension
-        file_ext = Path(file.filename).suffix.lower()
-        if file_ext not in self.allowed_extensions:
-            allowed = ', '.join(self.allowed_extensions)
-            raise validation_error(f"File type not allowed. Allowed types: {allowed}")
+        self._validate_filename(file.filename)
 
-        # Check file size (if available)
+        # Check file size (if available); it is enforced again while the file is written
         if hasattr(file, 'size') and file.size:
             if file.size > self.max_file_size:
-                max_mb = self.max_file_size / (1024 * 1024)
-                raise validation_error(f"File size exceeds {max_mb}MB limit")
+                raise self._too_large_error()
 
+    def _validate_filename(self, filename: Optional[str]) -> None:
         # Check filename
-        if not file.filename or len(file.filename.strip()) == 0:
+        if not filename or len(filename.strip()) == 0:
             raise validation_error("Filename is required")
 
-        if len(file.filename) > 255:
+        # Check file extension
+        file_ext = Path(filename).suffix.lower()
+        if file_ext not in self.allowed_extensions:
+            allowed = ', '.join(self.allowed_extensions)
+            raise validation_error(f"File type not allowed. Allowed types: {allowed}")
+
+        if len(filename) > 255:
             raise validation_error("Filename too long (max 255 characters)")
 
         # Check for dangerous characters
         dangerous_chars = {'<', '>', ':', '"', '|', '?', '*', '\\', '/'}
-        if any(char in file.filename for char in dangerous_chars):
+        if any(char in filename for char in dangerous_chars):
             raise validation_error("Filename contains invalid characters")
 
-    def _check_tenant_limits(self, tenant_id: int) -> None:
+    def _too_large_error(self) -> HTTPException:
+        max_mb = self.max_file_size / (1024 * 1024)
+        return payload_too_large_error(f"File size exceeds {max_mb}MB limit")
+
+    async def _check_tenant_limits(self, tenant_id: int) -> None:
         """Check if tenant has reached file limits."""
-        file_count = self.queries.count_files_by_tenant(tenant_id)
+        file_count = await self.queries.count_files_by_tenant(tenant_id)
         if file_count >= self.max_files_per_tenant:
             raise validation_error(f"File limit reached ({self.max_files_per_tenant} files maximum)")
 
-        total_storage = self.queries.get_total_storage_used(tenant_id)
+        total_storage = await self.queries.get_total_storage_used(tenant_id)
         max_total_storage = self.max_file_size * self.max_files_per_tenant
         if total_storage >= max_total_storage:
             max_gb = max_total_storage / (1024 * 1024 * 1024)
             raise validation_error(f"Storage limit reached ({max_gb:.1f}GB maximum)")
 
-    def _validate_proposal_exists(self, proposal_id: int, tenant_id: int) -> None:
+    async def _validate_proposal_exists(self, proposal_id: int, tenant_id: int) -> None:
         """Validate that the proposal exists."""
-        proposal = self.opportunity_queries.get_opportunity_by_id(proposal_id, tenant_id)
+        proposal = await self.opportunity_queries.get_opportunity_by_id(proposal_id, tenant_id)
         if not proposal:
             raise not_found_error("Proposal", proposal_id)
 
@@ -195,12 +253,53 @@ class FileService:
 
         return f"{clean_name}_{unique_id}{file_ext}"
 
-    async def _save_file_to_disk(self, file: UploadFile, file_path: Path) -> None:
-        """Save uploaded file to disk."""
+    async def _read_upload(self, file: UploadFile) -> AsyncIterator[bytes]:
+        while chunk := await file.read(self.chunk_size):
+            yield chunk
+
+    async def _save_file_to_disk(self, chunks: AsyncIterator[bytes], file_path: Path) -> Tuple[int, str]:
+        """Write chunks to disk in chunk_size blocks, returning the size and hex SHA-256.
+
+        Stops with a 413 as soon as the running size passes max_file_size. Writes and hashing
+        run in a worker thread so a large upload does not block the event loop.
+        """
+        digest = hashlib.sha256()
+        size = 0
+        buffer = bytearray()
+        try:
+            buffer_file = await asyncio.to_thread(file_path.open, "wb")
+        except Exception as e:
+            raise Exception(f"Failed to save file to disk: {str(e)}")
+
         try:
-            with file_path.open("wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > self.max_file_size:
+                    raise self._too_large_error()
+                buffer += chunk
+                if len(buffer) >= self.chunk_size:
+                    await asyncio.to_thread(self._write_block, buffer_file, digest, bytes(buffer))
+                    buffer.clear()
+            if buffer:
+                await asyncio.to_thread(self._write_block, buffer_file, digest, bytes(buffer))
+        except HTTPException:
+            raise
         except Exception as e:
             raise Exception(f"Failed to save file to disk: {str(e)}")
         finally:
-            file.file.close()
\ No newline at end of file
+            await asyncio.to_thread(buffer_file.close)
+
+        return size, digest.hexdigest()
+
+    def _hash_file(self, file_path: Path) -> str:
+        digest = hashlib.sha256()
+        with file_path.open("rb") as f:
+            while block := f.read(self.chunk_size):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _write_block(buffer_file: BinaryIO, digest: Any, block: bytes) -> None:
+        # hashlib releases the GIL for large buffers, so hashing here keeps it off the event loop too
+        digest.update(block)
+        buffer_file.write(block)
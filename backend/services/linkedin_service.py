@@ -1,19 +1,24 @@
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
 from queries.linkedin_queries import LinkedInQueries
+from services.analysis_queue_service import AnalysisQueueService
 from utils.validation import validate_linkedin_url
 from utils.response_helpers import conflict_error, validation_error
-from typing import Dict, Any, List
+from typing import Dict, Any, List, AsyncIterator, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Per-post result status -> summary counter
+STATUS_TOTALS = {"success": "successful", "duplicate": "duplicates", "failed": "failed"}
+
 class LinkedInService:
     """Service for LinkedIn-specific business logic."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.queries = LinkedInQueries(db)
+        self.analysis_queue = AnalysisQueueService(db)
 
     def validate_post_data(self, post_data: Dict[str, Any]) -> None:
         """Validate LinkedIn post data before processing."""
@@ -26,91 +31,123 @@ class LinkedInService:
         if author_url and not validate_linkedin_url(str(author_url)):
             raise validation_error("Invalid LinkedIn author profile URL")
 
-    def check_post_exists(self, post_url: str, tenant_id: int) -> None:
+    async def check_post_exists(self, post_url: str, tenant_id: int) -> None:
         """Check if a post already exists for this tenant."""
-        existing_post = self.queries.get_post_by_url(post_url, tenant_id)
+        existing_post = await self.queries.get_post_by_url(post_url, tenant_id)
         if existing_post:
             raise conflict_error("Post already exists")
 
-    def create_post(self, post_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_post(self, post_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new LinkedIn post with validation."""
         self.validate_post_data(post_data)
-        self.check_post_exists(post_data["post_url"], post_data["tenant_id"])
+        await self.check_post_exists(post_data["post_url"], post_data["tenant_id"])
 
-        return self.queries.create_linkedin_post(post_data)
+        new_post = await self.queries.create_linkedin_post(post_data)
+        await self.analysis_queue.enqueue_posts(new_post.tenant_id, [new_post.id])
+        return new_post
 
-    def create_posts_batch(self, posts_data: List[Dict[str, Any]], tenant_id: int, user_id: int) -> Dict[str, Any]:
+    async def create_posts_batch(self, posts_data: List[Dict[str, Any]], tenant_id: int, user_id: int) -> Dict[str, Any]:
         """Create multiple LinkedIn posts in batch with individual error handling."""
+        results = await self.ingest_posts(posts_data, tenant_id, user_id)
+
+        return {
+            "total": len(posts_data),
+            "successful": sum(1 for result in results if result["status"] == "success"),
+            "duplicates": sum(1 for result in results if result["status"] == "duplicate"),
+            "failed": sum(1 for result in results if result["status"] == "failed"),
+            "results": results
+        }
+
+    async def ingest_posts(self, posts_data: List[Dict[str, Any]], tenant_id: int, user_id: int) -> List[Dict[str, Any]]:
+        """Validate posts in memory and insert the new ones in one statement; one result per input post."""
         results = []
-        successful = 0
-        duplicates = 0
-        failed = 0
+        to_insert = {}
 
         for post_data in posts_data:
             post_url = str(post_data.get("post_url", ""))
+            post_dict = {
+                "post_url": post_url,
+                "author_profile_url": str(post_data.get("author_profile_url")) if post_data.get("author_profile_url") else None,
+                "content": post_data.get("content", ""),
+                "scraped_at": post_data.get("scraped_at")
+            }
+            result = {"post_url": post_url, "status": "success", "post_id": None, "error": None}
+            results.append(result)
 
             try:
-                # Add tenant_id and user_id to each post
-                post_dict = {
-                    "tenant_id": tenant_id,
-                    "user_id": user_id,
-                    "post_url": post_url,
-                    "author_profile_url": str(post_data.get("author_profile_url")) if post_data.get("author_profile_url") else None,
-                    "content": post_data.get("content", ""),
-                    "scraped_at": post_data.get("scraped_at")
-                }
-
-                # Validate post data
                 self.validate_post_data(post_dict)
-
-                # Check if post already exists
-                existing_post = self.queries.get_post_by_url(post_url, tenant_id)
-                if existing_post:
-                    results.append({
-                        "post_url": post_url,
-                        "status": "duplicate",
-                        "post_id": existing_post.id,
-                        "error": None
-                    })
-                    duplicates += 1
-                    continue
-
-                # Create the post
-                new_post = self.queries.create_linkedin_post(post_dict)
-                results.append({
-                    "post_url": post_url,
-                    "status": "success",
-                    "post_id": new_post.id,
-                    "error": None
-                })
-                successful += 1
-
-            except IntegrityError as e:
-                # Handle database constraint violations (e.g., duplicate key)
-                self.db.rollback()
-                logger.warning(f"Database integrity error for post {post_url}: {e}")
-                results.append({
-                    "post_url": post_url,
-                    "status": "duplicate",
-                    "post_id": None,
-                    "error": "Post already exists"
-                })
-                duplicates += 1
-
-            except Exception as e:
-                logger.error(f"Failed to create post {post_url}: {e}")
-                results.append({
-                    "post_url": post_url,
-                    "status": "failed",
-                    "post_id": None,
-                    "error": str(e)
-                })
-                failed += 1
-
-        return {
-            "total": len(posts_data),
-            "successful": successful,
-            "duplicates": duplicates,
-            "failed": failed,
-            "results": results
-        }
\ No newline at end of file
+            except HTTPException as e:
+                result.update(status="failed", error=e.detail)
+                continue
+
+            # Repeats within the batch are duplicates of the first occurrence
+            if post_url in to_insert:
+                result["status"] = "duplicate"
+            else:
+                to_insert[post_url] = post_dict
+
+        if not to_insert:
+            return results
+
+        try:
+            posts_by_url = await self.queries.insert_posts_ignoring_duplicates(tenant_id, user_id, list(to_insert.values()))
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to insert batch of {len(to_insert)} posts: {e}")
+            for result in results:
+                if result["post_url"] in to_insert:
+                    result.update(status="failed", error=str(e))
+            return results
+
+        for result in results:
+            if result["status"] == "failed":
+                continue
+
+            post_id, created = posts_by_url.get(result["post_url"], (None, False))
+            result["post_id"] = post_id
+            if not created:
+                result["status"] = "duplicate"
+            if post_id is None:
+                # Inserted by a concurrent request after this statement started
+                result["error"] = "Post already exists"
+
+        created_ids = [post_id for post_id, created in posts_by_url.values() if created]
+        await self.analysis_queue.enqueue_posts(tenant_id, created_ids)
+
+        return results
+
+    async def ingest_posts_stream(
+        self,
+        lines: AsyncIterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]],
+        tenant_id: int,
+        user_id: int,
+        chunk_size: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Ingest (line_number, post, parse_error) items chunk by chunk, yielding each chunk's results then a summary."""
+        totals = {"total": 0, "successful": 0, "duplicates": 0, "failed": 0}
+        chunk = []
+
+        async def flush():
+            posts = [post for _, post, _ in chunk if post is not None]
+            ingested = iter(await self.ingest_posts(posts, tenant_id, user_id) if posts else [])
+
+            results = []
+            for line_number, post, error in chunk:
+                if post is None:
+                    result = {"post_url": None, "status": "failed", "post_id": None, "error": error}
+                else:
+                    result = next(ingested)
+                results.append({"line": line_number, **result})
+                totals["total"] += 1
+                totals[STATUS_TOTALS[result["status"]]] += 1
+            chunk.clear()
+            return results
+
+        async for item in lines:
+            chunk.append(item)
+            if len(chunk) >= chunk_size:
+                yield await flush()
+
+        if chunk:
+            yield await flush()
+        yield [{"summary": totals}]
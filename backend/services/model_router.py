@@ -0,0 +1,93 @@
+from database import settings
+from prompts import opportunity_analysis
+from utils.latency_window import LatencyWindow
+from typing import Dict, Any, List, NamedTuple, Optional
+
+# Tenant.settings key holding per-tenant overrides of the routing policy
+ROUTING_SETTINGS_KEY = "ai_routing"
+
+# Routes a post's analysis can take
+FAST = "fast"
+LARGE = "large"
+ESCALATED = "escalated"
+
+# Latency samples kept per route for percentiles
+LATENCY_SAMPLES = 1000
+
+class RoutingPolicy(NamedTuple):
+    enabled: bool
+    fast_model: str
+    max_fast_chars: int
+    min_confidence: float
+
+def allowed_fast_models() -> List[str]:
+    """Models a tenant may route to as its fast model; the default fast model is always allowed."""
+    models = [model.strip() for model in settings.ai_routing_allowed_fast_models.split(",") if model.strip()]
+    default = opportunity_analysis.FAST_MODEL_CONFIG["model"]
+    return models if default in models else [default, *models]
+
+def resolve_routing_policy(tenant_settings: Dict[str, Any]) -> RoutingPolicy:
+    """Overlay a tenant's routing overrides on the deployment defaults."""
+    overrides = tenant_settings.get(ROUTING_SETTINGS_KEY) or {}
+    fast_model = overrides.get("fast_model")
+    # An override stored before the model was removed from the allowlist falls back to the default
+    if fast_model not in allowed_fast_models():
+        fast_model = opportunity_analysis.FAST_MODEL_CONFIG["model"]
+    return RoutingPolicy(
+        enabled=bool(overrides.get("enabled", settings.ai_routing_enabled)),
+        fast_model=fast_model,
+        max_fast_chars=int(overrides.get("max_fast_chars", settings.ai_routing_max_fast_chars)),
+        min_confidence=float(overrides.get("min_confidence", settings.ai_routing_min_confidence))
+    )
+
+def choose_route(content: Optional[str], policy: RoutingPolicy) -> str:
+    """Send short posts to the fast model first; everything else goes straight to the large model."""
+    if policy.enabled and len(content or "") <= policy.max_fast_chars:
+        return FAST
+    return LARGE
+
+class RouteMetrics:
+    """Per-process latency and token counters for each analysis route."""
+
+    _routes: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def record(
+        cls,
+        route: str,
+        latency_seconds: float,
+        usage: Optional[Dict[str, int]] = None,
+        error: bool = False,
+        escalation_reason: Optional[str] = None
+    ) -> None:
+        metrics = cls._routes.setdefault(route, {
+            "calls": 0,
+            "errors": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "escalation_reasons": {},
+            "latencies": LatencyWindow(LATENCY_SAMPLES)
+        })
+        metrics["calls"] += 1
+        metrics["errors"] += error
+        metrics["latencies"].record(latency_seconds)
+        for key in ("prompt_tokens", "completion_tokens"):
+            metrics[key] += (usage or {}).get(key, 0)
+        if escalation_reason:
+            reasons = metrics["escalation_reasons"]
+            reasons[escalation_reason] = reasons.get(escalation_reason, 0) + 1
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Dict[str, Any]]:
+        """Summarize each route with latency percentiles over its recent calls."""
+        summary = {}
+        for route, metrics in cls._routes.items():
+            summary[route] = {
+                "calls": metrics["calls"],
+                "errors": metrics["errors"],
+                "prompt_tokens": metrics["prompt_tokens"],
+                "completion_tokens": metrics["completion_tokens"],
+                "escalation_reasons": dict(metrics["escalation_reasons"]),
+                **metrics["latencies"].percentiles()
+            }
+        return summary
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import settings
+from queries.auth_queries import AuthQueries
+from utils.auth_helpers import extract_user_info
+from datetime import datetime
+from typing import Any, Dict, NamedTuple, Optional
+import time
+
+class Principal(NamedTuple):
+    """The caller as the API sees them: Auth0 identity, user row, tenant and the tenant's settings.
+
+    `tenant_settings` is shared with the cache and must not be modified.
+    """
+    auth0_user_id: str
+    email: str
+    name: str
+    tenant_id: Optional[int]
+    # The user row's fields are None until the caller's first login creates it
+    user_id: Optional[int]
+    role: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    tenant_settings: Dict[str, Any]
+
+class PrincipalResolver:
+    """Resolves the caller's principal and tenant settings, reusing them across requests for a short TTL.
+
+    The cache is per process. Services that write users or tenant settings invalidate it, and
+    the TTL bounds how long other workers can serve a principal from before such a write.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._principals: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._tenant_settings: "OrderedDict[int, tuple]" = OrderedDict()
+        # Bumped by every invalidation so a lookup that raced a write does not cache what it read
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def resolve(self, db: AsyncSession, current_user: Dict[str, Any]) -> Principal:
+        """The principal for a verified token, loaded with one query on a cache miss."""
+        user_info = extract_user_info(current_user)
+        key = (user_info["auth0_user_id"], user_info["tenant_id"])
+        principal = self._get(self._principals, key)
+        if principal is not None:
+            return principal
+
+        generation = self._generation
+        row = await AuthQueries(db).get_user_with_tenant_settings(*key)
+        if row is not None:
+            user, tenant_settings = row
+            principal = Principal(
+                auth0_user_id=user.auth0_user_id,
+                email=user.email,
+                name=user.name,
+                tenant_id=user.tenant_id,
+                user_id=user.id,
+                role=user.role,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+                tenant_settings=tenant_settings
+            )
+            self._put(self._tenant_settings, user.tenant_id, tenant_settings, generation)
+        else:
+            tenant_id = user_info["tenant_id"]
+            principal = Principal(
+                auth0_user_id=user_info["auth0_user_id"],
+                email=user_info["email"],
+                name=user_info["name"],
+                tenant_id=tenant_id,
+                user_id=None,
+                role=None,
+                created_at=None,
+                updated_at=None,
+                tenant_settings=await self.get_tenant_settings(db, tenant_id) if tenant_id else {}
+            )
+            # Not cached: once another worker creates the user row, this one must see it on the next request
+            return principal
+        self._put(self._principals, key, principal, generation)
+        return principal
+
+    async def get_tenant_settings(self, db: AsyncSession, tenant_id: int) -> Dict[str, Any]:
+        """A copy of the tenant's settings JSON, for reads; writes should read the row afresh."""
+        tenant_settings = self._get(self._tenant_settings, tenant_id)
+        if tenant_settings is None:
+            generation = self._generation
+            tenant_settings = await AuthQueries(db).get_tenant_settings(tenant_id)
+            self._put(self._tenant_settings, tenant_id, tenant_settings, generation)
+        return dict(tenant_settings)
+
+    def invalidate_user(self, auth0_user_id: str) -> None:
+        self._generation += 1
+        for key in [key for key in self._principals if key[0] == auth0_user_id]:
+            del self._principals[key]
+
+    def invalidate_tenant(self, tenant_id: int) -> None:
+        self._generation += 1
+        self._tenant_settings.pop(tenant_id, None)
+        for key in [key for key, (principal, _) in self._principals.items() if principal.tenant_id == tenant_id]:
+            del self._principals[key]
+
+    def _get(self, cache: OrderedDict, key) -> Any:
+        entry = cache.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            self.misses += 1
+            return None
+        cache.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def _put(self, cache: OrderedDict, key, value: Any, generation: int) -> None:
+        if self.ttl_seconds <= 0 or generation != self._generation:
+            return
+        cache[key] = (value, time.monotonic() + self.ttl_seconds)
+        cache.move_to_end(key)
+        while len(cache) > self.max_entries:
+            cache.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "principals": len(self._principals),
+            "tenants": len(self._tenant_settings),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+principal_resolver = PrincipalResolver(settings.principal_cache_ttl_seconds, settings.principal_cache_max_entries)
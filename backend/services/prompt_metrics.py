@@ -0,0 +1,41 @@
+from utils.latency_window import LatencyWindow
+from typing import Dict, Any, Tuple
+
+# Latency samples kept per prompt version and model for percentiles
+LATENCY_SAMPLES = 1000
+
+class PromptMetrics:
+    """Per-process token and latency counters for each prompt version and model, to compare versions."""
+
+    _prompts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    @classmethod
+    def record(cls, prompt_id: str, model: str, latency_seconds: float, usage: Dict[str, int]) -> None:
+        metrics = cls._prompts.setdefault((prompt_id, model), {
+            "calls": 0,
+            "prompt_tokens": 0,
+            "cached_tokens": 0,
+            "completion_tokens": 0,
+            "latencies": LatencyWindow(LATENCY_SAMPLES)
+        })
+        metrics["calls"] += 1
+        metrics["latencies"].record(latency_seconds)
+        for key in ("prompt_tokens", "cached_tokens", "completion_tokens"):
+            metrics[key] += usage.get(key, 0)
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Summarize each prompt version per model with average tokens and latency percentiles."""
+        summary: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (prompt_id, model), metrics in cls._prompts.items():
+            calls = metrics["calls"]
+            summary.setdefault(prompt_id, {})[model] = {
+                "calls": calls,
+                "prompt_tokens": metrics["prompt_tokens"],
+                "cached_tokens": metrics["cached_tokens"],
+                "completion_tokens": metrics["completion_tokens"],
+                "avg_prompt_tokens": round(metrics["prompt_tokens"] / calls, 1),
+                "avg_completion_tokens": round(metrics["completion_tokens"] / calls, 1),
+                **metrics["latencies"].percentiles()
+            }
+        return summary
@@ -1,29 +1,33 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from queries.proposal_queries import ProposalQueries
 from queries.opportunity_queries import OpportunityQueries
 from services.ai_service import AIService
+from models import ProposalStatus
+from database import settings
 from utils.response_helpers import validation_error, conflict_error, not_found_error
 from typing import Dict, Any, List, Optional
+import anyio
+import time
 
 class ProposalService:
     """Service for proposal-related business operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, user_id: Optional[str] = None):
         self.db = db
         self.queries = ProposalQueries(db)
         self.opportunity_queries = OpportunityQueries(db)
-        self.ai_service = AIService(db)
+        self.ai_service = AIService(db, user_id)
 
-    def create_proposal_with_validation(self, proposal_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_proposal_with_validation(self, proposal_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create proposal with business validation."""
         self._validate_proposal_data(proposal_data)
-        self._validate_opportunity_exists(proposal_data)
-        self._check_proposal_uniqueness(proposal_data)
+        await self._validate_opportunity_exists(proposal_data)
+        await self._check_proposal_uniqueness(proposal_data)
         self._normalize_proposal_data(proposal_data)
 
-        return self.queries.create_proposal(proposal_data)
+        return await self.queries.create_proposal(proposal_data)
 
-    def update_proposal_with_validation(self, proposal: Any, update_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def update_proposal_with_validation(self, proposal: Any, update_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update proposal with business validation."""
         if update_data:
             self._validate_proposal_data(update_data, is_update=True)
@@ -34,7 +38,7 @@ class ProposalService:
 
             self._normalize_proposal_data(update_data)
 
-        return self.queries.update_proposal(proposal, update_data)
+        return await self.queries.update_proposal(proposal, update_data)
 
     async def generate_proposal_with_ai(
         self,
@@ -44,12 +48,12 @@ class ProposalService:
     ) -> Dict[str, Any]:
         """Generate proposal content using AI service."""
         # Validate opportunity exists
-        opportunity = self.opportunity_queries.get_opportunity_by_id(opportunity_id, tenant_id)
+        opportunity = await self.opportunity_queries.get_opportunity_by_id(opportunity_id, tenant_id)
         if not opportunity:
             raise not_found_error("Opportunity", opportunity_id)
 
         # Check if proposal already exists
-        existing_proposal = self.queries.get_proposal_by_opportunity_id(opportunity_id, tenant_id)
+        existing_proposal = await self.queries.get_proposal_by_opportunity_id(opportunity_id, tenant_id)
         if existing_proposal:
             raise conflict_error("Proposal already exists for this opportunity")
 
@@ -64,20 +68,94 @@ class ProposalService:
             "status": "Draft"
         }
 
-        new_proposal = self.queries.create_proposal(proposal_data)
+        new_proposal = await self.queries.create_proposal(proposal_data)
 
         return {
             "proposal": new_proposal,
             "ai_suggestions": ai_result.get("suggested_sections", [])
         }
 
-    def get_proposal_statistics(self, tenant_id: int) -> Dict[str, Any]:
+    async def generate_proposal_with_ai_streaming(
+        self,
+        opportunity_id: int,
+        tenant_id: int,
+        additional_context: Optional[str] = None
+    ):
+        """Stream AI proposal generation into a draft proposal that is checkpointed as tokens arrive."""
+        # Validate up front so errors are returned as HTTP errors, not mid-stream
+        opportunity = await self.opportunity_queries.get_opportunity_by_id(opportunity_id, tenant_id)
+        if not opportunity:
+            raise not_found_error("Opportunity", opportunity_id)
+
+        existing_proposal = await self.queries.get_proposal_by_opportunity_id(opportunity_id, tenant_id)
+        if existing_proposal:
+            raise conflict_error("Proposal already exists for this opportunity")
+
+        events = await self.ai_service.generate_proposal_streaming(opportunity_id, tenant_id, None, additional_context)
+
+        # Claim the opportunity's proposal slot immediately; content is filled in by checkpoints
+        draft = await self.queries.create_proposal({
+            "tenant_id": tenant_id,
+            "opportunity_id": opportunity_id,
+            "content": "",
+            "status": ProposalStatus.DRAFT
+        })
+
+        return self._checkpoint_proposal_stream(draft, events)
+
+    async def _checkpoint_proposal_stream(self, draft: Any, events):
+        """Relay generation events, saving the accumulated content on an interval and when the stream ends."""
+        content_parts = []
+        content_length = 0
+        saved_length = 0
+        saved_at = time.monotonic()
+        completed = False
+
+        try:
+            yield {"status": "proposal_created", "proposal_id": draft.id}
+
+            async for event in events:
+                if event["status"] == "token":
+                    content_parts.append(event["content"])
+                    content_length += len(event["content"])
+                    yield event
+
+                    if (content_length - saved_length >= settings.proposal_checkpoint_interval_chars
+                            or time.monotonic() - saved_at >= settings.proposal_checkpoint_interval_seconds):
+                        await self.queries.update_proposal_content(draft.id, "".join(content_parts))
+                        saved_length = content_length
+                        saved_at = time.monotonic()
+                        yield {"status": "checkpoint", "proposal_id": draft.id, "saved_chars": saved_length}
+
+                elif event["status"] == "completed":
+                    proposal = await self.queries.update_proposal(draft, {"content": event["proposal_content"]})
+                    completed = True
+                    yield {
+                        "status": "completed",
+                        "proposal": proposal,
+                        "ai_suggestions": event["suggested_sections"]
+                    }
+
+                else:
+                    yield event
+
+        finally:
+            # Runs on errors and client disconnects too, so partial generations are kept as drafts.
+            # Shielded because a disconnect cancels the stream and would otherwise cancel these writes too.
+            if not completed:
+                with anyio.CancelScope(shield=True):
+                    if content_parts:
+                        await self.queries.update_proposal_content(draft.id, "".join(content_parts))
+                    else:
+                        await self.queries.delete_proposal(draft)
+
+    async def get_proposal_statistics(self, tenant_id: int) -> Dict[str, Any]:
         """Get proposal statistics for a tenant."""
-        total_proposals = self.queries.count_proposals_by_tenant(tenant_id)
+        total_proposals = await self.queries.count_proposals_by_tenant(tenant_id)
 
         status_counts = {}
         for status in ["Draft", "Sent", "Replied", "Won", "Lost"]:
-            status_counts[status.lower()] = self.queries.count_proposals_by_status(tenant_id, status)
+            status_counts[status.lower()] = await self.queries.count_proposals_by_status(tenant_id, status)
 
         win_rate = 0
         if status_counts["sent"] + status_counts["replied"] + status_counts["won"] + status_counts["lost"] > 0:
@@ -91,28 +169,28 @@ class ProposalService:
             "active_proposals": status_counts["draft"] + status_counts["sent"] + status_counts["replied"]
         }
 
-    def search_proposals(self, tenant_id: int, search_term: str) -> List[Dict[str, Any]]:
+    async def search_proposals(self, tenant_id: int, search_term: str) -> List[Dict[str, Any]]:
         """Search proposals by content."""
         if len(search_term.strip()) < 3:
             raise validation_error("Search term must be at least 3 characters")
 
-        proposals = self.queries.search_proposals_by_content(tenant_id, search_term)
+        proposals = await self.queries.search_proposals_by_content(tenant_id, search_term)
         return proposals
 
-    def duplicate_proposal(self, proposal_id: int, tenant_id: int, new_opportunity_id: int) -> Dict[str, Any]:
+    async def duplicate_proposal(self, proposal_id: int, tenant_id: int, new_opportunity_id: int) -> Dict[str, Any]:
         """Duplicate an existing proposal for a new opportunity."""
         # Get original proposal
-        original_proposal = self.queries.get_proposal_by_id(proposal_id, tenant_id)
+        original_proposal = await self.queries.get_proposal_by_id(proposal_id, tenant_id)
         if not original_proposal:
             raise not_found_error("Proposal", proposal_id)
 
         # Validate new opportunity exists
-        new_opportunity = self.opportunity_queries.get_opportunity_by_id(new_opportunity_id, tenant_id)
+        new_opportunity = await self.opportunity_queries.get_opportunity_by_id(new_opportunity_id, tenant_id)
         if not new_opportunity:
             raise not_found_error("Opportunity", new_opportunity_id)
 
         # Check if proposal already exists for new opportunity
-        existing_proposal = self.queries.get_proposal_by_opportunity_id(new_opportunity_id, tenant_id)
+        existing_proposal = await self.queries.get_proposal_by_opportunity_id(new_opportunity_id, tenant_id)
         if existing_proposal:
             raise conflict_error("Proposal already exists for the target opportunity")
 
@@ -124,11 +202,11 @@ class ProposalService:
             "status": "Draft"
         }
 
-        return self.queries.create_proposal(proposal_data)
+        return await self.queries.create_proposal(proposal_data)
 
-    def export_proposal(self, proposal_id: int, tenant_id: int, format: str = "markdown") -> Dict[str, Any]:
+    async def export_proposal(self, proposal_id: int, tenant_id: int, format: str = "markdown") -> Dict[str, Any]:
         """Export proposal in different formats."""
-        proposal = self.queries.get_proposal_by_id(proposal_id, tenant_id)
+        proposal = await self.queries.get_proposal_by_id(proposal_id, tenant_id)
         if not proposal:
             raise not_found_error("Proposal", proposal_id)
 
@@ -181,21 +259,21 @@ class ProposalService:
         if "status" in data and data["status"]:
             data["status"] = data["status"].capitalize()
 
-    def _validate_opportunity_exists(self, proposal_data: Dict[str, Any]) -> None:
+    async def _validate_opportunity_exists(self, proposal_data: Dict[str, Any]) -> None:
         """Validate that the opportunity exists."""
         opportunity_id = proposal_data["opportunity_id"]
         tenant_id = proposal_data["tenant_id"]
 
-        opportunity = self.opportunity_queries.get_opportunity_by_id(opportunity_id, tenant_id)
+        opportunity = await self.opportunity_queries.get_opportunity_by_id(opportunity_id, tenant_id)
         if not opportunity:
             raise not_found_error("Opportunity", opportunity_id)
 
-    def _check_proposal_uniqueness(self, proposal_data: Dict[str, Any]) -> None:
+    async def _check_proposal_uniqueness(self, proposal_data: Dict[str, Any]) -> None:
         """Check if proposal already exists for this opportunity."""
         opportunity_id = proposal_data["opportunity_id"]
         tenant_id = proposal_data["tenant_id"]
 
-        existing_proposal = self.queries.get_proposal_by_opportunity_id(opportunity_id, tenant_id)
+        existing_proposal = await self.queries.get_proposal_by_opportunity_id(opportunity_id, tenant_id)
         if existing_proposal:
             raise conflict_error("Proposal already exists for this opportunity")
 
@@ -0,0 +1,74 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from queries.search_queries import SearchQueries
+from schemas.search import SearchEntityType
+from utils.response_helpers import validation_error
+from collections import defaultdict
+from typing import Dict, Any, List, Optional
+
+MIN_SEARCH_LENGTH = 2
+MAX_SEARCH_LENGTH = 200
+
+class SearchService:
+    """Service for ranked search across a tenant's records."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.queries = SearchQueries(db)
+
+    async def search(
+        self,
+        tenant_id: int,
+        search_term: str,
+        entity_types: Optional[List[SearchEntityType]] = None,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        """Search every requested entity type and return one ranked page."""
+        search_term = self._validate_search_term(search_term)
+        types = [entity_type.value for entity_type in (entity_types or list(SearchEntityType))]
+
+        # One extra row tells us whether another page exists without counting every match
+        rows = await self.queries.search_ranked(tenant_id, search_term, list(dict.fromkeys(types)), skip, limit + 1)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        details = await self._load_details(tenant_id, search_term, rows)
+
+        return {
+            "query": search_term,
+            "results": [
+                {
+                    "entity_type": row.entity_type,
+                    "id": row.id,
+                    "rank": round(row.rank, 6),
+                    "created_at": row.created_at,
+                    **details.get((row.entity_type, row.id), {})
+                }
+                for row in rows
+            ],
+            "skip": skip,
+            "limit": limit,
+            "has_more": has_more
+        }
+
+    async def _load_details(self, tenant_id: int, search_term: str, rows: List[Any]) -> Dict[tuple, Dict[str, Any]]:
+        """Fetch titles and snippets for the page only, one query per entity type present."""
+        ids_by_type = defaultdict(list)
+        for row in rows:
+            ids_by_type[row.entity_type].append(row.id)
+
+        details = {}
+        for entity_type, ids in ids_by_type.items():
+            type_details = await self.queries.get_result_details(tenant_id, search_term, entity_type, ids)
+            for entity_id, detail in type_details.items():
+                details[(entity_type, entity_id)] = detail
+        return details
+
+    def _validate_search_term(self, search_term: str) -> str:
+        """Trim and bound the search term."""
+        search_term = search_term.strip()
+        if len(search_term) < MIN_SEARCH_LENGTH:
+            raise validation_error(f"Search term must be at least {MIN_SEARCH_LENGTH} characters")
+        if len(search_term) > MAX_SEARCH_LENGTH:
+            raise validation_error(f"Search term cannot exceed {MAX_SEARCH_LENGTH} characters")
+        return search_term
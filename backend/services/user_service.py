@@ -1,5 +1,6 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from queries.linkedin_queries import LinkedInQueries
+from services.principal_resolver import Principal, principal_resolver
 from models import User, Tenant
 from utils.response_helpers import not_found_error
 from utils.auth_helpers import extract_user_info
@@ -8,16 +9,16 @@ from typing import Dict, Any
 class UserService:
     """Service for user-related business operations."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.queries = LinkedInQueries(db)
 
-    def get_or_create_user(self, current_user: Dict[str, Any], tenant_id: int) -> User:
+    async def get_or_create_user(self, current_user: Dict[str, Any], tenant_id: int) -> User:
         """Get existing user or create new one if doesn't exist."""
         user_info = extract_user_info(current_user)
         auth0_user_id = user_info["auth0_user_id"]
 
-        user = self.queries.get_user_by_auth0_id(auth0_user_id, tenant_id)
+        user = await self.queries.get_user_by_auth0_id(auth0_user_id, tenant_id)
 
         if not user:
             # Auto-create user if doesn't exist
@@ -29,18 +30,15 @@ class UserService:
                 role="user"
             )
             self.db.add(user)
-            self.db.commit()
-            self.db.refresh(user)
+            await self.db.commit()
+            await self.db.refresh(user)
+            principal_resolver.invalidate_user(auth0_user_id)
 
         return user
 
-    def validate_user_access(self, current_user: Dict[str, Any], tenant_id: int) -> User:
-        """Validate user exists and has access to tenant."""
-        user_info = extract_user_info(current_user)
-        auth0_user_id = user_info["auth0_user_id"]
-
-        user = self.queries.get_user_by_auth0_id(auth0_user_id, tenant_id)
-        if not user:
+    def validate_user_access(self, principal: Principal, tenant_id: int) -> int:
+        """Validate user exists and has access to tenant; returns the user's ID."""
+        if principal.user_id is None or principal.tenant_id != tenant_id:
             raise not_found_error("User")
 
-        return user
\ No newline at end of file
+        return principal.user_id
\ No newline at end of file
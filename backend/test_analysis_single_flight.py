@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Sharing of in-flight opportunity analyses between users of a tenant
+Streams the same post for two users at once against a fake OpenAI client and checks
+that one model call serves both, the second caller is told its result was shared, and
+each user's AI budget is still charged. Deletes its tenant afterwards.
+Run with: python test_analysis_single_flight.py (needs DATABASE_URL migrated to head)
+"""
+
+import asyncio
+import json
+import sys
+from types import SimpleNamespace
+
+from sqlalchemy import text
+
+from database import AsyncSessionLocal, engine
+from prompts.opportunity_analysis import MODEL_CONFIG
+from services.ai_service import AIService
+from utils import openai_client
+
+TENANT_NAME = "single-flight-test-tenant"
+USERS = ["auth0|single-flight-a", "auth0|single-flight-b"]
+
+ANALYSIS = {
+    "is_opportunity": True,
+    "confidence": 0.9,
+    "extracted_fields": {"title": {"value": "React developer", "confidence": 0.9}},
+    "category": "development",
+    "urgency": "normal",
+    "tags": ["react"]
+}
+
+class FakeOpenAIClient:
+    """Stands in for the process-wide client: streams a canned analysis after a short delay."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def create_chat_completion(self, stream: bool = False, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.2)
+        content = json.dumps(ANALYSIS)
+
+        async def chunks():
+            for i in range(0, len(content), 16):
+                await asyncio.sleep(0.001)
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content[i:i + 16]))])
+        return chunks()
+
+async def stream_analysis(user_id: str, post) -> list:
+    async with AsyncSessionLocal() as db:
+        service = AIService(db, user_id=user_id)
+        return [
+            json.loads(line)
+            async for line in service.analyze_opportunity_comprehensive_streaming(post, enable_cache=False, enable_prefilter=False)
+        ]
+
+async def run(tenant_id: int) -> bool:
+    client = FakeOpenAIClient()
+    openai_client._client = client
+    # Long enough to be routed straight to the large model
+    post = SimpleNamespace(
+        id=0,
+        tenant_id=tenant_id,
+        content="We are hiring a freelance React developer for a six week dashboard project. " * 20,
+        author_profile_url="https://www.linkedin.com/in/single-flight"
+    )
+
+    results = await asyncio.gather(*(stream_analysis(user_id, post) for user_id in USERS))
+    finals = [events[-1] for events in results]
+
+    with engine.connect() as conn:
+        charged = {
+            subject for (subject,) in conn.execute(
+                text("SELECT subject FROM ai_rate_limit_buckets WHERE tenant_id = :t"), {"t": tenant_id}
+            )
+        }
+
+    checks = [
+        ("both callers completed", all(final["status"] == "completed" for final in finals)),
+        (f"one model call for two users ({client.calls})", client.calls == 1),
+        ("second user's result is shared", sorted(bool(final.get("shared")) for final in finals) == [False, True]),
+        ("both users' budgets charged", {f"user:{user_id}" for user_id in USERS} <= charged),
+    ]
+    for label, ok in checks:
+        print(f"{'✅' if ok else '❌'} {label}")
+    return all(ok for _, ok in checks)
+
+def main() -> bool:
+    with engine.begin() as conn:
+        tenant_id = conn.execute(
+            text("INSERT INTO tenants (name, settings) VALUES (:n, '{}') RETURNING id"), {"n": TENANT_NAME}
+        ).scalar_one()
+    try:
+        return asyncio.run(run(tenant_id))
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM tenants WHERE id = :t"), {"t": tenant_id})
+
+if __name__ == "__main__":
+    print(f"🧪 Testing shared analyses on {MODEL_CONFIG['model']}...")
+    passed = main()
+    print("\n🎉 Users of a tenant share one analysis" if passed else "\n❌ Shared analysis test failed")
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Consistency test for the trigger-maintained dashboard_daily_counts rollups
+Bulk inserts, updates and deletes rows inside a transaction, checks the
+rollups still match a GROUP BY over the base tables, then rolls back.
+Run with: python test_dashboard_rollups.py (needs DATABASE_URL migrated to head)
+"""
+
+import sys
+
+from sqlalchemy import text
+
+from database import engine
+
+TENANT_NAME = "rollup-test-tenant"
+
+# entity -> query counting the base table the same way the triggers do
+BASE_COUNTS = {
+    "opportunity": "SELECT (created_at AT TIME ZONE 'UTC')::date, status::text, count(*) FROM opportunities WHERE tenant_id = :t GROUP BY 1, 2",
+    "proposal": "SELECT (created_at AT TIME ZONE 'UTC')::date, status::text, count(*) FROM proposals WHERE tenant_id = :t GROUP BY 1, 2",
+    "campaign": "SELECT (created_at AT TIME ZONE 'UTC')::date, '', count(*) FROM campaigns WHERE tenant_id = :t GROUP BY 1, 2",
+    "linkedin_post": "SELECT (created_at AT TIME ZONE 'UTC')::date, '', count(*) FROM linkedin_posts WHERE tenant_id = :t GROUP BY 1, 2",
+}
+
+WRITES = [
+    ("bulk insert posts", """INSERT INTO linkedin_posts (tenant_id, post_url, content, scraped_at, created_at)
+        SELECT :t, 'https://www.linkedin.com/posts/rollup-' || g, 'Post ' || g, now(), now() - (g % 40) * interval '1 day'
+        FROM generate_series(1, 2000) g"""),
+    ("bulk insert opportunities", """INSERT INTO opportunities (tenant_id, title, status, tags, created_at)
+        SELECT :t, 'Opportunity ' || g, (ARRAY['DRAFT', 'SENT', 'REPLIED', 'WON', 'LOST'])[g % 5 + 1]::opportunitystatus,
+               '[]', now() - (g % 40) * interval '1 day'
+        FROM generate_series(1, 2000) g"""),
+    ("bulk insert proposals", """INSERT INTO proposals (tenant_id, opportunity_id, content, status, created_at)
+        SELECT tenant_id, id, 'Proposal', 'DRAFT', created_at FROM opportunities WHERE tenant_id = :t"""),
+    ("insert campaigns", "INSERT INTO campaigns (tenant_id, name) SELECT :t, 'Campaign ' || g FROM generate_series(1, 5) g"),
+    ("status changes", "UPDATE proposals SET status = 'SENT' WHERE tenant_id = :t AND id % 3 = 0"),
+    ("status no-ops and other columns", "UPDATE opportunities SET status = status, title = title || '!' WHERE tenant_id = :t AND id % 4 = 0"),
+    ("single row status change", "UPDATE opportunities SET status = 'WON' WHERE id = (SELECT min(id) FROM opportunities WHERE tenant_id = :t)"),
+    ("bulk delete", "DELETE FROM linkedin_posts WHERE tenant_id = :t AND id % 2 = 0"),
+    ("cascade delete", "DELETE FROM opportunities WHERE tenant_id = :t AND id % 5 = 0"),
+]
+
+def rollup_mismatches(conn, tenant_id: int) -> list:
+    """Compare every rollup bucket with the base tables, ignoring zero buckets."""
+    mismatches = []
+    for entity, base_query in BASE_COUNTS.items():
+        expected = {(day, status): count for day, status, count in conn.execute(text(base_query), {"t": tenant_id})}
+        actual = {
+            (day, status): count
+            for day, status, count in conn.execute(text(
+                "SELECT day, status, count FROM dashboard_daily_counts WHERE tenant_id = :t AND entity = :e AND count <> 0"
+            ), {"t": tenant_id, "e": entity})
+        }
+        if expected != actual:
+            mismatches.append(entity)
+    return mismatches
+
+def test_dashboard_rollups() -> bool:
+    """Apply each write and check the rollups after it."""
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            tenant_id = conn.execute(text(
+                "INSERT INTO tenants (name, settings) VALUES (:name, '{}') RETURNING id"
+            ), {"name": TENANT_NAME}).scalar_one()
+
+            failures = 0
+            for label, statement in WRITES:
+                conn.execute(text(statement), {"t": tenant_id})
+                mismatches = rollup_mismatches(conn, tenant_id)
+                if mismatches:
+                    failures += 1
+                    print(f"❌ {label}: rollups drifted for {', '.join(mismatches)}")
+                else:
+                    print(f"✅ {label}")
+
+            conn.execute(text("DELETE FROM tenants WHERE id = :t"), {"t": tenant_id})
+            leftover = conn.execute(text(
+                "SELECT count(*) FROM dashboard_daily_counts WHERE tenant_id = :t"
+            ), {"t": tenant_id}).scalar()
+            if leftover:
+                failures += 1
+                print(f"❌ tenant delete left {leftover} rollup rows")
+            else:
+                print("✅ tenant delete")
+
+            return failures == 0
+        finally:
+            transaction.rollback()
+
+if __name__ == "__main__":
+    print("🧪 Checking dashboard rollups against base tables...")
+    passed = test_dashboard_rollups()
+    print("\n🎉 Rollups match the base tables" if passed else "\n❌ Rollups drifted from the base tables")
+    sys.exit(0 if passed else 1)
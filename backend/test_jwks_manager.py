@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+JWKS handling under cold start, key rotation and unknown kids
+Serves a JWKS from a local stub, signs tokens with freshly generated RSA keys and checks
+that concurrent requests share one fetch, a rotated-in key is picked up without a restart,
+unknown kids are negatively cached and cached keys outlive a JWKS outage.
+Run with: python test_jwks_manager.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+class JWKSStub(BaseHTTPRequestHandler):
+    keys = []
+    status = 200
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        body = json.dumps({"keys": self.keys}).encode()
+        self.send_response(self.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+server = ThreadingHTTPServer(("127.0.0.1", 0), JWKSStub)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+os.environ.update({
+    "AUTH0_DOMAIN": "tenant.example.com",
+    "AUTH0_API_AUDIENCE": "https://api.example.com",
+    "AUTH0_JWKS_URL": f"http://127.0.0.1:{server.server_port}/.well-known/jwks.json",
+    "AUTH0_JWKS_TTL_SECONDS": "0.5",
+    "AUTH0_JWKS_UNKNOWN_KID_TTL_SECONDS": "2",
+    "AUTH0_JWKS_MIN_REFETCH_SECONDS": "0.2",
+})
+
+from fastapi import HTTPException
+from middleware.auth import Auth0JWTBearer
+
+def make_key(kid: str):
+    private = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    signing_key = jwk.construct(private.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ), "RS256")
+    public = jwk.construct(private.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ), "RS256").to_dict()
+    public.update({"kid": kid, "use": "sig", "alg": "RS256"})
+    return signing_key, public
+
+def sign(signing_key, kid: str, sub: str = "auth0|user") -> str:
+    claims = {
+        "sub": sub,
+        "aud": os.environ["AUTH0_API_AUDIENCE"],
+        "iss": f"https://{os.environ['AUTH0_DOMAIN']}/",
+        "exp": int(time.time()) + 300
+    }
+    return jwt.encode(claims, signing_key, algorithm="RS256", headers={"kid": kid})
+
+async def verify_all(bearer, tokens) -> list:
+    """Status per token: 200 when it verified, the HTTPException status otherwise."""
+    async def verify(token):
+        try:
+            await bearer.verify_token(token)
+            return 200
+        except HTTPException as e:
+            return e.status_code
+    return await asyncio.gather(*(verify(token) for token in tokens))
+
+def check(label: str, ok: bool) -> bool:
+    print(f"{'✅' if ok else '❌'} {label}")
+    return ok
+
+async def run() -> bool:
+    passed = True
+    bearer = Auth0JWTBearer()
+    old_key, old_jwk = make_key("key-1")
+    new_key, new_jwk = make_key("key-2")
+    JWKSStub.keys = [old_jwk]
+
+    statuses = await verify_all(bearer, [sign(old_key, "key-1", f"auth0|{i}") for i in range(50)])
+    passed &= check(f"cold start: 50 concurrent requests, {JWKSStub.hits} JWKS fetch", set(statuses) == {200} and JWKSStub.hits == 1)
+
+    hits = JWKSStub.hits
+    statuses = await verify_all(bearer, [sign(old_key, "key-1")] * 200)
+    passed &= check("cached key: no fetches while fresh", set(statuses) == {200} and JWKSStub.hits == hits)
+
+    # Auth0 rotates: the new key is published alongside the old one
+    await asyncio.sleep(0.25)
+    JWKSStub.keys = [old_jwk, new_jwk]
+    hits = JWKSStub.hits
+    statuses = await verify_all(bearer, [sign(new_key, "key-2")] * 20)
+    passed &= check(f"rotation: new kid accepted after {JWKSStub.hits - hits} shared refetch", set(statuses) == {200} and JWKSStub.hits == hits + 1)
+
+    await asyncio.sleep(0.25)
+    hits = JWKSStub.hits
+    statuses = await verify_all(bearer, [sign(new_key, "bogus")] * 100)
+    first = JWKSStub.hits - hits
+    await asyncio.sleep(0.25)
+    statuses += await verify_all(bearer, [sign(new_key, "bogus")] * 100)
+    passed &= check(
+        f"unknown kid: 401s from {first} refetch, then negatively cached",
+        set(statuses) == {401} and first == 1 and JWKSStub.hits == hits + 1
+    )
+
+    # JWKS endpoint down once the keys are past their TTL: cached keys keep working
+    await asyncio.sleep(0.6)
+    JWKSStub.status = 500
+    statuses = await verify_all(bearer, [sign(new_key, "key-2")] * 10)
+    await asyncio.sleep(0.1)
+    passed &= check("outage: stale keys served while refresh fails", set(statuses) == {200} and bearer.jwks.failures >= 1)
+
+    # Old key retired: the background refresh drops it
+    JWKSStub.status = 200
+    JWKSStub.keys = [new_jwk]
+    bearer.jwks.start()
+    await asyncio.sleep(0.3)
+    statuses = await verify_all(bearer, [sign(old_key, "key-1"), sign(new_key, "key-2")])
+    passed &= check("retired key rejected after background refresh", statuses == [401, 200])
+    print(f"   {bearer.jwks.snapshot()}")
+
+    await bearer.jwks.stop()
+    return passed
+
+if __name__ == "__main__":
+    print("🧪 Testing JWKS caching and key rotation...")
+    passed = asyncio.run(run())
+    server.shutdown()
+    print("\n🎉 JWKS handling is correct under rotation" if passed else "\n❌ JWKS handling failed")
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the local opportunity pre-screen
+Scores the labeled posts in fixtures/prefilter_posts.jsonl at the configured
+AI_PREFILTER_MIN_SCORE and reports how many model calls it saves, the recall
+on real opportunities, and scoring throughput.
+Run with: python test_opportunity_prefilter.py
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+from database import settings
+from utils.opportunity_prefilter import score_post
+
+FIXTURE = Path(__file__).parent / "fixtures" / "prefilter_posts.jsonl"
+MIN_CALLS_SAVED = 0.60
+MIN_RECALL = 0.95
+THROUGHPUT_ROUNDS = 200
+
+def load_fixture() -> list:
+    with open(FIXTURE) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def test_prefilter(posts: list) -> bool:
+    """Check call savings and recall against the labeled posts."""
+    min_score = settings.ai_prefilter_min_score
+    kept_opportunities = missed = kept_other = skipped_other = 0
+
+    for post in posts:
+        prefilter = score_post(post["content"])
+        kept = prefilter.score >= min_score
+        if post["is_opportunity"]:
+            kept_opportunities += kept
+            missed += not kept
+            if not kept:
+                print(f"   missed ({prefilter.score}, {prefilter.signals}): {post['content'][:70]}")
+        else:
+            kept_other += kept
+            skipped_other += not kept
+
+    calls_saved = (missed + skipped_other) / len(posts)
+    recall = kept_opportunities / (kept_opportunities + missed)
+    precision = kept_opportunities / max(kept_opportunities + kept_other, 1)
+
+    print(f"📊 {len(posts)} posts, min score {min_score}")
+    print(f"   model calls saved: {calls_saved:.1%}")
+    print(f"   recall: {recall:.1%}  precision of posts sent to the model: {precision:.1%}")
+
+    passed = True
+    if calls_saved < MIN_CALLS_SAVED:
+        print(f"❌ Saved fewer than {MIN_CALLS_SAVED:.0%} of model calls")
+        passed = False
+    if recall < MIN_RECALL:
+        print(f"❌ Recall below {MIN_RECALL:.0%}")
+        passed = False
+    return passed
+
+def benchmark_throughput(posts: list) -> None:
+    started = time.perf_counter()
+    for _ in range(THROUGHPUT_ROUNDS):
+        for post in posts:
+            score_post(post["content"])
+    elapsed = time.perf_counter() - started
+    print(f"⏱️  {THROUGHPUT_ROUNDS * len(posts) / elapsed:,.0f} posts/s on one core")
+
+if __name__ == "__main__":
+    print("🧪 Benchmarking the opportunity pre-screen...")
+    posts = load_fixture()
+    passed = test_prefilter(posts)
+    benchmark_throughput(posts)
+    print("\n🎉 Pre-screen meets its targets" if passed else "\n❌ Pre-screen missed its targets")
+    sys.exit(0 if passed else 1)
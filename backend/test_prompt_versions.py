@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Token comparison of the opportunity analysis prompt versions
+Renders every registered version for the posts in fixtures/prefilter_posts.jsonl and
+reports prompt tokens per call and how much of each prompt is a static prefix the
+provider can cache. Checks that the active version is no larger than the first one and
+keeps per-post content out of its prefix.
+Run with: python test_prompt_versions.py (exact counts need tiktoken and its encoding files)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from prompts import opportunity_analysis
+from prompts.registry import list_versions
+from services.ai_service import build_analysis_messages
+from utils.token_counter import count_message_tokens, has_exact_tokenizer
+
+FIXTURE = Path(__file__).parent / "fixtures" / "prefilter_posts.jsonl"
+MODEL = opportunity_analysis.MODEL_CONFIG["model"]
+# Fields the response normalizer reads; every version must ask for all of them
+RESPONSE_FIELDS = [
+    "is_opportunity", "confidence", "extracted_fields", "company_suggestion", "contact_suggestion",
+    "category", "urgency", "tags", "budget_range", "timeline"
+]
+# Tokens the active version's user turn may add around the post itself
+MAX_USER_OVERHEAD_TOKENS = 20
+
+def load_posts() -> list:
+    with open(FIXTURE) as f:
+        return [json.loads(line)["content"] for line in f if line.strip()]
+
+def measure(prompt, posts: list) -> dict:
+    """Average prompt tokens over the posts and the share of them in the static system message."""
+    prefix_tokens = count_message_tokens([{"role": "system", "content": prompt.system_message}], MODEL)
+    totals = [
+        count_message_tokens(build_analysis_messages(prompt, content, "https://www.linkedin.com/in/author"), MODEL)
+        for content in posts
+    ]
+    average = sum(totals) / len(totals)
+    return {"prefix_tokens": prefix_tokens, "average_tokens": average, "prefix_share": prefix_tokens / average}
+
+def test_versions(posts: list) -> bool:
+    versions = list_versions(opportunity_analysis.NAME)
+    active = opportunity_analysis.active_prompt()
+    results = {prompt.version: measure(prompt, posts) for prompt in versions}
+
+    print(f"📊 {len(posts)} posts, {'tiktoken' if has_exact_tokenizer(MODEL) else 'estimated'} counts for {MODEL}")
+    for prompt in versions:
+        result = results[prompt.version]
+        marker = " (active)" if prompt == active else ""
+        print(f"   {prompt.prompt_id}{marker}: {result['average_tokens']:.0f} prompt tokens per call, "
+              f"{result['prefix_tokens']} in the static prefix ({result['prefix_share']:.0%})")
+
+    passed = True
+    baseline = results[versions[0].version]["average_tokens"]
+    reduction = 1 - results[active.version]["average_tokens"] / baseline
+    print(f"   active version vs {versions[0].prompt_id}: {reduction:.1%} fewer prompt tokens")
+    if reduction < 0:
+        print("❌ Active prompt is larger than the first version")
+        passed = False
+
+    missing = [field for field in RESPONSE_FIELDS if field not in active.system_message]
+    if missing:
+        print(f"❌ Active prompt does not ask for {missing}")
+        passed = False
+
+    # Anything in the user turn besides the post breaks the shared prefix for every call
+    overhead = count_message_tokens(build_analysis_messages(active, "", None), MODEL) - results[active.version]["prefix_tokens"]
+    if overhead > MAX_USER_OVERHEAD_TOKENS:
+        print(f"❌ Active prompt puts {overhead} instruction tokens after the post")
+        passed = False
+    return passed
+
+if __name__ == "__main__":
+    print("🧪 Comparing opportunity analysis prompt versions...")
+    passed = test_versions(load_posts())
+    print("\n🎉 Active prompt is compact and prefix-cacheable" if passed else "\n❌ Active prompt missed its targets")
+    sys.exit(0 if passed else 1)
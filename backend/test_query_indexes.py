@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+EXPLAIN regression test for tenant-scoped indexes
+Seeds ~100k rows per table inside a transaction, checks that the hot
+queries in queries/ are planned against their composite indexes, then
+rolls everything back.
+Run with: python test_query_indexes.py (needs DATABASE_URL migrated to head)
+"""
+
+import asyncio
+import json
+import sys
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from database import engine
+from models import OpportunityStatus, ProposalStatus
+from queries.campaign_queries import CampaignQueries
+from queries.contact_queries import ContactQueries
+from queries.dashboard_queries import DashboardQueries, OPPORTUNITY
+from queries.file_queries import FileQueries
+from queries.linkedin_queries import LinkedInQueries
+from queries.opportunity_queries import OpportunityQueries
+from queries.proposal_queries import ProposalQueries
+from queries.search_queries import SearchQueries
+
+TENANTS = 20
+ROWS_PER_TENANT = 5000
+TENANT_PREFIX = "explain-tenant-"
+# Appears once per tenant in post content and opportunity/proposal text
+RARE_SEARCH_TERM = "4242"
+
+SEED_STATEMENTS = [
+    f"""INSERT INTO tenants (name, settings)
+        SELECT '{TENANT_PREFIX}' || g, '{{}}' FROM generate_series(1, {TENANTS}) g""",
+    f"""INSERT INTO companies (tenant_id, name, domain)
+        SELECT t.id, 'Company ' || g, 'company' || g || '.example.com'
+        FROM tenants t CROSS JOIN generate_series(1, {ROWS_PER_TENANT // 5}) g
+        WHERE t.name LIKE '{TENANT_PREFIX}%'""",
+    """INSERT INTO contacts (tenant_id, company_id, name, email, linkedin_profile_url)
+        SELECT c.tenant_id, c.id, 'Contact ' || g, 'contact' || c.id || '-' || g || '@example.com',
+               'https://www.linkedin.com/in/contact-' || c.id || '-' || g
+        FROM companies c CROSS JOIN generate_series(1, 5) g
+        WHERE c.tenant_id IN (SELECT id FROM tenants WHERE name LIKE '""" + TENANT_PREFIX + """%')""",
+    f"""INSERT INTO linkedin_posts (tenant_id, post_url, content, scraped_at, created_at)
+        SELECT t.id, 'https://www.linkedin.com/posts/explain-' || t.id || '-' || g, 'Post ' || g,
+               now(), now() - g * interval '1 minute'
+        FROM tenants t CROSS JOIN generate_series(1, {ROWS_PER_TENANT}) g
+        WHERE t.name LIKE '{TENANT_PREFIX}%'""",
+    f"""INSERT INTO opportunities (tenant_id, title, summary, status, tags, created_at)
+        SELECT t.id, 'Opportunity ' || g, 'Summary',
+               (ARRAY['DRAFT', 'SENT', 'REPLIED', 'WON', 'LOST'])[g % 5 + 1]::opportunitystatus,
+               '[]', now() - g * interval '1 minute'
+        FROM tenants t CROSS JOIN generate_series(1, {ROWS_PER_TENANT}) g
+        WHERE t.name LIKE '{TENANT_PREFIX}%'""",
+    """INSERT INTO proposals (tenant_id, opportunity_id, content, status, created_at)
+        SELECT o.tenant_id, o.id, 'Proposal for ' || o.title, o.status::text::proposalstatus, o.created_at
+        FROM opportunities o
+        WHERE o.tenant_id IN (SELECT id FROM tenants WHERE name LIKE '""" + TENANT_PREFIX + """%')""",
+    """INSERT INTO proposal_files (tenant_id, proposal_id, filename, size, url)
+        SELECT p.tenant_id, p.id, 'proposal-' || p.id || '.pdf', 1024, '/files/proposal-' || p.id || '.pdf'
+        FROM proposals p
+        WHERE p.tenant_id IN (SELECT id FROM tenants WHERE name LIKE '""" + TENANT_PREFIX + """%')""",
+    f"""INSERT INTO campaigns (tenant_id, name)
+        SELECT t.id, 'Campaign ' || g
+        FROM tenants t CROSS JOIN generate_series(1, 50) g
+        WHERE t.name LIKE '{TENANT_PREFIX}%'""",
+    """WITH numbered AS (
+            SELECT id, tenant_id, row_number() OVER (PARTITION BY tenant_id ORDER BY id) - 1 AS n
+            FROM campaigns
+            WHERE tenant_id IN (SELECT id FROM tenants WHERE name LIKE '""" + TENANT_PREFIX + """%')
+        )
+        INSERT INTO campaign_notes (tenant_id, campaign_id, opportunity_id, note, follow_up_at, completed, created_at)
+        SELECT o.tenant_id, numbered.id, o.id, 'Note',
+               CASE WHEN o.id % 10 = 0 THEN now() - interval '1 day' END, o.id % 10 <> 0, o.created_at
+        FROM opportunities o
+        JOIN numbered ON numbered.tenant_id = o.tenant_id AND numbered.n = o.id % 50""",
+]
+
+ANALYZED_TABLES = [
+    "tenants", "companies", "contacts", "linkedin_posts", "opportunities",
+    "proposals", "proposal_files", "campaigns", "campaign_notes"
+]
+
+class _EmptyResult:
+    def scalars(self):
+        return self
+
+    def first(self):
+        return None
+
+    def all(self):
+        return []
+
+class _StatementRecorder:
+    """Stands in for AsyncSession so a query method's statement can be captured without running it."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(statement)
+        return _EmptyResult()
+
+    async def scalar(self, statement, *args, **kwargs):
+        self.statements.append(statement)
+        return 0
+
+def capture_sql(queries_class, method_name, *args, **kwargs) -> str:
+    """Render the SQL a query method would send, with parameters inlined."""
+    recorder = _StatementRecorder()
+    asyncio.run(getattr(queries_class(recorder), method_name)(*args, **kwargs))
+    statement = recorder.statements[-1]
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+def plan_nodes(plan: dict):
+    """Flatten an EXPLAIN (FORMAT JSON) plan tree."""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+def build_cases(conn, tenant_id: int):
+    """Pair each hot access path with the indexes allowed to serve it."""
+    sample = conn.execute(text("""
+        SELECT
+            (SELECT post_url FROM linkedin_posts WHERE tenant_id = :t LIMIT 1) AS post_url,
+            (SELECT email FROM contacts WHERE tenant_id = :t LIMIT 1) AS email,
+            (SELECT company_id FROM contacts WHERE tenant_id = :t LIMIT 1) AS company_id,
+            (SELECT id FROM campaigns WHERE tenant_id = :t LIMIT 1) AS campaign_id,
+            (SELECT id FROM opportunities WHERE tenant_id = :t LIMIT 1) AS opportunity_id,
+            (SELECT filename FROM proposal_files WHERE tenant_id = :t LIMIT 1) AS filename,
+            (SELECT created_at FROM opportunities WHERE tenant_id = :t ORDER BY created_at DESC OFFSET :half LIMIT 1) AS midpoint
+    """), {"t": tenant_id, "half": ROWS_PER_TENANT // 2}).one()
+    # Halfway down the feed, so a page must start from the cursor rather than the top
+    deep_cursor = (sample.midpoint, OPPORTUNITY, sample.opportunity_id)
+
+    return [
+        ("opportunities by tenant", "opportunities",
+         capture_sql(OpportunityQueries, "get_opportunities_by_tenant", tenant_id),
+         {"ix_opportunities_tenant_id_created_at"}),
+        ("opportunities by tenant and status", "opportunities",
+         capture_sql(OpportunityQueries, "get_opportunities_by_tenant", tenant_id, status=OpportunityStatus.WON),
+         {"ix_opportunities_tenant_id_status", "ix_opportunities_tenant_id_created_at"}),
+        ("proposals by tenant", "proposals",
+         capture_sql(ProposalQueries, "get_proposals_by_tenant", tenant_id),
+         {"ix_proposals_tenant_id_created_at"}),
+        ("proposal count by status", "proposals",
+         capture_sql(ProposalQueries, "count_proposals_by_status", tenant_id, ProposalStatus.SENT),
+         {"ix_proposals_tenant_id_status"}),
+        ("posts by tenant", "linkedin_posts",
+         capture_sql(LinkedInQueries, "get_posts_by_tenant", tenant_id),
+         {"ix_linkedin_posts_tenant_id_created_at"}),
+        ("post by url", "linkedin_posts",
+         capture_sql(LinkedInQueries, "get_post_by_url", sample.post_url, tenant_id),
+         {"uq_tenant_post_url"}),
+        ("contact by email", "contacts",
+         capture_sql(ContactQueries, "get_contact_by_email", sample.email, tenant_id),
+         {"ix_contacts_tenant_id_email"}),
+        ("contacts by company", "contacts",
+         capture_sql(ContactQueries, "get_contacts_by_company", sample.company_id, tenant_id),
+         {"ix_contacts_tenant_id_company_id"}),
+        ("notes by campaign", "campaign_notes",
+         capture_sql(CampaignQueries, "get_campaign_notes", sample.campaign_id, tenant_id),
+         {"ix_campaign_notes_tenant_id_campaign_id_created_at"}),
+        ("notes by opportunity", "campaign_notes",
+         capture_sql(CampaignQueries, "get_notes_by_opportunity", sample.opportunity_id, tenant_id),
+         {"ix_campaign_notes_tenant_id_opportunity_id_created_at"}),
+        ("overdue follow-ups", "campaign_notes",
+         capture_sql(CampaignQueries, "get_overdue_follow_ups", tenant_id),
+         {"ix_campaign_notes_tenant_id_follow_up_at"}),
+        ("file by filename", "proposal_files",
+         capture_sql(FileQueries, "get_proposal_file_by_filename", sample.filename, tenant_id),
+         {"ix_proposal_files_tenant_id_filename"}),
+        ("proposal content search", "proposals",
+         capture_sql(ProposalQueries, "search_proposals_by_content", tenant_id, RARE_SEARCH_TERM),
+         {"ix_proposals_search_vector"}),
+        ("unified search: opportunities", "opportunities",
+         capture_sql(SearchQueries, "search_ranked", tenant_id, RARE_SEARCH_TERM, ["opportunity"]),
+         {"ix_opportunities_search_vector"}),
+        ("unified search: proposals", "proposals",
+         capture_sql(SearchQueries, "search_ranked", tenant_id, RARE_SEARCH_TERM, ["proposal"]),
+         {"ix_proposals_search_vector"}),
+        ("activity feed: opportunities", "opportunities",
+         capture_sql(DashboardQueries, "get_activity_page", tenant_id, 21, deep_cursor),
+         {"ix_opportunities_tenant_id_created_at"}),
+        ("activity feed: notes", "campaign_notes",
+         capture_sql(DashboardQueries, "get_activity_page", tenant_id, 21, deep_cursor),
+         {"ix_campaign_notes_tenant_id_created_at"}),
+        ("unified search: posts", "linkedin_posts",
+         capture_sql(SearchQueries, "search_ranked", tenant_id, RARE_SEARCH_TERM, ["linkedin_post"]),
+         {"ix_linkedin_posts_search_vector"}),
+    ]
+
+def test_query_indexes() -> bool:
+    """Seed, EXPLAIN every hot path, report, and roll back."""
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            print(f"🌱 Seeding {TENANTS} tenants x {ROWS_PER_TENANT} rows...")
+            for statement in SEED_STATEMENTS:
+                conn.execute(text(statement))
+            for table in ANALYZED_TABLES:
+                conn.execute(text(f"ANALYZE {table}"))
+
+            tenant_id = conn.execute(text(
+                "SELECT id FROM tenants WHERE name = :name"
+            ), {"name": f"{TENANT_PREFIX}{TENANTS // 2}"}).scalar_one()
+
+            failures = 0
+            for label, table, sql, expected_indexes in build_cases(conn, tenant_id):
+                plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                nodes = list(plan_nodes(plan[0]["Plan"]))
+
+                used_indexes = {node["Index Name"] for node in nodes if "Index Name" in node}
+                seq_scanned = any(
+                    node["Node Type"] == "Seq Scan" and node.get("Relation Name") == table
+                    for node in nodes
+                )
+
+                if used_indexes & expected_indexes and not seq_scanned:
+                    print(f"✅ {label}: {', '.join(sorted(used_indexes))}")
+                else:
+                    failures += 1
+                    scans = ", ".join(node["Node Type"] for node in nodes)
+                    print(f"❌ {label}: expected one of {sorted(expected_indexes)}, plan used [{scans}] {sorted(used_indexes)}")
+
+            return failures == 0
+        finally:
+            transaction.rollback()
+
+if __name__ == "__main__":
+    print("🧪 Checking query plans against tenant indexes...")
+    passed = test_query_indexes()
+    print("\n🎉 All hot paths use their indexes" if passed else "\n❌ Some queries are not index-backed")
+    sys.exit(0 if passed else 1)
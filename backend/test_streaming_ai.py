@@ -69,10 +69,8 @@ def test_streaming_analysis():
                                 print(f"🏁 {message}")
                             elif status == 'analyzing':
                                 print(f"🤖 {message}")
-                            elif status == 'processing':
-                                print(f"⚙️  {message}")
-                            elif status == 'extracting_fields':
-                                print(f"📊 {message}")
+                            elif status == 'field_extracted':
+                                print(f"📊 {data.get('field')}: {data.get('value')}")
                             elif status == 'company_extracted':
                                 print(f"🏢 {message}")
                             elif status == 'contact_extracted':
@@ -0,0 +1,137 @@
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+from typing import Optional, Tuple
+from urllib.parse import quote
+import anyio
+import re
+
+ZERO_COPY_EXTENSION = "http.response.zerocopysend"
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """The inclusive (start, end) byte range a Range header asks for, or None to send the whole file.
+
+    Only single ranges are served; anything else is ignored, which HTTP allows.
+    Raises RangeNotSatisfiable for a well-formed range that lies outside the file.
+    """
+    match = _RANGE_PATTERN.match((header or "").strip())
+    if not match or match.groups() == ("", "") or size == 0:
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise RangeNotSatisfiable()
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    return start, end
+
+def etag_matches(header: Optional[str], etag: str, weak: bool) -> bool:
+    """Whether an If-None-Match (weak comparison) or If-Range (strong) header names `etag`."""
+    if not header:
+        return False
+    if weak and header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            if not weak:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+class RangeFileResponse(Response):
+    """Sends a file, or the single byte range asked for, answering conditional requests with 304.
+
+    The body goes out through the ASGI zero-copy send extension when the server offers it,
+    and is read in chunks in a worker thread otherwise.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        etag: str,
+        request_headers: Headers,
+        media_type: str,
+        filename: str,
+        cache_control: str = "private, no-cache"
+    ):
+        self.path = path
+        self.background = None
+        self.media_type = media_type
+        self.offset, self.length = 0, size
+        headers = {
+            "etag": etag,
+            "accept-ranges": "bytes",
+            "cache-control": cache_control,
+            "content-disposition": f"attachment; filename*=utf-8''{quote(filename)}"
+        }
+
+        if etag_matches(request_headers.get("if-none-match"), etag, weak=True):
+            self.status_code, self.length = 304, 0
+        else:
+            self.status_code = 200
+            if_range = request_headers.get("if-range")
+            # A range only applies to the version the client already has part of
+            if if_range is None or etag_matches(if_range, etag, weak=False):
+                try:
+                    byte_range = parse_range(request_headers.get("range"), size)
+                except RangeNotSatisfiable:
+                    self.status_code, self.length = 416, 0
+                    headers["content-range"] = f"bytes */{size}"
+                else:
+                    if byte_range is not None:
+                        start, end = byte_range
+                        self.status_code = 206
+                        self.offset, self.length = start, end - start + 1
+                        headers["content-range"] = f"bytes {start}-{end}/{size}"
+            headers["content-length"] = str(self.length)
+
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope["method"] == "HEAD" or self.length == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            if ZERO_COPY_EXTENSION in scope.get("extensions", {}):
+                await send({
+                    "type": ZERO_COPY_EXTENSION,
+                    "file": file.wrapped,
+                    "offset": self.offset,
+                    "count": self.length,
+                    "more_body": False
+                })
+                return
+
+            await file.seek(self.offset)
+            remaining = self.length
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                # The file shrank underneath us; end the body rather than leave the client waiting
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
@@ -0,0 +1,187 @@
+from jose import jwk
+from jose.backends.base import Key
+from typing import Any, Dict, Optional
+import asyncio
+import httpx
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Bound on remembered unknown kids so a flood of made-up ones cannot grow memory
+MAX_UNKNOWN_KIDS = 1024
+
+class JWKSManager:
+    """Signing keys from a JWKS endpoint, indexed by kid and kept fresh across key rotations.
+
+    Keys are refetched in the background once they are `ttl_seconds` old. A token signed with
+    an unknown kid triggers at most one refetch per `min_refetch_seconds`, shared by every caller,
+    and kids still missing afterwards are remembered for `unknown_kid_ttl_seconds`. When a
+    refetch fails the keys already held keep being served.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        algorithm: str,
+        ttl_seconds: float,
+        unknown_kid_ttl_seconds: float,
+        min_refetch_seconds: float,
+        timeout_seconds: float = 5.0
+    ):
+        self.jwks_url = jwks_url
+        self.algorithm = algorithm
+        self.ttl_seconds = ttl_seconds
+        self.unknown_kid_ttl_seconds = unknown_kid_ttl_seconds
+        self.min_refetch_seconds = min_refetch_seconds
+        self.timeout_seconds = timeout_seconds
+        self._keys: Dict[str, Key] = {}
+        self._fetched_at: Optional[float] = None
+        self._last_attempt_at: Optional[float] = None
+        self._unknown_kids: Dict[str, float] = {}
+        self._fetch_task: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self.fetches = 0
+        self.failures = 0
+
+    async def get_key(self, kid: str) -> Optional[Key]:
+        """The verification key for `kid`, or None when the endpoint does not publish it.
+
+        Raises when no keys could be fetched at all.
+        """
+        key = self._keys.get(kid)
+        if key is not None:
+            if self._is_stale():
+                self._refresh_soon()
+            return key
+
+        if not self._keys:
+            # Nothing fetched yet; a failed fetch is retried at most once per min_refetch_seconds
+            if self._fetch_task is None and not self._can_refetch():
+                raise RuntimeError(f"JWKS from {self.jwks_url} is unavailable")
+            await self._fetch()
+        elif self._unknown_kids.get(kid, 0) > time.monotonic():
+            return None
+        elif self._fetch_task is not None or self._can_refetch():
+            # A kid we have not seen may be a rotated-in key; refetch unless that was just done
+            try:
+                await self._fetch()
+            except Exception:
+                pass
+
+        key = self._keys.get(kid)
+        if key is None:
+            self._remember_unknown(kid)
+        return key
+
+    def has_key(self, kid: str) -> bool:
+        """Whether `kid` is among the keys currently published, without fetching."""
+        return kid in self._keys
+
+    def start(self) -> None:
+        """Fetch the keys now and keep them refreshed in the background."""
+        self._refresh_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._fetch()
+                delay = self.ttl_seconds
+            except Exception:
+                delay = self.min_refetch_seconds
+            await asyncio.sleep(delay)
+
+    def _is_stale(self) -> bool:
+        return self._fetched_at is None or time.monotonic() - self._fetched_at >= self.ttl_seconds
+
+    def _can_refetch(self) -> bool:
+        return self._last_attempt_at is None or time.monotonic() - self._last_attempt_at >= self.min_refetch_seconds
+
+    def _refresh_soon(self) -> None:
+        """Refetch without making the caller wait; used when no background loop is keeping keys fresh."""
+        if self._fetch_task is None and self._can_refetch():
+            self._start_fetch()
+
+    def _remember_unknown(self, kid: str) -> None:
+        now = time.monotonic()
+        if len(self._unknown_kids) >= MAX_UNKNOWN_KIDS:
+            self._unknown_kids = {k: expiry for k, expiry in self._unknown_kids.items() if expiry > now}
+            if len(self._unknown_kids) >= MAX_UNKNOWN_KIDS:
+                # Entries share one TTL, so the first inserted expires first
+                del self._unknown_kids[next(iter(self._unknown_kids))]
+        self._unknown_kids[kid] = now + self.unknown_kid_ttl_seconds
+
+    def _start_fetch(self) -> asyncio.Task:
+        self._fetch_task = asyncio.create_task(self._download())
+        self._fetch_task.add_done_callback(self._fetch_done)
+        return self._fetch_task
+
+    def _fetch_done(self, task: asyncio.Task) -> None:
+        self._fetch_task = None
+        if not task.cancelled():
+            # Mark the error as retrieved even if nobody awaited this fetch
+            task.exception()
+
+    async def _fetch(self) -> None:
+        """Fetch the key set, joining the fetch already in flight if there is one."""
+        task = self._fetch_task or self._start_fetch()
+        # Shielded so one request going away does not cancel the fetch for everyone else
+        await asyncio.shield(task)
+
+    async def _download(self) -> None:
+        self._last_attempt_at = time.monotonic()
+        self.fetches += 1
+        try:
+            if self._http is None:
+                self._http = httpx.AsyncClient(timeout=self.timeout_seconds)
+            response = await self._http.get(self.jwks_url)
+            response.raise_for_status()
+            keys = self._parse(response.json())
+        except Exception as e:
+            self.failures += 1
+            logger.warning(f"Failed to fetch JWKS from {self.jwks_url} ({e}); serving {len(self._keys)} cached keys")
+            raise
+
+        added = keys.keys() - self._keys.keys()
+        if added and self._keys:
+            logger.info(f"JWKS rotated: new signing keys {sorted(added)}")
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+        for kid in added:
+            self._unknown_kids.pop(kid, None)
+
+    def _parse(self, jwks: Dict[str, Any]) -> Dict[str, Key]:
+        keys = {}
+        for key_data in jwks.get("keys", []):
+            kid = key_data.get("kid")
+            if not kid or key_data.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[kid] = jwk.construct(key_data, key_data.get("alg") or self.algorithm)
+            except Exception as e:
+                logger.warning(f"Skipping unusable JWKS key {kid}: {e}")
+        if not keys:
+            raise ValueError("JWKS contains no usable signing keys")
+        return keys
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "keys": len(self._keys),
+            "age_seconds": round(time.monotonic() - self._fetched_at, 1) if self._fetched_at is not None else None,
+            "unknown_kids": len(self._unknown_kids),
+            "fetches": self.fetches,
+            "failures": self.failures
+        }
@@ -0,0 +1,26 @@
+from collections import deque
+from typing import Dict, Optional, Sequence
+
+class LatencyWindow:
+    """The most recent latency samples, summarized as nearest-rank percentiles in milliseconds."""
+
+    def __init__(self, size: int):
+        self.samples = deque(maxlen=size)
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def percentiles(self, fractions: Sequence[float] = (0.50, 0.95), digits: int = 1) -> Dict[str, Optional[float]]:
+        """e.g. {"p50_ms": ..., "p95_ms": ...}; the values are None before any sample is recorded."""
+        ordered = sorted(self.samples)
+        summary = {}
+        for fraction in fractions:
+            key = f"p{round(fraction * 100)}_ms"
+            if not ordered:
+                summary[key] = None
+                continue
+            summary[key] = round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1000, digits)
+        return summary
@@ -0,0 +1,45 @@
+from utils.latency_window import LatencyWindow
+from typing import Dict, Any, Optional
+import asyncio
+import statistics
+
+class LoopLagMonitor:
+    """Measures event-loop lag: how much later than scheduled a periodic wakeup runs."""
+
+    def __init__(self, interval: float, samples: int = 600):
+        self.interval = interval
+        self.lags = LatencyWindow(samples)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lags.record(max(0.0, loop.time() - scheduled))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Lag percentiles over the recent sampling window."""
+        lags = self.lags.samples
+        if not lags:
+            return {"samples": 0, "window_seconds": 0}
+
+        return {
+            "samples": len(lags),
+            "window_seconds": round(len(lags) * self.interval, 1),
+            "mean_ms": round(statistics.fmean(lags) * 1000, 2),
+            **self.lags.percentiles((0.50, 0.99), digits=2),
+            "max_ms": round(max(lags) * 1000, 2)
+        }
@@ -0,0 +1,161 @@
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError, APITimeoutError, RateLimitError
+from database import settings
+from utils.response_helpers import service_unavailable_error
+from typing import Optional
+import asyncio
+import httpx
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+class CircuitBreaker:
+    """Fails calls fast after consecutive upstream failures, then lets one probe through per reset period."""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def retry_after(self) -> int:
+        """Seconds until the breaker will let a probe call through."""
+        if self.opened_at is None:
+            return 0
+        return max(1, int(self.reset_seconds - (time.monotonic() - self.opened_at) + 0.999))
+
+    def allow_call(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """Let another caller probe when this probe ended without an answer either way."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            if self.opened_at is None or self._probing:
+                logger.warning(f"OpenAI circuit opened after {self.failures} consecutive failures")
+            self.opened_at = time.monotonic()
+            self._probing = False
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, (APIConnectionError, APITimeoutError, RateLimitError)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code >= 500
+
+def _retry_after_header(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+class OpenAIClient:
+    """Process-wide OpenAI client: pooled HTTP/2 connections, per-call deadlines, retries and a circuit breaker."""
+
+    def __init__(self):
+        self.http_client = httpx.AsyncClient(
+            http2=settings.openai_http2,
+            limits=httpx.Limits(
+                max_connections=settings.openai_max_connections,
+                max_keepalive_connections=settings.openai_max_keepalive_connections
+            ),
+            timeout=httpx.Timeout(settings.openai_timeout_seconds, connect=10.0)
+        )
+        # Retries are done here so they share the deadline and feed the breaker
+        self.client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            base_url=settings.openai_base_url or None,
+            http_client=self.http_client,
+            max_retries=0
+        )
+        self.breaker = CircuitBreaker(settings.openai_circuit_failure_threshold, settings.openai_circuit_reset_seconds)
+
+    async def create_chat_completion(self, deadline_seconds: Optional[float] = None, **kwargs):
+        """Create a chat completion, retrying 429/5xx/network errors with jittered backoff until the deadline.
+
+        For streams the deadline covers opening the stream, not reading it.
+        """
+        deadline = time.monotonic() + (deadline_seconds or settings.openai_deadline_seconds)
+        attempt = 0
+
+        while True:
+            if not self.breaker.allow_call():
+                raise service_unavailable_error("AI provider is temporarily unavailable", self.breaker.retry_after())
+
+            remaining = deadline - time.monotonic()
+            try:
+                response = await self.client.chat.completions.create(
+                    **kwargs,
+                    timeout=min(settings.openai_timeout_seconds, max(remaining, 1.0))
+                )
+            except asyncio.CancelledError:
+                self.breaker.release_probe()
+                raise
+            except Exception as e:
+                if not _is_retryable(e):
+                    if isinstance(e, APIStatusError):
+                        # OpenAI answered; a bad request or auth error says nothing about its health
+                        self.breaker.record_success()
+                    else:
+                        self.breaker.release_probe()
+                    raise
+                if isinstance(e, RateLimitError):
+                    # A 429 shows OpenAI is reachable; it also ends a half-open probe
+                    self.breaker.record_success()
+                else:
+                    self.breaker.record_failure()
+
+                attempt += 1
+                delay = min(settings.openai_retry_base_seconds * 2 ** (attempt - 1), settings.openai_retry_max_seconds)
+                delay = max(random.uniform(0, delay), _retry_after_header(e) or 0)
+                if attempt > settings.openai_max_retries or time.monotonic() + delay >= deadline:
+                    raise
+                logger.warning(f"OpenAI call failed ({e.__class__.__name__}), retry {attempt} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            self.breaker.record_success()
+            return response
+
+    async def close(self) -> None:
+        await self.http_client.aclose()
+
+_client: Optional[OpenAIClient] = None
+
+def get_openai_client() -> OpenAIClient:
+    """Get the process-wide client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = OpenAIClient()
+    return _client
+
+async def close_openai_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
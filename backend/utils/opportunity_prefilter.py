@@ -0,0 +1,37 @@
+import re
+from typing import List, NamedTuple
+
+class PrefilterScore(NamedTuple):
+    score: float
+    signals: List[str]
+
+# (signal name, weight, pattern). Positive signals are phrasings of someone asking for outside help;
+# negative ones are the announcement and job-seeking posts that make up most of a scraped feed.
+SIGNALS = [
+    ("request", 1.0, r"\b(looking (?:for|to (?:hire|outsource))|seeking|searching for|in search of|need(?:s|ed)?|want to hire|hiring"
+                     r"|(?:any|some)(?:one|body) (?:know|have|recommend)|can (?:any|some)(?:one|body) recommend"
+                     r"|recommendations? (?:for|welcome)|referrals?|who (?:do|would) you recommend|quick ask)\b"),
+    ("provider", 1.0, r"\b(developers?|engineers?|designers?|agency|agencies|consultants?|consulting|freelancers?|contractors?"
+                      r"|partners?|vendors?|experts?|specialists?|marketers?|copywriters?|writers?|illustrators?|studios?"
+                      r"|firms?|dev shop|fractional|assistants?|analysts?)\b"),
+    ("engagement", 1.0, r"\b(freelance|contract|project|gig|retainer|rfp|rfq|proposals?|quotes?|budget|rates?|hourly|part[- ]time"
+                        r"|short[- ]term|fixed[- ]price|engagement|outsourc\w*|mvp|audit|implementation)\b"),
+    ("call_to_action", 0.75, r"\b(dm me|message me|reach out|get in touch|send (?:me )?(?:your|a) (?:portfolio|quote|rate|proposal)"
+                             r"|comment below|tag someone|please share|share proposals)\b"),
+    ("money", 0.5, r"(?:[$€£]\s?\d|\b\d+\s?k\b)"),
+    ("urgency", 0.5, r"\b(asap|urgent(?:ly)?|immediately|this week|next week|next month|deadline)\b"),
+    ("job_seeker", -2.5, r"(#?open ?to ?work|\b(?:my|a) (?:next|new) (?:role|position|job|chapter)\b"
+                         r"|\b(?:looking for|seeking) (?:a )?new (?:role|position|job|opportunities)\b"
+                         r"|\bi(?:'m| am) (?:looking|seeking) (?:for )?(?:a )?new (?:role|position|job|opportunit\w*)\b)"),
+    ("announcement", -1.5, r"\b(excited to (?:announce|share|be)|thrilled to|happy to (?:announce|share)|proud to|pleased to"
+                           r"|delighted to|humbled|honou?red|congrat\w*|celebrating)\b"),
+    ("self_promotion", -1.5, r"\b(we help|our (?:agency|consulting firm|firm) (?:helps|just)|book a call|to see our results"
+                             r"|learn (?:more|how we))\b"),
+]
+
+_COMPILED = [(name, weight, re.compile(pattern, re.IGNORECASE)) for name, weight, pattern in SIGNALS]
+
+def score_post(content: str) -> PrefilterScore:
+    """Score how much a post reads like a request for outside work; each signal counts once."""
+    matched = [(name, weight) for name, weight, pattern in _COMPILED if pattern.search(content or "")]
+    return PrefilterScore(sum(weight for _, weight in matched), [name for name, _ in matched])
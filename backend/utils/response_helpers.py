@@ -26,6 +26,29 @@ def validation_error(message: str) -> HTTPException:
         detail=message
     )
 
+def payload_too_large_error(message: str) -> HTTPException:
+    """Generate a standardized 413 error for request bodies over a size limit."""
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=message
+    )
+
+def service_unavailable_error(message: str, retry_after: int) -> HTTPException:
+    """Generate a standardized 503 error telling the client when to retry."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=message,
+        headers={"Retry-After": str(retry_after)}
+    )
+
+def rate_limit_error(message: str, retry_after: int) -> HTTPException:
+    """Generate a standardized 429 error telling the client when to retry."""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=message,
+        headers={"Retry-After": str(retry_after)}
+    )
+
 def success_message(action: str, entity: str) -> dict:
     """Generate a standardized success message."""
     return {"message": f"{entity} {action} successfully"}
@@ -0,0 +1,121 @@
+from contextlib import asynccontextmanager
+from sqlalchemy import exc, select, func
+from database import lock_engine
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# How often a worker waiting on another worker's advisory lock re-checks it
+LOCK_POLL_SECONDS = 0.2
+
+class Flight:
+    """One in-flight call: the events it has published so far and its eventual result."""
+
+    def __init__(self):
+        self._events: List[Any] = []
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.followers = 0
+
+    def publish(self, event: Any) -> None:
+        self._events.append(event)
+        self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def events(self):
+        """Replay every event published so far, then follow new ones until the call finishes."""
+        index = 0
+        while True:
+            changed = self._changed
+            while index < len(self._events):
+                yield self._events[index]
+                index += 1
+            if self._task.done():
+                return
+            await changed.wait()
+
+    async def result(self) -> Any:
+        # Shielded so one caller going away does not cancel the call for everyone else
+        return await asyncio.shield(self._task)
+
+class SingleFlight:
+    """Deduplicates concurrent calls: callers joining with the key of a call in flight share that call."""
+
+    def __init__(self):
+        self._flights: Dict[str, Flight] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    def join(self, key: Optional[str], start: Callable[[Flight], Awaitable[Any]]) -> Tuple[Flight, bool]:
+        """Attach to the call in flight for `key`, or start one; returns the flight and whether this caller leads it.
+
+        A None key never shares.
+        """
+        flight = self._flights.get(key) if key else None
+        if flight is not None:
+            flight.followers += 1
+            self.followers += 1
+            return flight, False
+
+        flight = Flight()
+        flight._task = asyncio.create_task(start(flight))
+        flight._task.add_done_callback(lambda task: self._finish(key, flight))
+        if key:
+            self._flights[key] = flight
+        self.leaders += 1
+        return flight, True
+
+    def _finish(self, key: Optional[str], flight: Flight) -> None:
+        if key and self._flights.get(key) is flight:
+            del self._flights[key]
+        flight._notify()
+        if not flight._task.cancelled():
+            # Mark the error as retrieved even if every caller has gone away
+            flight._task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": len(self._flights), "leaders": self.leaders, "followers": self.followers}
+
+@asynccontextmanager
+async def advisory_lock(name: str, wait_seconds: float):
+    """Hold a Postgres advisory lock named `name` so only one worker runs the guarded call at a time.
+
+    Yields whether another worker held the lock first. After `wait_seconds`, or when every
+    lock connection is in use, the call goes ahead unlocked rather than failing.
+    """
+    key = int.from_bytes(hashlib.sha256(name.encode()).digest()[:8], "big", signed=True)
+    deadline = time.monotonic() + wait_seconds
+    waited = False
+
+    # A session-level lock lives on its connection, so the connection is held for the whole call
+    try:
+        conn = await lock_engine.connect()
+    except exc.TimeoutError:
+        logger.warning(f"No connection free for advisory lock {name}; running unlocked")
+        yield False
+        return
+
+    try:
+        while True:
+            acquired = (await conn.execute(select(func.pg_try_advisory_lock(key)))).scalar()
+            if acquired or time.monotonic() >= deadline:
+                break
+            waited = True
+            await asyncio.sleep(LOCK_POLL_SECONDS)
+
+        if not acquired:
+            logger.warning(f"Gave up waiting for advisory lock {name} after {wait_seconds}s")
+        try:
+            yield waited
+        finally:
+            if acquired:
+                await conn.execute(select(func.pg_advisory_unlock(key)))
+    finally:
+        await conn.close()
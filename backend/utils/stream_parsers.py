@@ -0,0 +1,246 @@
+import json
+import zlib
+from typing import Any, Iterator, List, Optional, Tuple
+
+_WHITESPACE = " \t\r\n"
+
+class IncrementalJSONParser:
+    """Parses a JSON object as it arrives in chunks, reporting object members as soon as they close.
+
+    Each call to feed() returns (path, value) pairs for members nested at most
+    max_depth keys deep, e.g. ("company_suggestion",) or ("extracted_fields", "title").
+    Array elements are reported as part of their enclosing array.
+    """
+
+    def __init__(self, max_depth: int = 2):
+        self.max_depth = max_depth
+        self.text = ""
+        self.done = False
+        self._pos = 0
+        self._root_start: Optional[int] = None
+        self._root_end: Optional[int] = None
+        self._stack: List[dict] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._scalar_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Tuple[Tuple[Any, ...], Any]]:
+        """Consume the next chunk and return any members completed by it."""
+        self.text += chunk
+        completed = []
+        text = self.text
+
+        while self._pos < len(text) and not self.done:
+            i = self._pos
+            char = text[i]
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    self._close_string(i, completed)
+                continue
+
+            if self._root_start is None:
+                # Skip anything before the document, such as a markdown fence
+                if char == "{":
+                    self._root_start = i
+                    self._stack.append({"kind": "{", "start": i, "path": (), "key": None, "index": 0, "expecting_key": True})
+                continue
+
+            if self._scalar_start is not None and (char in _WHITESPACE or char in ",}]"):
+                self._complete_value(self._scalar_start, i, completed)
+                self._scalar_start = None
+
+            frame = self._stack[-1]
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char in "{[":
+                self._stack.append({
+                    "kind": char,
+                    "start": i,
+                    "path": frame["path"] + (self._member_name(frame),),
+                    "key": None,
+                    "index": 0,
+                    "expecting_key": char == "{"
+                })
+            elif char in "}]":
+                closed = self._stack.pop()
+                if not self._stack:
+                    self._root_end = i + 1
+                    self.done = True
+                else:
+                    self._complete_value(closed["start"], i + 1, completed)
+            elif char == ",":
+                if frame["kind"] == "{":
+                    frame["expecting_key"] = True
+                else:
+                    frame["index"] += 1
+            elif char not in _WHITESPACE and char != ":" and self._scalar_start is None:
+                self._scalar_start = i
+
+        return completed
+
+    def result(self) -> Any:
+        """Decode the complete document; raises json.JSONDecodeError if it never closed."""
+        if not self.done:
+            return json.loads(self.text)
+        return json.loads(self.text[self._root_start:self._root_end])
+
+    def _close_string(self, end: int, completed: list) -> None:
+        frame = self._stack[-1]
+        if frame["kind"] == "{" and frame["expecting_key"]:
+            frame["key"] = json.loads(self.text[self._string_start:end + 1])
+            frame["expecting_key"] = False
+        else:
+            self._complete_value(self._string_start, end + 1, completed)
+
+    def _complete_value(self, start: int, end: int, completed: list) -> None:
+        frame = self._stack[-1]
+        if frame["kind"] != "{":
+            return
+
+        path = frame["path"] + (frame["key"],)
+        if len(path) > self.max_depth:
+            return
+
+        try:
+            completed.append((path, json.loads(self.text[start:end])))
+        except json.JSONDecodeError:
+            # Malformed member; the final result() call reports the error
+            pass
+
+    def _member_name(self, frame: dict) -> Any:
+        return frame["key"] if frame["kind"] == "{" else frame["index"]
+
+class IncrementalSectionParser:
+    """Splits streamed markdown into heading-delimited sections, closing each when the next heading arrives.
+
+    Text before the first heading is ignored, matching the non-streaming section parser.
+    """
+
+    def __init__(self):
+        self.sections: List[dict] = []
+        self._pending_line = ""
+        self._title: Optional[str] = None
+        self._lines: List[str] = []
+
+    def feed(self, chunk: str) -> List[dict]:
+        """Consume the next chunk and return sections closed by it."""
+        closed = []
+        lines = (self._pending_line + chunk).split("\n")
+        self._pending_line = lines.pop()
+
+        for line in lines:
+            section = self._consume_line(line)
+            if section:
+                closed.append(section)
+
+        return closed
+
+    def finish(self) -> List[dict]:
+        """Flush the trailing line and the last open section."""
+        closed = []
+        section = self._consume_line(self._pending_line)
+        self._pending_line = ""
+        if section:
+            closed.append(section)
+
+        if self._title is not None:
+            closed.append(self._close_section())
+            self._title = None
+
+        return closed
+
+    def _consume_line(self, line: str) -> Optional[dict]:
+        if not line.strip().startswith("#"):
+            self._lines.append(line)
+            return None
+
+        section = self._close_section() if self._title is not None else None
+        self._title = line.strip().lstrip("#").strip()
+        self._lines = []
+        return section
+
+    def _close_section(self) -> dict:
+        section = {"title": self._title, "content": "\n".join(self._lines).strip()}
+        self.sections.append(section)
+        return section
+
+
+class NDJSONLineSplitter:
+    """Splits an uploaded byte stream, optionally gzip-compressed, into numbered NDJSON lines.
+
+    Memory is bounded by max_line_bytes plus one decompressed slice: gzip input is
+    inflated DECOMPRESS_SLICE bytes at a time, and a line longer than max_line_bytes
+    is dropped as it arrives and reported as (line_number, None). Blank lines are skipped
+    but still counted.
+    """
+
+    DECOMPRESS_SLICE = 64 * 1024
+
+    def __init__(self, gzip: bool = False, max_line_bytes: int = 1024 * 1024):
+        self.max_line_bytes = max_line_bytes
+        self.line_number = 0
+        self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if gzip else None
+        self._pending = bytearray()
+        self._oversized = False
+
+    def feed(self, chunk: bytes) -> Iterator[Tuple[int, Optional[bytes]]]:
+        """Consume the next chunk of the upload and yield the lines it completes."""
+        if self._decompressor is None:
+            yield from self._split(chunk)
+            return
+
+        data = chunk
+        while data:
+            inflated = self._decompressor.decompress(data, self.DECOMPRESS_SLICE)
+            data = self._decompressor.unconsumed_tail
+            yield from self._split(inflated)
+
+    def finish(self) -> Iterator[Tuple[int, Optional[bytes]]]:
+        """Flush the final line, which may lack a trailing newline."""
+        if self._decompressor is not None:
+            yield from self._split(self._decompressor.flush())
+            if not self._decompressor.eof:
+                raise zlib.error("incomplete gzip stream")
+
+        if self._pending.strip() or self._oversized:
+            self.line_number += 1
+            yield self.line_number, None if self._oversized else bytes(self._pending)
+        self._pending = bytearray()
+        self._oversized = False
+
+    def _split(self, data: bytes) -> Iterator[Tuple[int, Optional[bytes]]]:
+        start = 0
+        while True:
+            end = data.find(b"\n", start)
+            if end == -1:
+                self._append(data[start:])
+                return
+
+            self._append(data[start:end])
+            self.line_number += 1
+            if self._oversized:
+                yield self.line_number, None
+            elif self._pending.strip():
+                yield self.line_number, bytes(self._pending)
+            self._pending = bytearray()
+            self._oversized = False
+            start = end + 1
+
+    def _append(self, data: bytes) -> None:
+        if self._oversized:
+            return
+        if len(self._pending) + len(data) > self.max_line_bytes:
+            self._pending = bytearray()
+            self._oversized = True
+            return
+        self._pending += data
@@ -0,0 +1,53 @@
+from functools import lru_cache
+from typing import Dict, List
+import logging
+import math
+
+try:
+    import tiktoken
+except ImportError:
+    # Listed in requirements.txt; without it counts fall back to the characters-per-token rule of thumb
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Roughly four characters per token, as for English text
+CHARS_PER_TOKEN = 4
+
+# Chat formatting overhead per message and per reply, as documented for the GPT-4 family
+TOKENS_PER_MESSAGE = 3
+TOKENS_PER_REPLY = 3
+
+@lru_cache(maxsize=16)
+def _encoding(model: str):
+    """The model's tokenizer, or None when tiktoken or its encoding files are unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # tiktoken downloads encoding files on first use, which fails on hosts without internet access
+        logger.warning(f"Tokenizer for {model} unavailable, estimating token counts: {e}")
+        return None
+
+def has_exact_tokenizer(model: str = "gpt-4") -> bool:
+    """Whether counts for `model` come from its real tokenizer rather than the estimate."""
+    return _encoding(model) is not None
+
+def count_tokens(text: str, model: str = "gpt-4") -> int:
+    """Count the tokens `model` would see for `text`; exact with tiktoken installed, estimated otherwise."""
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is None:
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    return len(encoding.encode(text))
+
+def count_message_tokens(messages: List[Dict[str, str]], model: str = "gpt-4") -> int:
+    """Count the prompt tokens of a chat request, including the per-message formatting overhead."""
+    return TOKENS_PER_REPLY + sum(
+        TOKENS_PER_MESSAGE + count_tokens(message.get("content") or "", model) for message in messages
+    )
@@ -25,9 +25,11 @@ const dashboardService = {
     return response.data;
   },
 
-  // Get recent activity timeline
-  getRecentActivity: async (limit = 10) => {
-    const response = await apiClient.get(`/dashboard/recent-activity?limit=${limit}`);
+  // Get one page of the recent activity timeline; pass next_cursor to continue
+  getRecentActivity: async (limit = 10, cursor = null) => {
+    const params = { limit };
+    if (cursor) params.cursor = cursor;
+    const response = await apiClient.get('/dashboard/recent-activity', { params });
     return response.data;
   },
 